@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark hot paths, record a baseline and gate regressions against it."""
+from pathlib import Path
+from datetime import datetime
+import argparse
+import codecs
+import curses
+import html
+import json
+import platform
+import statistics
+import sys
+import time
+
+from unicodes_api import Groups, Pairs
+from unicodes_api.cli import SUBCOMMANDS
+from unicodes_api.escape import Escaper, Unescaper
+from unicodes_api.headless import Burst, Harness, Mouse, Resize
+from unicodes_api.intervals import script_index
+from unicodes_api.parser import Formatter
+
+# pylint: disable=invalid-name
+
+BDIR = Path(__file__).resolve().parent.parent
+BASELINE = BDIR.joinpath("benchmark_baseline.json")
+
+DEFAULT_TOLERANCE = 0.10
+"""Allowed slowdown (fraction of the baseline median) before failing."""
+DTFMT = "%Y-%m-%d %H:%M UTC"
+
+
+def _reset_index():
+    """Drop the class level caches so the index is rebuilt from scratch."""
+    Groups.reset()
+
+
+def _warm_index():
+    """Make sure the index exists."""
+    Groups().make_tokenized()
+
+
+def _warm_groups() -> Groups:
+    """Groups with the index built."""
+    _warm_index()
+    return Groups()
+
+
+def _sample_records():
+    """Fixed slice of records used by the formatting benchmarks."""
+    _warm_index()
+    return sorted(Groups.CACHED.values(), key=lambda x: x["int"])[:20000]
+
+
+def bench_make_tokenized(_):
+    """Cold build of the tokenized index."""
+    Groups().make_tokenized()
+
+
+def bench_pairs(obj: Pairs):
+    """Iterate all left/right pairs."""
+    for _ in obj._pairs():  # pylint: disable=protected-access
+        pass
+
+
+def bench_fmt_normal(records):
+    """Format records as normal text lines."""
+    for dval in records:
+        Formatter.fmt_single_normal(dval)
+
+
+def _sample_text():
+    """Mixed script text, the sample records repeated."""
+    return "".join(i["chr"] for i in _sample_records()) * 10
+
+
+def bench_script_batch(text):
+    """Batch code point -> script lookup of a whole string."""
+    script_index().lookup_codes(text)
+
+
+def bench_escape(text):
+    """Escape mixed script text to python escapes."""
+    Escaper("python").escape(text)
+
+
+def _escaped_text(mode: str):
+    """Sample text (without backslashes) escaped with mode (html / python)."""
+    return Escaper(mode).escape(_sample_text().replace("\\", ""))
+
+
+SURROGATE_SAMPLE = "\\uD83D\\uDE00 \\ud83d\\ude00 \\uDC00 \\uD800 "
+"""Upper and lower case surrogate pairs and lone surrogates."""
+
+
+def _escaped_html():
+    """Sample text escaped to html, unescaper with the index built."""
+    return Unescaper(), _escaped_text("html")
+
+
+def _escaped_python():
+    """Sample text escaped to python, unescaper with the index built."""
+    return Unescaper(), _escaped_text("python") + SURROGATE_SAMPLE * 1000
+
+
+def _escaped_python_novalidate():
+    """Sample text escaped to python, unescaper without validation."""
+    return Unescaper(validate=False), _escaped_python()[1]
+
+
+def bench_unescape(args):
+    """Unescape escaped sample text."""
+    obj, text = args
+    obj.unescape(text)
+
+
+def bench_html_unescape(args):
+    """html.unescape of html escaped sample text, for comparison."""
+    html.unescape(args[1])
+
+
+def bench_codecs_unescape(args):
+    """unicode_escape codec of python escaped sample text, for comparison."""
+    codecs.decode(args[1], "unicode_escape")
+
+
+def bench_range(groups: Groups):
+    """Box drawing range (U+2500-U+257F) from the built index."""
+    for _ in groups.range(0x2500, 0x257F):
+        pass
+
+
+def bench_fmt_json(records):
+    """Format records as json."""
+    json.dumps(records)
+
+
+UI_SCRIPTS = {
+    "explore": (
+        [],
+        [
+            "nnnnpp",
+            Burst("n" * 40),
+            "llllh",
+            Mouse(7, 4),
+            "d",
+            Burst([curses.KEY_NPAGE] * 5),
+            "d",
+            "slatin\n",
+            Resize(30, 90),
+            "nd",
+        ],
+    ),
+    "hackermix": (
+        ["hello world"],
+        ["nnnnpp", Burst("n" * 20), "llljjjkh", Resize(30, 90), "nn"],
+    ),
+}
+"""ui name -> (setup args, scripted session) run headless."""
+
+
+def _ui_harness(name: str) -> Harness:
+    """Headless harness for a curses ui, with the index built."""
+    _warm_index()
+    return Harness(SUBCOMMANDS[name], UI_SCRIPTS[name][0])
+
+
+def bench_ui(harness: Harness):
+    """Run a scripted ui session headless."""
+    return harness.run(*UI_SCRIPTS[harness.ui.NAME][1])
+
+
+BENCHMARKS = {
+    "make_tokenized": {
+        "setup": lambda: None,
+        "before": _reset_index,
+        "run": bench_make_tokenized,
+        "tolerance": 0.15,
+    },
+    "pairs_left_right": {
+        "setup": lambda: Pairs("left", "right"),
+        "before": lambda: None,
+        "run": bench_pairs,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "fmt_single_normal": {
+        "setup": _sample_records,
+        "before": lambda: None,
+        "run": bench_fmt_normal,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "fmt_json": {
+        "setup": _sample_records,
+        "before": lambda: None,
+        "run": bench_fmt_json,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "script_batch": {
+        "setup": _sample_text,
+        "before": lambda: None,
+        "run": bench_script_batch,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "escape_python": {
+        "setup": _sample_text,
+        "before": lambda: None,
+        "run": bench_escape,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "unescape_html": {
+        "setup": _escaped_html,
+        "before": lambda: None,
+        "run": bench_unescape,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "unescape_html_stdlib": {
+        "setup": _escaped_html,
+        "before": lambda: None,
+        "run": bench_html_unescape,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "unescape_python": {
+        "setup": _escaped_python,
+        "before": lambda: None,
+        "run": bench_unescape,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "unescape_python_novalidate": {
+        "setup": _escaped_python_novalidate,
+        "before": lambda: None,
+        "run": bench_unescape,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "unescape_python_codecs": {
+        "setup": _escaped_python,
+        "before": lambda: None,
+        "run": bench_codecs_unescape,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "range_box_drawing": {
+        "setup": _warm_groups,
+        "before": lambda: None,
+        "run": bench_range,
+        "tolerance": DEFAULT_TOLERANCE,
+    },
+    "ui_explore": {
+        "setup": lambda: _ui_harness("explore"),
+        "before": lambda: None,
+        "run": bench_ui,
+        "tolerance": 0.20,
+    },
+    "ui_hackermix": {
+        "setup": lambda: _ui_harness("hackermix"),
+        "before": lambda: None,
+        "run": bench_ui,
+        "tolerance": 0.20,
+    },
+}
+"""name -> setup (once), before (every run, untimed), run (timed) and tolerance."""
+
+
+def _quartiles(values):
+    """Return q1, median, q3 of values."""
+    vals = sorted(values)
+    median = statistics.median(vals)
+    half = len(vals) // 2
+    lower = vals[:half] or vals
+    upper = vals[half + len(vals) % 2 :] or vals
+    return statistics.median(lower), median, statistics.median(upper)
+
+
+def measure(name: str, repeat: int, warmup: int = 1):
+    """Time a single benchmark repeat times and summarize it."""
+    bench = BENCHMARKS[name]
+    state = bench["setup"]()
+    runs = []
+    for idx in range(warmup + repeat):
+        bench["before"]()
+        start = time.perf_counter()
+        bench["run"](state)
+        elapsed = time.perf_counter() - start
+        if idx >= warmup:
+            runs.append(elapsed)
+    q1, median, q3 = _quartiles(runs)
+    return {
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "runs": runs,
+        "tolerance": bench["tolerance"],
+    }
+
+
+def run_all(names, repeat):
+    """Run the selected benchmarks."""
+    results = {}
+    for name in names:
+        sys.stderr.write(f"benchmarking {name} ({repeat} runs)\n")
+        results[name] = measure(name, repeat)
+    return results
+
+
+def _fmt_secs(val):
+    """Human readable seconds."""
+    if val is None:
+        return "-"
+    if val < 1e-3:
+        return f"{val * 1e6:.1f}us"
+    if val < 1:
+        return f"{val * 1e3:.2f}ms"
+    return f"{val:.3f}s"
+
+
+def _table(rows):
+    """Render rows as an aligned text table."""
+    widths = [max(len(str(row[i])) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for idx, row in enumerate(rows):
+        lines.append("  ".join(str(v).ljust(widths[i]) for i, v in enumerate(row)))
+        if idx == 0:
+            lines.append("  ".join("-" * i for i in widths))
+    return "\n".join(lines)
+
+
+def compare(baseline: dict, current: dict, overrides: dict):
+    """Compare current results against baseline, return (rows, regressed)."""
+    rows = [["benchmark", "baseline", "current", "delta", "noise", "tol", "status"]]
+    regressed = []
+    for name, cur in current.items():
+        base = baseline.get(name)
+        tol = overrides.get(name, cur["tolerance"])
+        if not base:
+            rows.append(
+                [name, "-", _fmt_secs(cur["median"]), "-", "-", f"{tol:.0%}", "new"]
+            )
+            continue
+        delta = cur["median"] - base["median"]
+        pct = delta / base["median"] if base["median"] else 0.0
+        noise = max(base["iqr"], cur["iqr"])
+        if pct > tol and delta > noise:
+            status = "SLOWER"
+            regressed.append(name)
+        elif pct < -tol and -delta > noise:
+            status = "faster"
+        elif abs(pct) > tol:
+            status = "noise"
+        else:
+            status = "ok"
+        rows.append(
+            [
+                name,
+                _fmt_secs(base["median"]),
+                _fmt_secs(cur["median"]),
+                f"{pct:+.1%}",
+                _fmt_secs(noise),
+                f"{tol:.0%}",
+                status,
+            ]
+        )
+    return rows, regressed
+
+
+def _parse_overrides(vals):
+    """Parse NAME=PCT tolerance overrides."""
+    overrides = {}
+    for val in vals:
+        try:
+            name, pct = val.split("=")
+            overrides[name] = float(pct.rstrip("%")) / 100
+        except ValueError as _e:
+            raise SystemExit(f"Invalid tolerance override: {val}") from _e
+    return overrides
+
+
+def cmd_run(args):
+    """Run benchmarks and print the results."""
+    results = run_all(args.only, args.repeat)
+    rows = [["benchmark", "median", "iqr", "min", "max"]]
+    for name, res in results.items():
+        rows.append(
+            [
+                name,
+                _fmt_secs(res["median"]),
+                _fmt_secs(res["iqr"]),
+                _fmt_secs(min(res["runs"])),
+                _fmt_secs(max(res["runs"])),
+            ]
+        )
+    print(_table(rows))
+
+
+def cmd_baseline(args):
+    """Run benchmarks and record them as the new baseline."""
+    results = run_all(args.only, args.repeat)
+    content = {
+        "meta": {
+            "date": datetime.utcnow().strftime(DTFMT),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    args.baseline.write_text(json.dumps(content, indent=4))
+    print(f"Baseline written to: {args.baseline}")
+
+
+def cmd_compare(args):
+    """Run benchmarks and compare against the recorded baseline."""
+    if not args.baseline.exists():
+        raise SystemExit(f"No baseline found at {args.baseline}, run 'baseline' first")
+    baseline = json.loads(args.baseline.read_text())["results"]
+    results = run_all(args.only, args.repeat)
+    rows, regressed = compare(baseline, results, _parse_overrides(args.tolerance))
+    print(_table(rows))
+    if regressed:
+        raise SystemExit(f"\nSignificant slowdown in: {', '.join(regressed)}")
+
+
+def cmd_ui(_):
+    """Print per keystroke latency / curses calls of the scripted ui sessions."""
+    rows = [["ui", "startup", "keys", "p50", "p95", "max", "curses calls"]]
+    for name in UI_SCRIPTS:
+        summ = Harness.summary(bench_ui(_ui_harness(name)))
+        rows.append(
+            [
+                name,
+                _fmt_secs(summ["startup"]),
+                summ["keys"],
+                _fmt_secs(summ["latency_p50"]),
+                _fmt_secs(summ["latency_p95"]),
+                _fmt_secs(summ["latency_max"]),
+                summ["calls"],
+            ]
+        )
+    print(_table(rows))
+
+
+MAP = {
+    "run": cmd_run,
+    "ui": cmd_ui,
+    "baseline": cmd_baseline,
+    "compare": cmd_compare,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=__doc__,
+    )
+    parser.add_argument(
+        "command",
+        choices=MAP.keys(),
+        type=str,
+    )
+    parser.add_argument(
+        "--baseline",
+        "-b",
+        type=Path,
+        default=BASELINE,
+        help=f"baseline json file (default: {BASELINE.name})",
+    )
+    parser.add_argument(
+        "--repeat",
+        "-r",
+        type=int,
+        default=7,
+        help="timed runs per benchmark, the median / IQR are taken over these",
+    )
+    parser.add_argument(
+        "--only",
+        "-o",
+        nargs="*",
+        choices=BENCHMARKS.keys(),
+        default=list(BENCHMARKS.keys()),
+        help="only run these benchmarks",
+    )
+    parser.add_argument(
+        "--tolerance",
+        "-t",
+        nargs="*",
+        default=[],
+        help="per benchmark tolerance override i.e. make_tokenized=25",
+    )
+    args = parser.parse_args()
+    MAP[args.command](args)
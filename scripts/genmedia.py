@@ -1,58 +1,660 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Generate PS1 images from examples."""
+"""Generate media/*.png screenshots from the media/demo/*.sh examples.
+
+Every demo runs under a pseudo terminal, its output is interpreted by a
+small in-memory VT100 / xterm emulator and the final screen is rasterized
+with Pillow. Demos run in parallel processes, a demo is only regenerated
+when its content hash (script, unicodes source, fonts and terminal
+settings) differs from the one recorded in media/.hashes.json.
+"""
+from typing import Any, Dict, Iterator, List, Set, Tuple
 from pathlib import Path
-import subprocess
-import shlex
+from concurrent.futures import ProcessPoolExecutor
 import argparse
-from contextlib import contextmanager
+import codecs
+import fcntl
+import hashlib
+import json
+import os
+import pty
+import select
+import signal
+import struct
+import termios
+import time
+
+import PIL
+from PIL import Image, ImageDraw, ImageFont
+from unicodes_api.screen import cell_width
 
-# pylint: disable=consider-using-with
 # pylint: disable=invalid-name
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-instance-attributes
 
-BDIR = Path(__file__).parent.parent
+BDIR = Path(__file__).resolve().parent.parent
 EXAMPLE_DIR = BDIR.joinpath("media/demo")
 DSTDIR = BDIR.joinpath("media")
+HASHES = DSTDIR.joinpath(".hashes.json")
 
-KONS_GEO = "1400x1000,0+0"
-CAP_GEO = "1400x1000+1920+60"
+ROWS = 50
+"""terminal lines."""
+COLS = 160
+"""terminal columns, wide enough that no demo line wraps."""
+FONT_SIZE = 16
+"""font size in pixels."""
+PADDING = 8
+"""border around the terminal in pixels."""
+SETTLE = 1.5
+"""seconds without output (after the first output) before the screen is captured."""
+TIMEOUT = 60.0
+"""give up waiting for a demo to settle after this many seconds."""
+FONTS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+    "/usr/share/fonts/TTF/DejaVuSansMono.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSansMono.ttf",
+    "/Library/Fonts/DejaVuSansMono.ttf",
+]
+"""monospace fonts tried in order."""
+FALLBACK_FONTS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeMono.ttf",
+    "/usr/share/fonts/gnu-free/FreeMono.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSerif.ttf",
+    "/usr/share/fonts/gnu-free/FreeSerif.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansMono-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansSymbols-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansSymbols2-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansMath-Regular.ttf",
+    "/usr/share/fonts/google-noto/NotoSansSymbols-Regular.ttf",
+    "/usr/share/fonts/google-noto/NotoSansSymbols2-Regular.ttf",
+    "/usr/share/fonts/google-noto/NotoSansMath-Regular.ttf",
+    "/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf",
+    "/usr/share/fonts/TTF/Symbola.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/opentype/unifont/unifont.otf",
+    "/usr/share/fonts/opentype/unifont/unifont_upper.otf",
+]
+"""fonts tried for glyphs the main font doesn't have (box drawing, playing
+cards, symbols, CJK and unifont as the last resort)."""
 
+BG = (0, 0, 0)
+FG = (204, 204, 204)
+PALETTE = [
+    (0, 0, 0),
+    (205, 49, 49),
+    (13, 188, 121),
+    (229, 229, 16),
+    (36, 114, 200),
+    (188, 63, 188),
+    (17, 168, 205),
+    (229, 229, 229),
+    (102, 102, 102),
+    (241, 76, 76),
+    (35, 209, 139),
+    (245, 245, 67),
+    (59, 142, 234),
+    (214, 112, 214),
+    (41, 184, 219),
+    (255, 255, 255),
+]
+"""16 color palette."""
 
-@contextmanager
-def konsole(rcfile: Path):
-    """launch konsole / program."""
-    cmd = shlex.split(
-        f"konsole --nofork --geometry {KONS_GEO} -e bash --rcfile {rcfile.resolve()}"
-    )
-    p = subprocess.Popen(cmd, stderr=subprocess.PIPE)
-    try:
-        yield p
-    finally:
-        p.terminate()
+Attr = Tuple[Any, Any, bool, bool]
+"""(foreground, background, bold, reverse), None colors are the defaults."""
+DEFAULT_ATTR = (None, None, False, False)  # type: Attr
 
 
-@contextmanager
-def screencap(dstfile: Path):
-    """Get screencap."""
-    cmd = shlex.split(
-        f"import -window root -pause 3 -crop {CAP_GEO} {dstfile.resolve()}"
-    )
-    p = subprocess.Popen(cmd)
+def color256(idx: int) -> Tuple[int, int, int]:
+    """xterm 256 color palette."""
+    if idx < 16:
+        return PALETTE[idx]
+    if idx < 232:
+        idx -= 16
+        steps = [0, 95, 135, 175, 215, 255]
+        return steps[idx // 36], steps[idx // 6 % 6], steps[idx % 6]
+    val = 8 + (idx - 232) * 10
+    return val, val, val
+
+
+class Terminal:
+    """In-memory terminal, interprets the VT100 / xterm subset curses and ls use."""
+
+    def __init__(self, rows: int, cols: int):
+        """initialize Terminal."""
+        self.rows = rows
+        """number of lines."""
+        self.cols = cols
+        """number of columns."""
+        self.grid = []  # type: List[List[Tuple[str, Attr]]]
+        """screen cells (text, attributes), a wide character's second cell is empty."""
+        self.y = 0
+        """cursor line."""
+        self.x = 0
+        """cursor column."""
+        self.attr = DEFAULT_ATTR
+        """current attributes."""
+        self.wrap_pending = False
+        """last column written, the next character wraps."""
+        self.top = 0
+        """scroll region top."""
+        self.bottom = rows - 1
+        """scroll region bottom."""
+        self.saved = (0, 0, DEFAULT_ATTR)
+        """saved cursor."""
+        self.primary = None  # type: Any | List[List[Tuple[str, Attr]]]
+        """primary screen while the alternate screen is active."""
+        self.last = " "
+        """last printed character (REP)."""
+        self.state = "text"
+        """parser state."""
+        self.seq = ""
+        """escape sequence collected so far."""
+        self.decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        """utf-8 decoder."""
+        self.grid = self._blank_grid()
+
+    def _blank_row(self) -> List[Tuple[str, Attr]]:
+        return [(" ", self.attr) for _ in range(self.cols)]
+
+    def _blank_grid(self) -> List[List[Tuple[str, Attr]]]:
+        return [self._blank_row() for _ in range(self.rows)]
+
+    def feed(self, data: bytes):
+        """Interpret terminal output."""
+        for ch in self.decoder.decode(data):
+            if self.state == "text":
+                self._text(ch)
+            elif self.state == "esc":
+                self._esc(ch)
+            elif self.state == "csi":
+                self.seq += ch
+                if "@" <= ch <= "~":
+                    self.state = "text"
+                    self._csi(self.seq)
+            elif self.state == "osc":
+                if ch == "\x07" or (ch == "\\" and self.seq.endswith("\x1b")):
+                    self.state = "text"
+                self.seq += ch
+            elif self.state == "charset":
+                self.state = "text"
+
+    def _text(self, ch: str):
+        """Printable / control character."""
+        if ch == "\x1b":
+            self.state, self.seq = "esc", ""
+        elif ch == "\r":
+            self.x, self.wrap_pending = 0, False
+        elif ch in "\n\x0b\x0c":
+            self._index()
+        elif ch == "\b":
+            self.x, self.wrap_pending = max(self.x - 1, 0), False
+        elif ch == "\t":
+            self.x = min((self.x // 8 + 1) * 8, self.cols - 1)
+        elif ord(ch) < 32 or ord(ch) == 127:
+            pass
+        else:
+            self._print(ch)
+
+    def _print(self, ch: str):
+        """Put a character at the cursor."""
+        size = cell_width(ch)
+        if not size:
+            px = self.x - 1 if not self.wrap_pending else self.x
+            if px >= 0:
+                text, attr = self.grid[self.y][px]
+                self.grid[self.y][px] = (text + ch, attr)
+            return
+        if self.wrap_pending or self.x + size > self.cols:
+            self.x = 0
+            self._index()
+        self.wrap_pending = False
+        self.grid[self.y][self.x] = (ch, self.attr)
+        if size == 2:
+            self.grid[self.y][self.x + 1] = ("", self.attr)
+        self.last = ch
+        if self.x + size >= self.cols:
+            self.x = self.cols - 1
+            self.wrap_pending = True
+        else:
+            self.x += size
+
+    def _index(self):
+        """Line feed, scrolling the region at its bottom."""
+        self.wrap_pending = False
+        if self.y == self.bottom:
+            self._scroll_up(1)
+        elif self.y < self.rows - 1:
+            self.y += 1
+
+    def _scroll_up(self, count: int):
+        for _ in range(count):
+            del self.grid[self.top]
+            self.grid.insert(self.bottom, self._blank_row())
+
+    def _scroll_down(self, count: int):
+        for _ in range(count):
+            del self.grid[self.bottom]
+            self.grid.insert(self.top, self._blank_row())
+
+    def _esc(self, ch: str):
+        """Character following ESC."""
+        self.state = "text"
+        if ch == "[":
+            self.state, self.seq = "csi", ""
+        elif ch == "]":
+            self.state, self.seq = "osc", ""
+        elif ch in "()*+":
+            self.state = "charset"
+        elif ch == "7":
+            self.saved = (self.y, self.x, self.attr)
+        elif ch == "8":
+            self.y, self.x, self.attr = self.saved
+        elif ch == "D":
+            self._index()
+        elif ch == "E":
+            self.x = 0
+            self._index()
+        elif ch == "M":
+            if self.y == self.top:
+                self._scroll_down(1)
+            elif self.y:
+                self.y -= 1
+        elif ch == "c":
+            self.__init__(self.rows, self.cols)
+
+    def _csi(self, seq: str):
+        """Control sequence."""
+        final, body = seq[-1], seq[:-1]
+        private = body[:1] if body[:1] in "?<=>" else ""
+        body = body[len(private) :]
+        params = [int(i) if i.isdigit() else 0 for i in body.split(";")] if body else []
+        first = params[0] if params else 0
+        num = max(first, 1)
+        self.wrap_pending = False
+        if private:
+            if private == "?" and final in "hl" and set(params) & {47, 1047, 1049}:
+                self._alternate(final == "h")
+            return
+        if final in "Hf":
+            row = params[0] if params else 1
+            col = params[1] if len(params) > 1 else 1
+            self.y = min(max(row, 1), self.rows) - 1
+            self.x = min(max(col, 1), self.cols) - 1
+        elif final == "A":
+            self.y = max(self.y - num, 0)
+        elif final in "Be":
+            self.y = min(self.y + num, self.rows - 1)
+        elif final in "Ca":
+            self.x = min(self.x + num, self.cols - 1)
+        elif final == "D":
+            self.x = max(self.x - num, 0)
+        elif final == "E":
+            self.x, self.y = 0, min(self.y + num, self.rows - 1)
+        elif final == "F":
+            self.x, self.y = 0, max(self.y - num, 0)
+        elif final in "G`":
+            self.x = min(num, self.cols) - 1
+        elif final == "d":
+            self.y = min(num, self.rows) - 1
+        elif final == "J":
+            self._erase_display(first)
+        elif final == "K":
+            self._erase_line(first)
+        elif final == "L":
+            if self.top <= self.y <= self.bottom:
+                for _ in range(num):
+                    del self.grid[self.bottom]
+                    self.grid.insert(self.y, self._blank_row())
+        elif final == "M":
+            if self.top <= self.y <= self.bottom:
+                for _ in range(num):
+                    del self.grid[self.y]
+                    self.grid.insert(self.bottom, self._blank_row())
+        elif final == "@":
+            row = self.grid[self.y]
+            row[self.x : self.x] = [(" ", self.attr)] * num
+            del row[self.cols :]
+        elif final == "P":
+            row = self.grid[self.y]
+            del row[self.x : self.x + num]
+            row.extend([(" ", self.attr)] * (self.cols - len(row)))
+        elif final == "X":
+            for col in range(self.x, min(self.x + num, self.cols)):
+                self.grid[self.y][col] = (" ", self.attr)
+        elif final == "S":
+            self._scroll_up(num)
+        elif final == "T":
+            self._scroll_down(num)
+        elif final == "b":
+            for _ in range(num):
+                self._print(self.last)
+        elif final == "r":
+            top = params[0] if params else 1
+            bottom = params[1] if len(params) > 1 and params[1] else self.rows
+            self.top, self.bottom = max(top, 1) - 1, min(bottom, self.rows) - 1
+            self.y = self.x = 0
+        elif final == "s":
+            self.saved = (self.y, self.x, self.attr)
+        elif final == "u":
+            self.y, self.x, self.attr = self.saved
+        elif final == "m":
+            self._sgr(params or [0])
+
+    def _erase_line(self, mode: int):
+        row = self.grid[self.y]
+        start, end = {0: (self.x, self.cols), 1: (0, self.x + 1)}.get(
+            mode, (0, self.cols)
+        )
+        for col in range(start, end):
+            row[col] = (" ", self.attr)
+
+    def _erase_display(self, mode: int):
+        if mode == 0:
+            self._erase_line(0)
+            rows = range(self.y + 1, self.rows)
+        elif mode == 1:
+            self._erase_line(1)
+            rows = range(0, self.y)
+        else:
+            rows = range(self.rows)
+        for idx in rows:
+            self.grid[idx] = self._blank_row()
+
+    def _alternate(self, enable: bool):
+        """Switch to / from the alternate screen."""
+        if enable and self.primary is None:
+            self.saved = (self.y, self.x, self.attr)
+            self.primary, self.grid = self.grid, self._blank_grid()
+        elif not enable and self.primary is not None:
+            self.grid, self.primary = self.primary, None
+            self.y, self.x, self.attr = self.saved
+
+    def _sgr(self, params: List[int]):
+        """Select graphic rendition."""
+        fg, bg, bold, reverse = self.attr
+        idx = 0
+        while idx < len(params):
+            val = params[idx]
+            if val == 0:
+                fg, bg, bold, reverse = DEFAULT_ATTR
+            elif val == 1:
+                bold = True
+            elif val == 22:
+                bold = False
+            elif val == 7:
+                reverse = True
+            elif val == 27:
+                reverse = False
+            elif 30 <= val <= 37:
+                fg = PALETTE[val - 30]
+            elif 90 <= val <= 97:
+                fg = PALETTE[val - 90 + 8]
+            elif 40 <= val <= 47:
+                bg = PALETTE[val - 40]
+            elif 100 <= val <= 107:
+                bg = PALETTE[val - 100 + 8]
+            elif val == 39:
+                fg = None
+            elif val == 49:
+                bg = None
+            elif val in (38, 48) and idx + 1 < len(params):
+                if params[idx + 1] == 5 and idx + 2 < len(params):
+                    color = color256(params[idx + 2])  # type: Any
+                    idx += 2
+                elif params[idx + 1] == 2 and idx + 4 < len(params):
+                    color = tuple(params[idx + 2 : idx + 5])
+                    idx += 4
+                else:
+                    color = None
+                if val == 38:
+                    fg = color
+                else:
+                    bg = color
+            idx += 1
+        self.attr = (fg, bg, bold, reverse)
+
+    def text(self) -> str:
+        """Screen text."""
+        return "\n".join("".join(i for i, _ in row).rstrip() for row in self.grid)
+
+
+def capture(script: Path, rows: int = ROWS, cols: int = COLS) -> Terminal:
+    """Run a demo under a pty and return the terminal once its output settles."""
+    env = dict(os.environ, TERM="xterm", LINES=str(rows), COLUMNS=str(cols))
+    env["PATH"] = f"{BDIR.joinpath('bin')}{os.pathsep}{env.get('PATH', '')}"
+    env["PYTHONPATH"] = str(BDIR.joinpath("src"))
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(BDIR)
+        os.execvpe("bash", ["bash", str(script)], env)
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+    os.kill(pid, signal.SIGWINCH)
+    term = Terminal(rows, cols)
+    start = last = time.monotonic()
+    received = False
     try:
-        yield p
+        while True:
+            now = time.monotonic()
+            if (received and now - last > SETTLE) or now - start > TIMEOUT:
+                break
+            ready, _, _ = select.select([fd], [], [], 0.1)
+            if not ready:
+                continue
+            try:
+                data = os.read(fd, 65536)
+            except OSError:
+                break
+            if not data:
+                break
+            term.feed(data)
+            received, last = True, time.monotonic()
     finally:
-        p.terminate()
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        os.waitpid(pid, 0)
+        os.close(fd)
+    return term
+
+
+def font_paths(font: str = None) -> List[str]:
+    """Existing font files a Rasterizer uses, main font first ("" for Pillow's default)."""
+    main = [i for i in ([font] if font else FONTS) if Path(i).exists()][:1]
+    return (main or [""]) + [i for i in FALLBACK_FONTS if Path(i).exists()]
+
+
+def _truetype(paths: List[str], size: int) -> List[Any]:
+    """Load the fonts that exist."""
+    fonts = []
+    for path in paths:
+        if Path(path).exists():
+            fonts.append(ImageFont.truetype(path, size))
+    return fonts
+
 
+class Rasterizer:
+    """Draw a Terminal with Pillow."""
 
-def iter_media_files():
+    def __init__(self, font: str = None, size: int = FONT_SIZE):
+        """initialize Rasterizer."""
+        fonts = _truetype([font] if font else FONTS, size)
+        if font and not fonts:
+            raise SystemExit(f"Font not found: {font}")
+        self.fonts = (fonts[:1] or [ImageFont.load_default()]) + _truetype(
+            FALLBACK_FONTS, size
+        )
+        """main font followed by fallback fonts."""
+        main = self.fonts[0]
+        left, top, right, bottom = main.getbbox("M")
+        self.cell_width = max(int(round(main.getlength("M"))), right - left, 1)
+        """cell width in pixels."""
+        self.cell_height = int((bottom - top) * 1.5) or size
+        """cell height in pixels."""
+        self.notdef = [self._mask(i, "\U0010fffd") for i in self.fonts]
+        """rendering of a missing glyph for every font."""
+        self.cache = {}  # type: Dict[str, Any]
+        """text -> font that has its glyph."""
+        self.missing = set()  # type: Set[str]
+        """characters no font has a glyph for, drawn as tofu."""
+
+    @staticmethod
+    def _mask(font: Any, text: str) -> bytes:
+        mask = font.getmask(text)
+        return bytes(mask.size) + bytes(mask)
+
+    def font_for(self, text: str) -> Any:
+        """First font with a glyph for text."""
+        if text not in self.cache:
+            self.cache[text] = self.fonts[0]
+            for font, notdef in zip(self.fonts, self.notdef):
+                if self._mask(font, text[0]) != notdef:
+                    self.cache[text] = font
+                    break
+            else:
+                self.missing.add(text[0])
+        return self.cache[text]
+
+    def render(self, term: Terminal, dst: Path):
+        """Write the terminal screen to a png."""
+        size = (
+            term.cols * self.cell_width + 2 * PADDING,
+            term.rows * self.cell_height + 2 * PADDING,
+        )
+        img = Image.new("RGB", size, BG)
+        draw = ImageDraw.Draw(img)
+        for y, row in enumerate(term.grid):
+            for x, (text, attr) in enumerate(row):
+                fg, bg, bold, reverse = attr
+                fg, bg = fg or FG, bg or BG
+                if reverse:
+                    fg, bg = bg, fg
+                if bold and fg in PALETTE[:8]:
+                    fg = PALETTE[PALETTE.index(fg) + 8]
+                px = PADDING + x * self.cell_width
+                py = PADDING + y * self.cell_height
+                cells = 2 if x + 1 < term.cols and row[x + 1][0] == "" else 1
+                if bg != BG:
+                    draw.rectangle(
+                        [
+                            px,
+                            py,
+                            px + cells * self.cell_width - 1,
+                            py + self.cell_height - 1,
+                        ],
+                        fill=bg,
+                    )
+                if text.strip():
+                    draw.text((px, py), text, font=self.font_for(text), fill=fg)
+        img.save(dst)
+
+
+def iter_media_files() -> Iterator[Tuple[Path, Path]]:
     """Iterate through examples."""
-    for i in EXAMPLE_DIR.iterdir():
+    for i in sorted(EXAMPLE_DIR.iterdir()):
         if not i.name.endswith(".sh"):
             continue
         yield i, DSTDIR.joinpath(f"{i.name}.png")
 
 
-def clean():
+def source_files() -> List[Path]:
+    """Files of the unicodes program the demos run."""
+    return sorted(BDIR.joinpath("src/unicodes_api").glob("*.py")) + sorted(
+        BDIR.joinpath("bin").iterdir()
+    )
+
+
+def content_hash(srcfile: Path, font: str = None) -> str:
+    """Hash of everything a demo screenshot depends on.
+
+    Terminal / font settings, the resolved font files (and Pillow version),
+    the unicodes source and the demo script.
+    """
+    sha = hashlib.sha256()
+    for val in (ROWS, COLS, FONT_SIZE, PADDING, PIL.__version__):
+        sha.update(f"{val}\0".encode())
+    for path in font_paths(font):
+        stat = Path(path).stat() if path else None
+        sha.update(f"{path}\0{stat and stat.st_size}\0".encode())
+    for path in source_files() + [srcfile]:
+        if path.is_file():
+            sha.update(f"{path.relative_to(BDIR)}\0".encode())
+            sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def load_hashes() -> Dict[str, str]:
+    """Recorded demo hashes."""
+    if not HASHES.exists():
+        return {}
+    return json.loads(HASHES.read_text())
+
+
+class MissingGlyphs(Exception):
+    """The fonts lack glyphs of a demo's output."""
+
+
+def generate(
+    srcfile: Path, dstfile: Path, font: str = None, allow_missing: bool = False
+) -> str:
+    """Create a single screenshot, returns its content hash (worker process).
+
+    Raises MissingGlyphs instead of writing a screenshot with tofu boxes,
+    unless allow_missing.
+    """
+    raster = Rasterizer(font)
+    tmpfile = dstfile.with_suffix(".tmp.png")
+    raster.render(capture(srcfile), tmpfile)
+    if raster.missing and not allow_missing:
+        tmpfile.unlink()
+        cps = " ".join(f"U+{ord(i):04X}" for i in sorted(raster.missing))
+        raise MissingGlyphs(f"{srcfile.name}: no font has a glyph for {cps}")
+    tmpfile.replace(dstfile)
+    return content_hash(srcfile, font)
+
+
+def outdated(font: str = None) -> List[Tuple[Path, Path]]:
+    """Demos whose screenshot is missing or whose hash changed."""
+    hashes = load_hashes()
+    return [
+        (srcfile, dfile)
+        for srcfile, dfile in iter_media_files()
+        if not dfile.exists() or hashes.get(srcfile.name) != content_hash(srcfile, font)
+    ]
+
+
+def create(args: argparse.Namespace, overwrite: bool = False):
+    """Generate outdated (or all) screenshots in parallel."""
+    todo = list(iter_media_files()) if overwrite else outdated(args.font)
+    if not todo:
+        print("Media files are up to date")
+        return
+    hashes = load_hashes()
+    failed = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {
+            srcfile.name: pool.submit(
+                generate, srcfile, dfile, args.font, args.allow_missing
+            )
+            for srcfile, dfile in todo
+        }
+        for name, fut in futures.items():
+            try:
+                hashes[name] = fut.result()
+            except MissingGlyphs as err:
+                failed.append(str(err))
+                continue
+            print(f"Created: {DSTDIR.joinpath(name + '.png')}")
+    HASHES.write_text(json.dumps(hashes, indent=4, sort_keys=True) + "\n")
+    if failed:
+        out = "\n".join(failed)
+        raise SystemExit(f"Install fallback fonts (see FALLBACK_FONTS):\n{out}")
+
+
+def clean(_):
     """Clean media files."""
     for file in DSTDIR.iterdir():
         if file.is_dir():
@@ -61,36 +663,22 @@ def clean():
         file.unlink()
 
 
-def check():
-    """Check if files exist."""
-    noexist = []
-    for srcfile, dfile in iter_media_files():
-        if not dfile.exists():
-            noexist.append(srcfile.name)
-    if noexist:
-        out = ",".join(noexist)
+def check(args: argparse.Namespace):
+    """Check that every screenshot exists and is up to date."""
+    names = [srcfile.name for srcfile, _ in outdated(args.font)]
+    if names:
+        out = ",".join(names)
         raise SystemExit(f"The following media files need to be created for: {out}")
 
 
-def main(overwrite=False):
-    """Run main function."""
-    for srcfile, dfile in iter_media_files():
-        if not overwrite and dfile.exists():
-            continue
-        print(f"Creating: {dfile}")
-        with konsole(srcfile) as kons, screencap(dfile) as sc:
-            sc.communicate()
-            kons.kill()
-
-
 MAP = {
-    "create": [main],
-    "overwrite": [lambda: main(True)],
+    "create": [create],
+    "overwrite": [lambda args: create(args, True)],
     "clean": [clean],
     "check": [check],
     "regen": [
         clean,
-        main,
+        create,
     ],
 }
 
@@ -104,7 +692,23 @@ if __name__ == "__main__":
         choices=MAP.keys(),
         type=str,
     )
-    # args = parser.parse_args(["regen"])
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count(),
+        help="demos generated in parallel",
+    )
+    parser.add_argument(
+        "--font",
+        default=None,
+        help="monospace ttf font (default: DejaVu Sans Mono / Pillow's default)",
+    )
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="write screenshots even if no font has a glyph for some characters",
+    )
     args = parser.parse_args()
     for func in MAP[args.command]:
-        func()
+        func(args)
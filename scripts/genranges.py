@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Generate src/unicodes_api/ranges.py from a local UCD directory.
+
+unicodedata has no block or script property, the static tables cover the
+interpreter's Unicode version. Needs Blocks.txt and Scripts.txt from
+https://www.unicode.org/Public/<version>/ucd/ in the directory.
+"""
+from pathlib import Path
+import argparse
+import re
+
+from unicodes_api.ucd import read_ranges
+
+# pylint: disable=invalid-name
+
+BDIR = Path(__file__).resolve().parent.parent
+DST = BDIR.joinpath("src/unicodes_api/ranges.py")
+
+HEADER = '''#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""STATIC block and script ranges, unicodedata does not provide these.
+
+Generated by scripts/genranges.py from the Unicode {version} UCD, do not edit.
+"""
+
+UNICODE_VERSION = "{version}"
+"""Unicode version of the tables."""
+'''
+
+
+def _table(name: str, doc: str, ranges) -> str:
+    """Python source of a range table."""
+    lines = [f"{name} = ["]
+    for first, last, value in ranges:
+        lines.append(f'    (0x{first:04X}, 0x{last:04X}, "{value}"),')
+    lines += ["]", f'"""{doc}"""', ""]
+    return "\n".join(lines)
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument("ucd_dir", help="directory with Blocks.txt and Scripts.txt")
+    args = parser.parse_args()
+    src = Path(args.ucd_dir)
+    blocks = read_ranges(src.joinpath("Blocks.txt"))
+    scripts = read_ranges(src.joinpath("Scripts.txt"))
+    if not blocks or not scripts:
+        raise SystemExit(f"Blocks.txt and Scripts.txt are required in {src}")
+    header = src.joinpath("Blocks.txt").read_text().splitlines()[0]
+    match = re.search(r"(\d+\.\d+\.\d+)", header)
+    if not match:
+        raise SystemExit(f"No version in the Blocks.txt header: {header}")
+    out = [
+        HEADER.format(version=match.group(1)),
+        _table("BLOCKS", "(first, last, block name) in code point order.", blocks),
+        _table("SCRIPTS", "(first, last, script name) in code point order.", scripts),
+    ]
+    DST.write_text("\n".join(out))
+    print(f"Wrote {DST}: {len(blocks)} blocks, {len(scripts)} script ranges")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fire thousands of terminal resizes at a curses ui running headless.
+
+Checks that resizing happens in place: the call stack doesn't grow, memory
+stays flat and the incrementally drawn final frame matches the same content
+drawn from scratch at the final terminal size.
+"""
+from typing import Any, List
+import argparse
+import random
+import sys
+import tracemalloc
+
+from unicodes_api.cli import SUBCOMMANDS
+from unicodes_api import headless
+from unicodes_api.headless import Harness, Resize
+
+# pylint: disable=invalid-name
+# pylint: disable=protected-access
+
+
+def random_resize(sigwinch: bool) -> Resize:
+    """Resize to a random terminal size."""
+    return Resize(random.randint(5, 80), random.randint(10, 250), sigwinch)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Traced memory, leaving out the harness' recorded steps."""
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, headless.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+
+
+def run(name: str, count: int, seed: int) -> int:
+    """Run the stress test, returns an exit code."""
+    random.seed(seed)
+    script = []  # type: List[Any]
+    for idx in range(count):
+        script.append(random_resize(idx % 3 == 0))
+        if idx % 50 == 0 and idx < count // 10:
+            # navigate during warm up only, new content fills bounded caches
+            script.append("n")
+    script.extend([Resize(24, 80), "d", Resize(30, 100)])
+
+    obj = SUBCOMMANDS[name]  # type: Any
+    harness = Harness(obj, ["hello"] if name == "hackermix" else [], 24, 80)
+
+    depths = set()
+    resizes = [0]
+    # snapshots after warm up / at the last resize
+    snapshots = []  # type: List[Any]
+    resize = obj.resize
+
+    def _resize():
+        frame, depth = sys._getframe(), 0
+        while frame:
+            frame, depth = frame.f_back, depth + 1
+        depths.add(depth)
+        resizes[0] += 1
+        if resizes[0] in (count // 5, count):
+            snapshots.append(_snapshot())
+        resize()
+
+    obj.resize = _resize
+    tracemalloc.start()
+    try:
+        steps = harness.run(*script)
+    finally:
+        tracemalloc.stop()
+        del obj.resize
+
+    pad = harness.backend.pad
+    incremental = steps[-1].frame
+    # same content drawn from scratch into a freshly sized pad
+    obj.renderer.reset()
+    obj._draw()
+    diff = snapshots[1].compare_to(snapshots[0], "filename")
+    growth = sum(i.size_diff for i in diff)
+    print(f"resizes:        {resizes[0]}")
+    print(f"stack depths:   {sorted(depths)}")
+    print(f"final size:     {pad.getmaxyx()}")
+    print(f"memory growth:  {growth / 1024:.1f} KiB")
+    errors = []
+    if len(depths) != 1:
+        errors.append("call stack grows with resizes")
+    if pad.getmaxyx() != (30, 100):
+        errors.append("pad wasn't resized to the terminal size")
+    if pad.dump() != incremental:
+        errors.append("incremental frame differs from a redraw from scratch")
+    if growth > 64 * 1024:
+        errors.append("memory grows with resizes")
+    for err in errors:
+        print(f"FAIL: {err}")
+    return 1 if errors else 0
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--command",
+        choices=["explore", "hackermix"],
+        default="explore",
+        help="curses subcommand to stress",
+    )
+    parser.add_argument(
+        "--count", type=int, default=5000, help="number of resize events"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    raise SystemExit(run(args.command, args.count, args.seed))
+
+
+if __name__ == "__main__":
+    main()
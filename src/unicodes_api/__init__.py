@@ -1,10 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Print / show characters."""
-from typing import Iterator, Dict, List, Any, Tuple, Set
+from typing import Iterable, Iterator, Dict, List, Any, Sequence, Tuple, Set
+from typing import Callable
+from collections.abc import ItemsView, KeysView, ValuesView
+from array import array
+import bisect
 import random
+import re
+import threading
+import time
 import unicodedata
 from unicodes_api.ascii import ASCII_MAP
+from unicodes_api.catalog import GroupCatalog
+from unicodes_api.facets import Facets
+from unicodes_api.intervals import COLUMNS
+from unicodes_api.paging import PAGE_SIZE, Page, decode_cursor, paginate
+from unicodes_api.tokens import TokenArrays, tokenize
+from unicodes_api.trace import TRACER
 
 # pylint: disable=too-few-public-methods,invalid-name
 # pylint: disable=pointless-string-statement
@@ -14,10 +27,79 @@ LETTERS_NUMBERS = list(
     map(chr, list(range(ord("a"), ord("z") + 1)) + list(range(ord("0"), ord("9") + 1)))
 )
 """letters and numbers we want to track for LetterMixer."""
+CODEPOINT_RE = re.compile(
+    r"^(?:u\+|0x|\\u|\\U|\\x|&#x)?([0-9a-f]{1,8});?$|^&#([0-9]+);?$", re.I
+)
+"""Code point written as U+XXXX, 0xXXXX, \\uXXXX, &#N;, &#xXXXX; or bare hex."""
+MAX_CODEPOINT = 0x10FFFF
+"""Last Unicode code point."""
+
+
+def parse_codepoint(text: str) -> int:
+    """Code point of a CODEPOINT_RE value, raises ValueError."""
+    match = CODEPOINT_RE.match(text.strip())
+    if not match:
+        raise ValueError(f"Invalid code point: {text}")
+    cp = int(match.group(1), 16) if match.group(1) else int(match.group(2))
+    if cp > MAX_CODEPOINT:
+        raise ValueError(f"Code point out of range: {text}")
+    return cp
+
+
+def parse_range(text: str) -> Tuple[int, int]:
+    """(start, end) of START-END, START..END or a single code point (see CODEPOINT_RE).
+
+    Raises ValueError for invalid values or start > end.
+    """
+    parts = re.split(r"\.\.|-", text, maxsplit=1)
+    start = parse_codepoint(parts[0])
+    end = parse_codepoint(parts[1]) if len(parts) > 1 else start
+    if start > end:
+        raise ValueError(f"Range start is after its end: {text}")
+    return start, end
+
+
+def hex_field(cp: int) -> str:
+    """record "hex" field, lower case hex without 0x."""
+    return f"{cp:x}"
+
+
+def python_field(cp: int) -> str:
+    """record "python" field, \\uXXXX / \\UXXXXXXXX escape."""
+    if cp < 0xFFFF:
+        return f"\\u{cp:04x}"
+    return f"\\U{cp:08x}"
+
+
+def html_field(cp: int) -> str:
+    """record "html" field, &#N; escape."""
+    return f"&#{cp};"
+
 
+def _iter_unicodedata_names(
+    start: int = 0, end: int = MAX_CODEPOINT
+) -> Iterator[Tuple[int, str]]:
+    """yield (code point, name) of start to end from the interpreter's unicodedata."""
+    for i in range(start, min(end + 1, MAX_CODEPOINT)):
+        try:
+            name = unicodedata.name(chr(i))
+        except ValueError:
+            name = ""
+        yield i, name
 
-def iter_unicodes() -> Iterator[Dict]:
-    """yield all Unicode values.
+
+def iter_unicodes(
+    ucd: Any = None,
+    columns: Sequence[str] = (),
+    start: int = 0,
+    end: int = MAX_CODEPOINT,
+) -> Iterator[Dict]:
+    """yield all Unicode values (of code points start to end).
+
+    Names come from ucd (see unicodes_api.ucd), defaulting to the database
+    selected with Groups.use_ucd and otherwise the interpreter's unicodedata.
+    columns adds optional fields (unicodes_api.intervals.COLUMNS, i.e.
+    "block" and "script") after "tokens".
 
     returns iterator of dictionaries in the following format::
         {
@@ -41,35 +123,30 @@ def iter_unicodes() -> Iterator[Dict]:
             "tokens": ["latin", "small", "letter", "a"],
         }
     """
-    for i in range(0x10FFFF):
-        try:
-            name = unicodedata.name(chr(i))
-        except ValueError:
-            name = ""
+    ucd = ucd or Groups.UCD
+    if ucd:
+        names = ucd.iter_names(start, end)
+    else:
+        names = _iter_unicodedata_names(start, end)
+    extra = [(name, COLUMNS[name](ucd)) for name in columns]
+    for i, name in names:
         if not name and i in ASCII_MAP:
             name = ASCII_MAP[i]["description"]
         if not name:
             continue
-        char = chr(i)
-        hval = str(hex(i)).replace("0x", "")
-        if i < 0xFFFF:
-            pref = f"\\u{hval.zfill(4)}"
-        else:
-            pref = f"\\U{hval.zfill(8)}"
-
-        htmlent = f"&#{i};"
-
-        tokens = [i.lower() for i in " ".join(name.split("-")).split()]
+        dval = {
+            "chr": chr(i),
+            "name": name.lower(),
+            "int": i,
+            "hex": hex_field(i),
+            "python": python_field(i),
+            "html": html_field(i),
+            "tokens": tokenize(name),
+        }
+        for col, index in extra:
+            dval[col] = index.lookup(i)
         try:
-            yield {
-                "chr": char,
-                "name": name.lower(),
-                "int": i,
-                "hex": hval,
-                "python": pref,
-                "html": htmlent,
-                "tokens": tokens,
-            }
+            yield dval
         except UnicodeEncodeError:
             pass
 
@@ -102,16 +179,19 @@ class Pairs:
     def _setup(self):
         """Setup data."""
         vals = {}
-        for key in [self.left, self.right]:
-            for v in self.groups.get_vals(key):
-                name = v["name"]
-                toks = v["tokens"]
-                if any(i in toks for i in self.exclude_tokens):
-                    continue
-                if self.include_tokens and any(i in toks for i in self.include_tokens):
+        with TRACER.span("pairs.setup"):
+            for key in [self.left, self.right]:
+                for v in self.groups.get_vals(key):
+                    name = v["name"]
+                    toks = v["tokens"]
+                    if any(i in toks for i in self.exclude_tokens):
+                        continue
+                    if self.include_tokens and any(
+                        i in toks for i in self.include_tokens
+                    ):
+                        vals[name] = v
+                        continue
                     vals[name] = v
-                    continue
-                vals[name] = v
         return vals
 
     def _pairs(
@@ -140,8 +220,7 @@ class Pairs:
             right = self.vals.get(key2, {})
             if all([left, right]):
                 name = _pname(stub)
-                toks = left["tokens"]
-                toks += right["tokens"]
+                toks = left["tokens"] + right["tokens"]
                 if any(i in toks for i in excludes):
                     continue
                 if includes and not all(i in toks for i in includes):
@@ -151,25 +230,260 @@ class Pairs:
     def pairs(self, includes: list, excludes: list):
         """return sorted pairs."""
         _sort = lambda x: (x[1]["chr"], x[2]["chr"])
-        yield from sorted(self._pairs(includes, excludes), key=_sort)
+        with TRACER.span("pairs.match"):
+            vals = list(self._pairs(includes, excludes))
+        with TRACER.span("pairs.sort"):
+            vals.sort(key=_sort)
+        TRACER.count("pairs.yielded", len(vals))
+        yield from vals
+
+
+class Record(dict):
+    """Index record (see iter_unicodes) storing only "name" and "int".
+
+    "chr", "hex", "python" and "html" are derived from the code point and
+    "tokens" from its ids in Groups.TOKENS on access. The mapping methods
+    (get, in, iteration, keys / items / values, len, ==, dict() and json)
+    see every key in iter_unicodes order, like in a plain record.
+
+    With the unicodedata index this takes the index (tracemalloc) from
+    128MiB to 84MiB, about half of the 171MiB of plain records with token
+    lists.
+    """
+
+    __slots__ = ()
+
+    KEYS = ("chr", "name", "int", "hex", "python", "html", "tokens")
+    """iter_unicodes record keys, in order."""
+    FIELDS = {
+        "chr": chr,
+        "hex": hex_field,
+        "python": python_field,
+        "html": html_field,
+    }  # type: Dict[str, Callable[[int], str]]
+    """derived string field -> function of the code point."""
+    DERIVED = ("chr", "hex", "python", "html", "tokens")
+    """keys computed on access instead of stored."""
+
+    def __missing__(self, key: str) -> Any:
+        """lazily derived fields and "tokens" from the TokenArrays."""
+        if key == "tokens":
+            return Groups.record_tokens(self)
+        try:
+            func = self.FIELDS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return func(dict.__getitem__(self, "int"))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """record[key], default for unknown keys."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: Any) -> bool:
+        """True for stored and derived keys."""
+        return key in self.DERIVED or dict.__contains__(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Keys in iter_unicodes order, then other stored keys."""
+        yield from self.KEYS
+        for key in dict.__iter__(self):
+            if key not in self.KEYS:
+                yield key
+
+    def __len__(self) -> int:
+        """Number of stored and derived keys."""
+        return dict.__len__(self) + len(self.DERIVED)
+
+    def keys(self) -> KeysView:
+        """Stored and derived keys."""
+        return KeysView(self)
+
+    def items(self) -> ItemsView:
+        """(key, value) of stored and derived keys."""
+        return ItemsView(self)
+
+    def values(self) -> ValuesView:
+        """Values of stored and derived keys."""
+        return ValuesView(self)
+
+    def copy(self) -> Dict:
+        """Plain dict with the derived keys."""
+        return dict(self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with the derived keys, like a plain record."""
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self.copy() == dict(other.items())
+
+    def __ne__(self, other: Any) -> bool:
+        """Negation of __eq__."""
+        val = self.__eq__(other)
+        return val if val is NotImplemented else not val
+
+    def __repr__(self) -> str:
+        """repr of the plain dict."""
+        return repr(self.copy())
+
+
+def as_dict(dval: Dict) -> Dict:
+    """Plain dict of a record with its "tokens" (after "html", like iter_unicodes)."""
+    if not isinstance(dval, Record):
+        return dict(dval)
+    return dval.copy()
 
 
 class Groups:
     """Pre built filter for groups of unicode objects."""
 
-    CACHED = {}
-    """Cached iter_unicodes List[Dict]."""
-    TOKENIZED = {}
-    """Cached tokenized dict of set of keys."""
+    CACHED = {}  # type: Dict[int, Dict]
+    """Code point -> Record."""
+    TOKENIZED = {}  # type: Dict[str, Set[int]]
+    """Token -> set of code points (CACHED keys)."""
+    NAMES = {}  # type: Dict[str, int]
+    """Lower case name, alias and ASCII_MAP description -> code point, built on first use."""
+    RECORDS = []  # type: List[Dict]
+    """All iter_unicodes records in code point order, position is the record id."""
+    CODEPOINTS = array("I")
+    """Code point of every record id (ascending, for bisect)."""
+    TOKENS = TokenArrays()
+    """Token ids of every record id."""
+    FACETS = None  # type: Any | Facets
+    """Character property facets of RECORDS, built on first use."""
+    CATALOG = None  # type: Any | GroupCatalog
+    """TOKENIZED groups sorted by name and size, built with TOKENIZED."""
+    LOCK = threading.RLock()
+    """Serializes index builds, so a build in a background thread isn't repeated."""
+    UCD = None  # type: Any
+    """Database the index is built from (unicodes_api.ucd.UCD), None is unicodedata."""
+    INDEXES = {}  # type: Dict[Tuple[str, str], Dict[str, Any]]
+    """index_key() -> index attributes of databases that aren't selected."""
+    INDEX_ATTRS = (
+        "CACHED",
+        "TOKENIZED",
+        "NAMES",
+        "RECORDS",
+        "CODEPOINTS",
+        "TOKENS",
+        "FACETS",
+        "CATALOG",
+    )
+    """Class attributes that make up the index of one database."""
+    PROGRESS = {
+        "phase": "",
+        "phase_start": 0.0,
+        "scanned": 0,
+        "total": 0x10FFFF,
+        "records": 0,
+        "indexed": 0,
+        "tokens": 0,
+    }
+    """Index build progress, readable from other threads while building."""
+
+    @staticmethod
+    def version() -> str:
+        """Unicode version of the selected character database."""
+        return Groups.UCD.version if Groups.UCD else unicodedata.unidata_version
+
+    @staticmethod
+    def index_key() -> Tuple[str, str]:
+        """(Unicode version, UCD directory or "unicodedata") of the selected database."""
+        source = str(Groups.UCD.path) if Groups.UCD else "unicodedata"
+        return Groups.version(), source
+
+    @staticmethod
+    def use_ucd(ucd: Any = None):
+        """Select the character database (None: unicodedata) for all Groups.
+
+        Indexes are kept per database (version and source, see index_key),
+        switching back to one that was already built doesn't rebuild it.
+        """
+        with Groups.LOCK:
+            Groups.INDEXES[Groups.index_key()] = {
+                i: getattr(Groups, i) for i in Groups.INDEX_ATTRS
+            }
+            Groups.UCD = ucd
+            index = Groups.INDEXES.pop(Groups.index_key(), None)
+            if index:
+                for key, val in index.items():
+                    setattr(Groups, key, val)
+            else:
+                Groups.CACHED, Groups.TOKENIZED, Groups.NAMES = {}, {}, {}
+                Groups.RECORDS, Groups.CODEPOINTS = [], array("I")
+                Groups.TOKENS = TokenArrays()
+                Groups.FACETS = Groups.CATALOG = None
+
+    @staticmethod
+    def reset():
+        """Drop the index of the selected database, the next use rebuilds it."""
+        with Groups.LOCK:
+            Groups.CACHED.clear()
+            Groups.TOKENIZED.clear()
+            Groups.NAMES.clear()
+            del Groups.RECORDS[:]
+            del Groups.CODEPOINTS[:]
+            Groups.TOKENS.clear()
+            Groups.FACETS = Groups.CATALOG = None
+
+    @staticmethod
+    def _set_phase(phase: str):
+        """Start a new build phase."""
+        Groups.PROGRESS["phase"] = phase
+        Groups.PROGRESS["phase_start"] = time.monotonic()
+
+    @staticmethod
+    def progress_text() -> str:
+        """Human readable index build progress with an ETA."""
+        prog = Groups.PROGRESS
+        elapsed = time.monotonic() - prog["phase_start"]
+        if prog["phase"] == "scanning":
+            done, total = prog["scanned"], prog["total"]
+        elif prog["phase"] == "tokenizing":
+            done, total = prog["indexed"], prog["records"]
+        else:
+            return "Building index..."
+        eta = elapsed * (total - done) / done if done else 0.0
+        return (
+            f"Building index ({prog['phase']}): "
+            f"codepoints scanned {prog['scanned']}/{prog['total']} "
+            f"records {prog['records']} indexed {prog['indexed']} "
+            f"tokens {prog['tokens']} eta {eta:.1f}s"
+        )
 
     @staticmethod
     def _make_cache():
         """Make cache."""
-        if Groups.CACHED:
-            return
-        for dval in iter_unicodes():
-            key = tuple(dval["tokens"])
-            Groups.CACHED[key] = dval
+        with Groups.LOCK:
+            if Groups.CACHED:
+                return
+            Groups._set_phase("scanning")
+            prog = Groups.PROGRESS
+            cached = {}
+            records = []
+            tokens = TokenArrays()
+            with TRACER.span("groups.iter_unicodes"):
+                for dval in iter_unicodes():
+                    tokens.append(dval["tokens"])
+                    dval = Record(name=dval["name"], int=dval["int"])
+                    cached[dval["int"]] = dval
+                    records.append(dval)
+                    prog["scanned"] = dval["int"]
+            prog["scanned"] = prog["total"]
+            prog["records"] = len(cached)
+            Groups.RECORDS[:] = records
+            Groups.CODEPOINTS[:] = array("I", (i["int"] for i in records))
+            Groups.TOKENS = tokens
+            Groups.CACHED.update(cached)
+        TRACER.count("groups.records", len(Groups.CACHED))
+
+    def make_records(self) -> Dict[int, Dict]:
+        """Make the code point -> record index (see CACHED)."""
+        if not Groups.CACHED:
+            self._make_cache()
+        return Groups.CACHED
 
     def make_tokenized(self):
         """Make tokenized data."""
@@ -177,38 +491,279 @@ class Groups:
         if Groups.TOKENIZED:
             return
 
-        if not Groups.CACHED:
-            self._make_cache()
+        with Groups.LOCK:
+            if Groups.TOKENIZED:
+                return
+            if not Groups.CACHED:
+                self._make_cache()
+            self._set_phase("tokenizing")
+            prog = Groups.PROGRESS
+            tokenized = {}  # type: Dict[str, Set]
+            with TRACER.span("groups.make_tokenized"):
+                postings = {}  # type: Dict[int, Set[int]]
+                ids, offsets = Groups.TOKENS.ids, Groups.TOKENS.offsets
+                for rid, dval in enumerate(Groups.RECORDS):
+                    key = dval["int"]
+                    for tid in ids[offsets[rid] : offsets[rid + 1]]:
+                        keys = postings.get(tid)
+                        if keys is None:
+                            keys = postings[tid] = set()
+                        keys.add(key)
+                    prog["indexed"] = rid
+                vocab = Groups.TOKENS.vocab.tokens
+                for tid, keys in postings.items():
+                    if len(keys) < 3:
+                        continue
+                    token = vocab[tid]
+                    try:
+                        int(token)
+                        continue
+                    except ValueError:
+                        pass
+                    tokenized[token] = keys
+            prog["indexed"] = len(self.CACHED)
+            prog["tokens"] = len(tokenized)
+            # before TOKENIZED, which marks the index as built
+            Groups.CATALOG = GroupCatalog(tokenized)
+            self._set_phase("done")
+            Groups.TOKENIZED.update(tokenized)
+        TRACER.count("groups.tokens", len(Groups.TOKENIZED))
+        if TRACER.enabled:
+            for keys in Groups.TOKENIZED.values():
+                TRACER.observe("groups.postings", len(keys))
+
+    def make_facets(self) -> Facets:
+        """Make the character property facets (category, block, script ...)."""
+        if Groups.FACETS is not None:
+            return Groups.FACETS
+        with Groups.LOCK:
+            if Groups.FACETS is None:
+                if not Groups.CACHED:
+                    self._make_cache()
+                Groups.FACETS = Facets(Groups.CODEPOINTS, Groups.UCD)
+        return Groups.FACETS
 
-        for key in self.CACHED:
-            for token in key:
-                Groups.TOKENIZED.setdefault(token, set())
-                Groups.TOKENIZED[token].add(key)
-        tkeys = list(Groups.TOKENIZED.keys())
-        for token in tkeys:
-            try:
-                int(token)
-                del Groups.TOKENIZED[token]
-                continue
-            except ValueError:
-                pass
-            if len(Groups.TOKENIZED[token]) < 3:
-                del Groups.TOKENIZED[token]
+    @staticmethod
+    def record_tokens(dval: Dict) -> List[str]:
+        """Token strings of a record, from TOKENS if it is in the index."""
+        rid = Groups.record_id(dval["int"])
+        if rid >= 0 and Groups.RECORDS[rid] is dval:
+            return Groups.TOKENS.strings(rid)
+        return tokenize(dval["name"])
+
+    @staticmethod
+    def record_id(cp: int) -> int:
+        """Record id (RECORDS position) of a code point, -1 if it has no record."""
+        idx = bisect.bisect_left(Groups.CODEPOINTS, cp)
+        if idx < len(Groups.CODEPOINTS) and Groups.CODEPOINTS[idx] == cp:
+            return idx
+        return -1
+
+    def make_names(self) -> Dict[str, int]:
+        """Make the name lookup table (see NAMES)."""
+        if Groups.NAMES:
+            return Groups.NAMES
+        with Groups.LOCK:
+            if Groups.NAMES:
+                return Groups.NAMES
+            if not Groups.CACHED:
+                self._make_cache()
+            names = {}  # type: Dict[str, int]
+            with TRACER.span("groups.make_names"):
+                for cp, dval in Groups.CACHED.items():
+                    names.setdefault(dval["name"], cp)
+                aliases = Groups.UCD.aliases if Groups.UCD else {}
+                for cp, vals in aliases.items():
+                    if cp in Groups.CACHED:
+                        for val in vals:
+                            names.setdefault(val.lower(), cp)
+                for cp, aval in ASCII_MAP.items():
+                    for part in re.split(r" :: |,", aval["description"]):
+                        part = part.strip().lower()
+                        # single characters are looked up as characters
+                        if len(part) > 1:
+                            names.setdefault(part, cp)
+            Groups.NAMES.update(names)
+        return Groups.NAMES
+
+    def resolve(self, identifier: Any) -> int:
+        """Code point of an identifier, -1 if it isn't known.
+
+        identifier is an int code point, a single character, an exact name,
+        alias or ASCII_MAP description (case insensitive), a U+XXXX, 0xXXXX,
+        \\uXXXX, \\UXXXXXXXX, &#N; or &#xXXXX; escape or a bare hex value.
+        """
+        if isinstance(identifier, int):
+            cp = identifier
+        elif len(identifier) == 1:
+            cp = ord(identifier)
+        else:
+            ident = identifier.strip().lower()
+            names = self.make_names()
+            if ident in names:
+                return names[ident]
+            match = CODEPOINT_RE.match(ident)
+            if match:
+                cp = int(match.group(1), 16) if match.group(1) else int(match.group(2))
+            else:
+                try:
+                    # aliases and named sequences unicodedata knows about
+                    char = unicodedata.lookup(ident)
+                except KeyError:
+                    return -1
+                if len(char) != 1:
+                    return -1
+                cp = ord(char)
+        if cp not in Groups.CACHED:
+            if not Groups.CACHED:
+                self._make_cache()
+            if cp not in Groups.CACHED:
+                return -1
+        return cp
+
+    def get(self, identifier: Any, default: Any = None) -> Any:
+        """Record of an identifier (see resolve), default if it isn't known."""
+        return Groups.CACHED.get(self.resolve(identifier), default)
+
+    def get_many(self, identifiers: Iterable[Any]) -> List[Any]:
+        """Records of many identifiers (see resolve), None for unknown ones."""
+        self.make_names()
+        cached = Groups.CACHED
+        resolve = self.resolve
+        return [cached.get(resolve(i)) for i in identifiers]
+
+    def range(
+        self, start: int, end: int, facets: Dict[str, List[str]] = None
+    ) -> Iterator[Dict]:
+        """yield the records of code points start to end (inclusive), in order.
+
+        With the index built the range is found with bisect on CODEPOINTS,
+        otherwise records are generated for the range only. facets narrow
+        the result like in grouping (and build the index).
+        """
+        allowed = self.make_facets().resolve_all(facets) if facets else {}
+        if not Groups.CACHED:
+            yield from iter_unicodes(start=start, end=end)
+            return
+        lo = bisect.bisect_left(Groups.CODEPOINTS, start)
+        hi = bisect.bisect_right(Groups.CODEPOINTS, end, lo)
+        TRACER.count("groups.range", hi - lo)
+        records = Groups.RECORDS
+        if not allowed:
+            for rid in range(lo, hi):
+                yield records[rid]
+            return
+        for rid in Groups.FACETS.record_ids(allowed, lo):
+            if rid >= hi:
+                return
+            yield records[rid]
 
     def grouping(
         self,
         include_tokens: list,
         exclude_tokens: list = None,
+        facets: Dict[str, List[str]] = None,
     ):
-        """Group token values."""
-        self.make_tokenized()
+        """Group token values.
+
+        facets ({"category": ["Sc"], "block": ["arabic"]}, see
+        unicodes_api.facets) narrow the result to records having one of the
+        values of every facet. Without include_tokens all records matching
+        the facets are yielded, in code point order.
+        """
         exclude_tokens = exclude_tokens or []
-        includes = [self.TOKENIZED[i] for i in include_tokens]
+        if include_tokens or exclude_tokens:
+            self.make_tokenized()
         excludes = [self.TOKENIZED[i] for i in exclude_tokens]
+        allowed = self.make_facets().resolve_all(facets) if facets else {}
+        if not include_tokens and allowed:
+            for rid in self.FACETS.record_ids(allowed):
+                dval = self.RECORDS[rid]
+                if not any(dval["int"] in i for i in excludes):
+                    yield dval
+            return
+        for i in self._token_matches(include_tokens, excludes):
+            dval = self.CACHED[i]
+            if allowed and not self.FACETS.matches(
+                self.record_id(dval["int"]), allowed
+            ):
+                continue
+            yield dval
+
+    def _token_matches(self, include_tokens: list, excludes: List[Set]) -> Set[int]:
+        """Code points having all include_tokens and none of the excludes sets."""
+        includes = [self.TOKENIZED[i] for i in include_tokens]
         _inc = set.intersection(*includes)
         _inc.difference_update(*excludes)
-        for i in _inc:
-            yield self.CACHED[i]
+        return _inc
+
+    def _seek_postings(
+        self,
+        include_tokens: list,
+        excludes: List[Set],
+        allowed: Dict,
+        start: int,
+        end: int,
+    ) -> Iterator[Dict]:
+        """yield records of start to end having all include_tokens, in code point order."""
+        includes = [self.TOKENIZED[i] for i in include_tokens]
+        smallest = min(include_tokens, key=lambda x: len(self.TOKENIZED[x]))
+        postings = self.make_catalog().postings(smallest)
+        lo = bisect.bisect_left(postings, start)
+        hi = bisect.bisect_right(postings, end, lo)
+        cached = self.CACHED
+        for idx in range(lo, hi):
+            cp = postings[idx]
+            if not all(cp in i for i in includes) or any(cp in i for i in excludes):
+                continue
+            if allowed and not self.FACETS.matches(self.record_id(cp), allowed):
+                continue
+            yield cached[cp]
+
+    def page(
+        self,
+        include_tokens: list = None,
+        exclude_tokens: list = None,
+        facets: Dict[str, List[str]] = None,
+        limit: int = PAGE_SIZE,
+        after: str = None,
+        start: int = 0,
+        end: int = MAX_CODEPOINT,
+        predicate: Callable[[Dict], bool] = None,
+    ) -> Page:
+        """Code point ordered page of grouping results (all records without tokens).
+
+        after is the cursor of the previous page (Page.cursor), start / end
+        limit the code point range and predicate filters the records. Only
+        the records after the cursor are looked at and at most limit + 1 are
+        kept, earlier pages aren't recomputed: token queries seek the cursor
+        in the sorted postings of the smallest include token (see
+        GroupCatalog.postings) and stop after limit + 1 matches. Raises
+        ValueError for invalid cursors, KeyError for unknown tokens or facet
+        values.
+        """
+        version = self.version()
+        if after:
+            start = max(start, decode_cursor(after, version) + 1)
+        exclude_tokens = exclude_tokens or []
+        if include_tokens or exclude_tokens:
+            self.make_tokenized()
+        excludes = [self.TOKENIZED[i] for i in exclude_tokens]
+        if include_tokens:
+            allowed = self.make_facets().resolve_all(facets) if facets else {}
+            records = self._seek_postings(include_tokens, excludes, allowed, start, end)
+            if predicate:
+                records = (i for i in records if predicate(i))
+        else:
+            records = self.range(start, end, facets)
+            if excludes:
+                records = (
+                    i for i in records if not any(i["int"] in j for j in excludes)
+                )
+            if predicate:
+                records = (i for i in records if predicate(i))
+        with TRACER.span("groups.page"):
+            return paginate(records, limit, version)
 
     def get_vals(self, token) -> Iterator[Dict]:
         """Get dictionary values for token."""
@@ -216,23 +771,36 @@ class Groups:
         for key in self.TOKENIZED[token]:
             yield self.CACHED[key]
 
+    def make_catalog(self) -> GroupCatalog:
+        """Make the token index and its group catalog."""
+        self.make_tokenized()
+        return Groups.CATALOG
+
+    def group_records(self, token: str) -> Iterator[Dict]:
+        """yield the records of a group in code point order."""
+        cached = Groups.CACHED
+        for key in sorted(Groups.TOKENIZED[token]):
+            yield cached[key]
+
+    def iter_groups(
+        self, order: str = "name", limit: Any = None
+    ) -> Iterator[Tuple[str, Iterator[Dict]]]:
+        """yield (token, records iterator) of the first limit groups in order.
+
+        order is "name" or "size" (see unicodes_api.catalog.ORDERS), records
+        are only looked up when a group's iterator is consumed.
+        """
+        for token in self.make_catalog().tokens(order, limit):
+            yield token, self.group_records(token)
+
     def iter_all_groups(self) -> Iterator[Tuple[str, List[Dict]]]:
         """Iterate through all groups."""
-        self.make_tokenized()
-        for tup in sorted(self.TOKENIZED.items()):
-            token = tup[0]  # type: str
-            tset = tup[1]  # type: Set
-            tsets = [self.CACHED[i] for i in tset]
-            yield token, tsets
-
-    def group_names(self) -> Iterator[Tuple[str, int]]:
-        """Iterate through group names."""
-        self.make_tokenized()
-        groups = []
-        for token, keys in self.TOKENIZED.items():
-            groups.append((len(keys), token))
-        for tlen, token in sorted(groups, reverse=True):
-            yield token, tlen
+        for token, records in self.iter_groups():
+            yield token, list(records)
+
+    def group_names(self, limit: Any = None) -> Iterator[Tuple[str, int]]:
+        """Iterate through group names, largest first, the first limit (all with None)."""
+        yield from self.make_catalog().sizes("size", limit)
 
 
 class LetterMixer:
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Token groups sorted by name and by size.
+
+The catalog is built once with the token index (Groups.make_tokenized),
+listing the biggest groups or walking all groups in name order is then a
+slice of a pre-sorted list instead of a sort of every group per call.
+Code point ordered postings of a token are sorted on first use, for
+cursor seeks in Groups.page.
+"""
+from typing import Any, Dict, Iterator, List, Set, Tuple
+from array import array
+from unicodes_api.trace import TRACER
+
+# pylint: disable=invalid-name
+
+ORDERS = ("size", "name")
+"""catalog orders, size is largest first (ties by token, descending)."""
+
+
+class GroupCatalog:
+    """Pre-sorted token group names of a token index."""
+
+    def __init__(self, tokenized: Dict[str, Set[int]]):
+        """initialize GroupCatalog, tokenized is token -> code points (Groups.TOKENIZED)."""
+        self.tokenized = tokenized
+        """token -> code points."""
+        with TRACER.span("catalog.build"):
+            self.by_name = sorted(tokenized)  # type: List[str]
+            """tokens in name order."""
+            self.by_size = sorted(
+                self.by_name, key=lambda x: (len(tokenized[x]), x), reverse=True
+            )  # type: List[str]
+            """tokens largest group first, like heapq.nlargest on (size, token)."""
+        self._postings = {}  # type: Dict[str, array]
+        """token -> ascending code points, built on first use."""
+
+    def __len__(self):
+        """Number of token groups."""
+        return len(self.by_name)
+
+    def tokens(self, order: str = "size", limit: Any = None) -> List[str]:
+        """First limit (all with None) tokens in order (see ORDERS)."""
+        if order not in ORDERS:
+            raise ValueError(f"Unknown order: {order}")
+        tokens = self.by_size if order == "size" else self.by_name
+        return tokens[:limit]
+
+    def postings(self, token: str) -> array:
+        """Code points of token in ascending order, raises KeyError for unknown tokens."""
+        keys = self._postings.get(token)
+        if keys is None:
+            keys = self._postings[token] = array("I", sorted(self.tokenized[token]))
+        return keys
+
+    def sizes(
+        self, order: str = "size", limit: Any = None
+    ) -> Iterator[Tuple[str, int]]:
+        """yield (token, group size) of the first limit tokens in order."""
+        tokenized = self.tokenized
+        for token in self.tokens(order, limit):
+            yield token, len(tokenized[token])
@@ -2,18 +2,43 @@
 # -*- coding: utf-8 -*-
 """Cli Commands Module."""
 import sys
+import itertools
 import json
 import textwrap
-from typing import Dict, Iterator, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 from argparse import ArgumentParser
 import curses
 from unicodes_api.screen import (
     BidirectionalNewIterator,
     BidirectionalStaticRevolvingIterator,
     NavItem,
+    CTRL_MAP,
 )
-from unicodes_api import Groups, iter_unicodes, LetterMixer, PairsGroups
-from unicodes_api.parser import Formatter
+from unicodes_api import (
+    Groups,
+    iter_unicodes,
+    LetterMixer,
+    Pairs,
+    PairsGroups,
+    MAX_CODEPOINT,
+    as_dict,
+    parse_range,
+)
+from unicodes_api.paging import PAGE_SIZE
+from unicodes_api.catalog import ORDERS as GROUP_ORDERS
+from unicodes_api.escape import (
+    Escaper,
+    Unescaper,
+    UnescapeError,
+    select_codepoints,
+    ERRORS as ESCAPE_ERRORS,
+    MODES as ESCAPE_MODES,
+)
+from unicodes_api.memstats import memory_report
+from unicodes_api.lru import LRUCache
+from unicodes_api.search import TokenSearch
+from unicodes_api.parser import Formatter, SEP
+from unicodes_api.trace import TRACER
 
 # pylint: disable=invalid-name,too-many-instance-attributes
 # pylint: disable=arguments-differ
@@ -25,6 +50,10 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
 
     NAME = "explore"
     """subcommand name."""
+    CACHE_SIZE = 32
+    """number of tokens / wrapped blocks kept in the caches."""
+    PREFETCH_MAX = 5000
+    """neighbouring groups with more characters aren't prefetched."""
 
     def __init__(self):
         super().__init__()
@@ -39,20 +68,25 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
         """Supplemental text messages."""
         self.index = 0
         """current value location."""
+        self.details = LRUCache(self.CACHE_SIZE)
+        """token -> sorted detail array, detail lines formatted so far and chr -> index."""
+        self.blocks = LRUCache(self.CACHE_SIZE)
+        """(token, width) -> wrapped character block."""
+        self.searcher = TokenSearch([])
+        """incremental token search."""
+        self.search_query = None  # type: Any | str
+        """current search query, None when not searching."""
+        self.search_results = []  # type: List[int]
+        """collection indexes matching search_query."""
 
     def setup_popts(self):
         """setup parser options."""
 
     def mouse_callback(self, value: Dict[str, str]):
         """mouse callback function."""
-        char = value["word"]
-        if not char.strip():
+        pos = self._token_details(self.cur_token)["pos"].get(value["word"].strip())
+        if pos is None:
             return
-        pos = self.highlight_pos
-        for idx, i in enumerate(self.detail_arr):
-            if i["chr"] == char:
-                pos = idx
-                break
         self.highlight_pos = pos
         self._dowrite()
 
@@ -63,6 +97,8 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
     def setup(self):
         """Scroll through all unicodes token groups."""
         super().setup([])
+        self.highlight_pos = 0
+        self.is_detail = False
         self.nav.values[ord("n")].add_callback(self._reset_hightlight).add_alias(
             ord("j")
         )
@@ -72,7 +108,7 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
         self.nav.add_item(
             NavItem(
                 "s",
-                "search start text",
+                "search (enter: accept, esc: cancel, up/down: cycle matches)",
             )
             .set_func(self.search)
             .add_callback(self._reset_hightlight),
@@ -105,9 +141,20 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
                 "toggle mouse interaction",
             ).set_func(self.toggle_mouse),
         )
-        for token, vals in self.gobj.iter_all_groups():
-            fmt_line = " ".join(sorted(i["chr"] for i in vals))
-            self.collection.append(f"{token} {fmt_line}")
+
+    def load(self):
+        """Build the index (background thread)."""
+        self.gobj.make_tokenized()
+
+    def ready(self):
+        """Index is built, fill the collection."""
+        # only token names, a group is formatted when it is displayed
+        self.collection.extend(self.gobj.make_catalog().by_name)
+        self.searcher = TokenSearch(self.collection)
+
+    def progress_text(self) -> str:
+        """Index build progress."""
+        return Groups.progress_text()
 
     def shift_left(self):
         """Shift highlight position left."""
@@ -125,13 +172,78 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
     @property
     def cur_token(self):
         """Current token."""
-        return self.current_value.split()[0]
+        return self.collection[self.index]
+
+    def _prefetch(self):
+        """Warm the caches for the neighbouring groups (up to PREFETCH_MAX characters)."""
+        if not self.collection:
+            return
+        width = max(self.width - 40, 20)
+        cur = self.index
+        try:
+            for idx in (cur + 1, cur - 1):
+                self.index = idx % len(self.collection)
+                if len(self.gobj.TOKENIZED[self.cur_token]) <= self.PREFETCH_MAX:
+                    self.char_block(width)
+        finally:
+            self.index = cur
+
+    def idle(self):
+        """No keypress is pending, prefetch the neighbouring groups."""
+        if self.loaded:
+            self._prefetch()
+
+    def _token_details(self, token: str) -> Dict[str, Any]:
+        """Cached detail data for token."""
+
+        def _make():
+            arr = sorted(self.gobj.get_vals(token), key=lambda x: x["chr"])
+            pos = {}  # type: Dict[str, int]
+            for idx, i in enumerate(arr):
+                # as clicked on screen, see FrameRenderer.build_row
+                pos.setdefault(i["chr"], idx)
+                pos.setdefault(i["chr"].replace("\0", "NULL").translate(CTRL_MAP), idx)
+            return {
+                "arr": arr,
+                "lines": [],
+                "pos": pos,
+            }
+
+        return self.details.get(token, _make)
 
     @property
-    def detail_arr(self):
+    def detail_arr(self) -> List[Dict]:
         """Current detail array."""
-        vals = list(sorted(self.gobj.get_vals(self.cur_token), key=lambda x: x["chr"]))
-        return vals
+        return self._token_details(self.cur_token)["arr"]
+
+    def iter_detail_lines(self) -> Iterator[str]:
+        """Current detail lines ordered by code point.
+
+        A line is formatted when it is first consumed and kept for the
+        following redraws.
+        """
+        token = self.cur_token
+        lines = self._token_details(token)["lines"]
+        cached = Groups.CACHED
+        postings = self.gobj.make_catalog().postings(token)
+        for idx, cp in enumerate(postings):
+            if idx == len(lines):
+                lines.append(f"    {Formatter.fmt_single_normal(cached[cp])}")
+            yield lines[idx]
+
+    def char_block(self, width: int) -> str:
+        """Current characters wrapped to width."""
+
+        def _make():
+            main = "\n".join(
+                textwrap.wrap(
+                    " ".join(i["chr"] for i in self.detail_arr),
+                    width=width,
+                )
+            )
+            return textwrap.indent(main, " " * 2)
+
+        return self.blocks.get((self.cur_token, width), _make)
 
     @property
     def cur_detail(self):
@@ -144,48 +256,47 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
         return self.cur_detail["chr"]
 
     @property
-    def _detail_lines(self):
-        """Detail lines."""
+    def _detail_lines(self) -> Iterator[str]:
+        """Detail lines, all details are formatted lazily as they are displayed."""
         if self.is_detail:
             self.highlight_vals = []
-            return Formatter.fmt_group_multi_detail("Details:", self.detail_arr)
-        self.highlight_vals = [self.cur_char]
-        return "\n".join(
-            [
-                "Details:",
-                Formatter.fmt_single_normal(self.cur_detail),
-            ]
-        )
-
-    def _print_menu(self):
-        """menu output."""
-
-        disp_lines = [self.cur_token]
-        setwidth = max(self.width - 40, 20)
-
-        main = "\n".join(
-            textwrap.wrap(
-                " ".join(i["chr"] for i in self.detail_arr),
-                width=setwidth,
-            )
-        )
-        main = textwrap.indent(main, " " * 2)
-        disp_lines += [main]
-
-        output = [
+            lines = self.iter_detail_lines()
+        else:
+            self.highlight_vals = [self.cur_char]
+            lines = iter([Formatter.fmt_single_normal(self.cur_detail)])
+        return itertools.chain(["Details:"], lines)
+
+    def _iter_menu(self) -> Iterator[str]:
+        """menu output lines."""
+        main = self.char_block(max(self.width - 40, 20))
+        txt, self.txt = self.txt, []
+        # order is important here, _detail_lines sets the highlight values
+        detail_lines = self._detail_lines
+        header = [
             f"index:{self.index} cur_pos:{self.highlight_pos} mouse_enabled:{self.is_mouse}",
             "",
-            "\n".join(disp_lines),
+            self.cur_token,
+            main,
             "",
-            self._detail_lines,
+        ]
+        if self.search_query is not None:
+            header.insert(1, self._search_line())
+        footer = [
             "",
-            "\n".join(self.txt),
+            "\n".join(txt),
             "",
             self.nav.get_menu_text(),
         ]
-        lout = "\n".join(output).replace("\0", "NULL")
-        self.txt = []
-        return lout
+        # not a generator, the highlight values must be set before drawing starts
+        return (
+            line
+            for block in itertools.chain(header, detail_lines, footer)
+            for line in block.replace("\0", "NULL").split("\n")
+        )
+
+    def _print_menu(self):
+        """menu output."""
+        return "\n".join(self._iter_menu())
 
     def toggle_detail(self):
         """toggle detail switch."""
@@ -194,14 +305,59 @@ class InteractAllGroups(BidirectionalStaticRevolvingIterator):
         else:
             self.is_detail = True
 
+    def _search_line(self) -> str:
+        """Search prompt and the first few matches."""
+        tokens = self.searcher.tokens
+        preview = " ".join(tokens[i] for i in self.search_results[:10])
+        more = "..." if len(self.search_results) > 10 else ""
+        return (
+            f"search: {self.search_query}_ "
+            f"({len(self.search_results)} matches) {preview}{more}"
+        )
+
     def search(self):
-        """get search results."""
-        kp = self.get_input("Search string")
-        for idx, line in enumerate(self.collection):
-            if line.lower().startswith(kp):
-                self.index = idx
-                return
-        self.txt.append(f"Could not find anything starting with: '{kp}'")
+        """Incremental search, narrows the matches on every keystroke."""
+        start = self.index
+        query = ""
+        sel = 0
+        self.search_query = query
+        self.search_results = []
+        try:
+            while True:
+                if self._resize_pending:
+                    self.resize()
+                self._dowrite()
+                kp = self.getch()
+                if kp == curses.KEY_RESIZE:
+                    self.request_resize()
+                    continue
+                if kp in (curses.KEY_ENTER, 10, 13):
+                    break
+                if kp == 27:
+                    self.index = start
+                    break
+                if kp in (curses.KEY_DOWN, 14):
+                    sel += 1
+                elif kp in (curses.KEY_UP, 16):
+                    sel -= 1
+                elif kp in (curses.KEY_BACKSPACE, 127, 8):
+                    query, sel = query[:-1], 0
+                elif 32 <= kp <= 0x10FFFF and chr(kp).isprintable():
+                    query, sel = query + chr(kp), 0
+                else:
+                    continue
+                self.search_query = query
+                self.search_results = self.searcher.search(query)
+                if self.search_results:
+                    sel %= len(self.search_results)
+                    self.index = self.search_results[sel]
+                else:
+                    self.index = start
+        finally:
+            if query and not self.search_results:
+                self.txt.append(f"Could not find anything matching: '{query}'")
+            self.search_query = None
+            self.search_results = []
 
 
 class all_to_stdout(Formatter):
@@ -214,19 +370,63 @@ class all_to_stdout(Formatter):
         """setup parser options."""
         self.popts.add_filter()
         self.popts.add_exclude()
+        self.popts.add_facets()
+        self.popts.add_range()
+        self.popts.add_paging()
+        self.popts.add_columns()
         self.popts.add_json()
 
     def setup(self):
         """Setup iterator."""
         super().setup(iter_unicodes())
 
+    def _page(self, groups: Groups, facets: Dict[str, List[str]]) -> Any:
+        """Requested page, code point ordered."""
+        start, end = 0, MAX_CODEPOINT
+        limit = self.args.limit or PAGE_SIZE
+        try:
+            if self.args.range:
+                start, end = parse_range(self.args.range)
+            return groups.page(
+                facets=facets,
+                limit=limit,
+                after=self.args.after,
+                start=start,
+                end=end,
+                predicate=self.name_filter,
+            )
+        except ValueError as err:
+            raise SystemExit(err.args[0]) from err
+
     def run(self):
         """Run program."""
+        facets = self.facet_filters()
+        groups = Groups()
+        if facets:
+            try:
+                groups.make_facets().resolve_all(facets)
+            except KeyError as err:
+                raise SystemExit(err.args[0]) from err
+            self._iterator = groups.grouping([], facets=facets)
+        page = None
+        if self.args.limit or self.args.after:
+            page = self._page(groups, facets)
+            self._iterator = iter(page.records)
+        elif self.args.range:
+            try:
+                start, end = parse_range(self.args.range)
+            except ValueError as err:
+                raise SystemExit(err.args[0]) from err
+            self._iterator = groups.range(start, end, facets=facets)
         if self.args.json:
             itervals = self.fmt_json()
         else:
             itervals = self.fmt_group_normal()
-        sys.stdout.write("%s\n" % "\n".join(itervals))
+        with TRACER.span("all.format"):
+            out = "\n".join(itervals)
+        sys.stdout.write("%s\n" % out)
+        if page and page.cursor:
+            sys.stderr.write(f"next page: --after {page.cursor}\n")
 
 
 class HackerMixerInteractive(BidirectionalNewIterator):
@@ -244,12 +444,6 @@ class HackerMixerInteractive(BidirectionalNewIterator):
         """Scroll through all Variations of a word with mixed unicode values for letters."""
         self.seen = set()
         """keep track of what's been seen."""
-        self.mixer = LetterMixer()
-        """Main mixer class."""
-        self.alphabet_dict = self.mixer.alphabet_dict
-        """main alphabet dict."""
-        self.object_dict = self.mixer.object_dict
-        """letter object dictionary map."""
         # Unset scroll values, we're going to reuse them
         try:
             del self.nav.values[curses.KEY_UP]
@@ -261,8 +455,6 @@ class HackerMixerInteractive(BidirectionalNewIterator):
         # order is important here
         super().setup()
 
-        self.let_idx = self._get_lpos()
-        """letter index."""
         self.nav.add_item(
             NavItem(
                 "n",
@@ -315,6 +507,19 @@ class HackerMixerInteractive(BidirectionalNewIterator):
         )
         self.is_mouse = False
 
+    def load(self):
+        """Build the letter mixer (background thread)."""
+        self.mixer = LetterMixer()
+        """Main mixer class."""
+        self.alphabet_dict = self.mixer.alphabet_dict
+        """main alphabet dict."""
+        self.object_dict = self.mixer.object_dict
+        """letter object dictionary map."""
+
+    def progress_text(self) -> str:
+        """Index build progress."""
+        return Groups.progress_text()
+
     def set_word(self, word: str):
         """Set word."""
         self.word = word
@@ -423,6 +628,7 @@ class HackerMixerInteractive(BidirectionalNewIterator):
         self.index += 1
 
         self.let_idx = self._get_lpos()
+        """letter index."""
 
     def prev(self):
         """go to previous collection value."""
@@ -520,8 +726,8 @@ class PairsDisplay(Formatter):
             title = " ".join(list(basename) + [name])
             retval.setdefault(title, {})
             retval[title]["pair"] = [left["chr"], right["chr"]]
-            retval[title]["p1"] = left
-            retval[title]["p2"] = right
+            retval[title]["p1"] = as_dict(left)
+            retval[title]["p2"] = as_dict(right)
         yield json.dumps(retval)
 
     @staticmethod
@@ -561,7 +767,293 @@ class PairsDisplay(Formatter):
             itervals = self.output_lines(_iter, True)
         else:
             itervals = self.output_lines(_iter)
-        sys.stdout.write("%s\n" % "\n".join(itervals))
+        with TRACER.span("pairs.format"):
+            out = "\n".join(itervals)
+        sys.stdout.write("%s\n" % out)
+
+
+class LookupDisplay(Formatter):
+    """Look up characters by code point, character, hex, escape or name."""
+
+    NAME = "lookup"
+    """subcommand name."""
+    CHUNK = 4096
+    """identifiers resolved per batch."""
+
+    def __init__(self):
+        """initialize LookupDisplay class."""
+        self.identifiers = []  # type: List[str]
+        """identifiers given on the command line, stdin is read without."""
+        self.missing = 0
+        """number of identifiers that couldn't be resolved."""
+        super().__init__()
+
+    def setup_popts(self):
+        """setup parser values."""
+        self.popts.add_columns()
+        self.popts.add_json()
+
+    def setup(self, *identifiers):
+        """Setup identifiers (i.e. U+2571 "latin small letter a" 0x41 &#945;)."""
+        self.identifiers = list(identifiers)
+
+    def _records(self) -> Iterator[Dict]:
+        """Resolve the identifiers in batches, reporting unknown ones to stderr."""
+        if self.identifiers:
+            idents = iter(self.identifiers)  # type: Iterator[str]
+        else:
+            idents = (i.rstrip("\r\n") for i in sys.stdin)
+            idents = (i for i in idents if i)
+        groups = Groups()
+        self.missing = 0
+        for chunk in iter(lambda: list(itertools.islice(idents, self.CHUNK)), []):
+            for ident, dval in zip(chunk, groups.get_many(chunk)):
+                if dval is None:
+                    self.missing += 1
+                    sys.stderr.write(f"not found: {ident}\n")
+                    continue
+                yield dval
+
+    def run(self):
+        """Run program."""
+        self._iterator = self._records()
+        if self.args.json:
+            itervals = self.fmt_json()
+        else:
+            itervals = self.fmt_group_normal()
+        with TRACER.span("lookup.format"):
+            for line in itervals:
+                sys.stdout.write(f"{line}\n")
+        if self.missing:
+            raise SystemExit(1)
+
+
+class GroupsDisplay(Formatter):
+    """List token groups, largest or by name, optionally with their characters."""
+
+    NAME = "groups"
+    """subcommand name."""
+
+    def setup_popts(self):
+        """setup parser values."""
+        parser = self.popts.parser  # type: ArgumentParser
+        parser.add_argument(
+            "--limit",
+            "-n",
+            type=int,
+            default=None,
+            help="number of groups to show (default: all)",
+        )
+        parser.add_argument(
+            "--sort",
+            "-s",
+            choices=GROUP_ORDERS,
+            default="size",
+            help="group order, size is largest first",
+        )
+        self.popts.add_details()
+        self.popts.add_json()
+
+    def setup(self):
+        """Setup iterator."""
+
+    def _json(self, groups: Groups, sizes: Iterator[Tuple[str, int]]) -> str:
+        """Groups as json."""
+        out = []
+        for token, count in sizes:
+            val = {"group": token, "count": count}  # type: Dict[str, Any]
+            if self.args.detail:
+                val["records"] = [as_dict(i) for i in groups.group_records(token)]
+            out.append(val)
+        return json.dumps(out)
+
+    def run(self):
+        """Run program."""
+        groups = Groups()
+        sizes = groups.make_catalog().sizes(self.args.sort, self.args.limit)
+        if self.args.json:
+            sys.stdout.write(f"{self._json(groups, sizes)}\n")
+            return
+        for token, count in sizes:
+            if self.args.detail:
+                line = self.fmt_group_multi_detail(
+                    f"{token} ({count})", groups.group_records(token)
+                )
+            else:
+                line = f"{token:30} {count:>8}"
+            sys.stdout.write(f"{line}\n")
+
+
+class EscapeText(Formatter):
+    """Escape text from files or stdin with the python / html forms."""
+
+    NAME = "escape"
+    """subcommand name."""
+
+    def __init__(self):
+        """initialize EscapeText class."""
+        self.files = []  # type: List[str]
+        """files to escape, stdin without."""
+        super().__init__()
+
+    def setup_popts(self):
+        """setup parser values."""
+        self.popts.parser.add_argument(
+            "--mode",
+            "-m",
+            help="escape format",
+            choices=list(ESCAPE_MODES),
+            default="html",
+        )
+        self.popts.parser.add_argument(
+            "--group",
+            "-g",
+            help="only escape characters of these token groups (i.e. arrow)",
+            action="extend",
+            default=[],
+            nargs="*",
+        )
+        self.popts.add_facets()
+
+    def setup(self, *files):
+        """Setup files (- is stdin), non ascii characters are escaped by default."""
+        self.files = list(files) or ["-"]
+
+    def run(self):
+        """Run program."""
+        codepoints = None  # type: Any
+        facets = self.facet_filters()
+        if facets or self.args.group:
+            try:
+                codepoints = select_codepoints(facets, self.args.group)
+            except KeyError as err:
+                raise SystemExit(err.args[0]) from err
+        Escaper(self.args.mode, codepoints).escape_files(self.files)
+
+
+class UnescapeText(Formatter):
+    """Unescape \\u, \\U, &#N;, &#xH; and named html entities from files or stdin."""
+
+    NAME = "unescape"
+    """subcommand name."""
+
+    def __init__(self):
+        """initialize UnescapeText class."""
+        self.files = []  # type: List[str]
+        """files to unescape, stdin without."""
+        super().__init__()
+
+    def setup_popts(self):
+        """setup parser values."""
+        self.popts.parser.add_argument(
+            "--errors",
+            help="invalid escapes (unknown / unassigned code points): "
+            "keep them, replace them with U+FFFD or fail (strict)",
+            choices=ESCAPE_ERRORS,
+            default="keep",
+        )
+        self.popts.parser.add_argument(
+            "--no-validate",
+            help="decode every code point, don't check them against the index",
+            action="store_true",
+            default=False,
+        )
+
+    def setup(self, *files):
+        """Setup files (- is stdin)."""
+        self.files = list(files) or ["-"]
+
+    def run(self):
+        """Run program."""
+        obj = Unescaper(self.args.errors, not self.args.no_validate)
+        try:
+            obj.unescape_files(self.files)
+        except UnescapeError as err:
+            sys.stdout.flush()
+            raise SystemExit(err.args[0]) from err
+        for text, count in sorted(obj.invalid.items()):
+            sys.stderr.write(f"invalid escape: {text} ({count}x)\n")
+
+
+class CacheStats(Formatter):
+    """Report deep memory usage of the in-memory index structures."""
+
+    NAME = "cache"
+    """subcommand name."""
+
+    def setup_popts(self):
+        """setup parser values."""
+        parser = self.popts.parser  # type: ArgumentParser
+        self.popts.add_json()
+        parser.add_argument(
+            "--top",
+            "-t",
+            type=int,
+            default=10,
+            help="number of largest token postings to show",
+        )
+        parser.add_argument(
+            "action",
+            type=str,
+            choices=["stats"],
+            help="cache action",
+        )
+
+    def setup(self):
+        """Setup iterator."""
+
+    @staticmethod
+    def _fmt_bytes(val: float):
+        """Human readable byte size."""
+        for unit in ["B", "KiB", "MiB"]:
+            if abs(val) < 1024:
+                return f"{val:.1f}{unit}"
+            val /= 1024
+        return f"{val:.1f}GiB"
+
+    def output_lines(self, report: Dict):
+        """Output report as text."""
+        lines = [f"total: {self._fmt_bytes(report['total'])}", "", "counts:"]
+        for name, val in report["counts"].items():
+            lines.append(f"{SEP}{name:30} {val:>12}")
+        lines += ["", "structures:"]
+        for name, val in report["structures"].items():
+            lines.append(f"{SEP}{name:30} {self._fmt_bytes(val):>12}")
+        lines += ["", f"{'categories:':34} {'bytes':>12} {'count':>10} {'avg':>10}"]
+        for name, cat in report["categories"].items():
+            lines.append(
+                f"{SEP}{name:30} {self._fmt_bytes(cat['bytes']):>12} "
+                f"{cat['count']:>10} {cat['avg']:>10.1f}"
+            )
+        lines += ["", "largest token postings:"]
+        for post in report["top_postings"]:
+            lines.append(
+                f"{SEP}{post['token']:30} {post['count']:>12} "
+                f"{self._fmt_bytes(post['bytes']):>10}"
+            )
+        return "\n".join(lines)
+
+    def run(self):
+        """Build every structure and report its memory usage."""
+        groups = Groups()
+        groups.make_tokenized()
+        pairs = {
+            "_".join(k): Pairs(*v["inc_tokens"])
+            for k, v in PairsGroups.PAIR_LIST.items()
+        }
+        report = memory_report(
+            Groups.CACHED,
+            Groups.TOKENIZED,
+            tokens=Groups.TOKENS,
+            mixer=LetterMixer(),
+            pairs=pairs,
+            top=self.args.top,
+        )
+        if self.args.json:
+            out = json.dumps(report)
+        else:
+            out = self.output_lines(report)
+        sys.stdout.write(f"{out}\n")
 
 
 SUBCOMMANDS = {
@@ -569,5 +1061,10 @@ SUBCOMMANDS = {
     InteractAllGroups.NAME: InteractAllGroups(),
     HackerMixerInteractive.NAME: HackerMixerInteractive(),
     PairsDisplay.NAME: PairsDisplay(),
+    LookupDisplay.NAME: LookupDisplay(),
+    GroupsDisplay.NAME: GroupsDisplay(),
+    EscapeText.NAME: EscapeText(),
+    UnescapeText.NAME: UnescapeText(),
+    CacheStats.NAME: CacheStats(),
 }
 """Main subcommand dict, this is what the main unicodes cli program uses."""
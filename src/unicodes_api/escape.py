@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Escape text with the ``python`` / ``html`` forms of the index records.
+
+Text is run through ``str.translate`` with an :class:`EscapeTable`, the
+escape of a code point is computed on its first occurrence and kept in the
+table, so the per character work happens in C. Escaping all non ASCII
+characters to html uses the ``xmlcharrefreplace`` codec error handler,
+which produces the same ``&#N;`` escapes several times faster::
+
+    from unicodes_api.escape import Escaper, select_codepoints
+
+    Escaper("html").escape("café ╱")            # 'caf&#233; &#9585;'
+    arrows = select_codepoints(groups=["arrow"])
+    Escaper("python", arrows).escape("a → b")   # 'a \\u2192 b'
+
+Streams are processed in CHUNK_SIZE character chunks, so memory stays
+constant for any input size.
+
+:class:`Unescaper` reverses \\uXXXX, \\UXXXXXXXX (and \\uXXXX surrogate
+pairs), &#N;, &#xXXXX; and named html entities with a single regex pass.
+Decoded code points are checked against the index, unknown or unassigned
+ones are kept, replaced or rejected::
+
+    from unicodes_api.escape import Unescaper
+
+    Unescaper().unescape("caf&eacute; &#9585; \\u2192")   # 'café ╱ →'
+    Unescaper(errors="strict").unescape("&#xE000;")         # UnescapeError
+"""
+from typing import Any, Callable, Dict, IO, Iterable, List, Set
+from html.entities import html5
+import re
+import sys
+from unicodes_api import Groups
+from unicodes_api.trace import TRACER
+
+# pylint: disable=invalid-name
+
+CHUNK_SIZE = 1 << 20
+"""characters read per chunk."""
+UNESCAPE_RE = re.compile(
+    r"\\u([dD][89abAB][0-9a-fA-F]{2})\\u([dD][c-fC-F][0-9a-fA-F]{2})"
+    r"|\\u([0-9a-fA-F]{4})"
+    r"|\\U([0-9a-fA-F]{8})"
+    r"|&#([0-9]{1,8});"
+    r"|&#[xX]([0-9a-fA-F]{1,8});"
+    r"|&([A-Za-z][A-Za-z0-9]{1,31};)"
+)
+"""Surrogate pair, \\uXXXX, \\UXXXXXXXX, &#N;, &#xXXXX; and named entity escapes."""
+MAX_ESCAPE = 34
+"""longest UNESCAPE_RE match (named entity)."""
+HIGH_SURROGATE_RE = re.compile(r"\\u[dD][89abAB][0-9a-fA-F]{2}$")
+"""\\uXXXX high surrogate escape at the end of a string."""
+ERRORS = ("keep", "replace", "strict")
+"""Unescaper handling of invalid escapes: leave as is, U+FFFD or raise."""
+
+
+def python_escape(cp: int) -> str:
+    """\\uXXXX / \\UXXXXXXXX escape of a code point, like the record "python" field."""
+    if cp < 0xFFFF:
+        return f"\\u{cp:04x}"
+    return f"\\U{cp:08x}"
+
+
+def html_escape(cp: int) -> str:
+    """&#N; escape of a code point, like the record "html" field."""
+    return f"&#{cp};"
+
+
+MODES = {
+    "html": html_escape,
+    "python": python_escape,
+}  # type: Dict[str, Callable[[int], str]]
+"""escape mode -> record field / function escaping a code point."""
+CODEC_ERRORS = {
+    "html": "xmlcharrefreplace",
+}
+"""escape mode -> ascii codec error handler escaping all non ascii code points."""
+
+
+class EscapeTable(dict):
+    """str.translate table escaping code points on first use.
+
+    Without codepoints every non ASCII code point is escaped, otherwise only
+    the code points in codepoints. Escapes come from the index records when
+    the index is built (Groups.CACHED) and are formatted otherwise.
+    """
+
+    def __init__(self, mode: str, codepoints: Iterable[int] = None):
+        """initialize EscapeTable, mode is a MODES key."""
+        super().__init__()
+        self.mode = mode
+        """record field used for escapes."""
+        self.func = MODES[mode]
+        """escapes code points without a record."""
+        self.selective = codepoints is not None
+        """only the code points given are escaped."""
+        if self.selective:
+            self._fill(codepoints)
+
+    def _fill(self, codepoints: Iterable[int]):
+        """Escapes of the selected code points."""
+        cached = Groups.CACHED
+        mode, func = self.mode, self.func
+        for cp in codepoints:
+            dval = cached.get(cp)
+            self[cp] = dval[mode] if dval else func(cp)
+
+    def __missing__(self, cp: int) -> Any:
+        """Escape of a code point not yet in the table, str.translate calls this."""
+        if self.selective or cp < 0x80:
+            val = cp  # type: Any
+        else:
+            dval = Groups.CACHED.get(cp)
+            val = dval[self.mode] if dval else self.func(cp)
+        self[cp] = val
+        return val
+
+
+def select_codepoints(
+    facets: Dict[str, List[str]] = None, groups: Iterable[str] = ()
+) -> Set[int]:
+    """Code points in any of the token groups and matching the facets.
+
+    facets are like Groups.grouping ({"category": ["Sm"]}), groups are
+    Groups.TOKENIZED tokens. Builds the index, raises KeyError for unknown
+    facet values or groups.
+    """
+    index = Groups()
+    selected = None  # type: Any | Set[int]
+    groups = list(groups)
+    if groups:
+        index.make_tokenized()
+        selected = set()
+        for token in groups:
+            if token not in Groups.TOKENIZED:
+                raise KeyError(f"Unknown group: {token}")
+            selected.update(Groups.TOKENIZED[token])
+    if facets:
+        allowed = index.make_facets().resolve_all(facets)
+        matches = {Groups.CODEPOINTS[i] for i in Groups.FACETS.record_ids(allowed)}
+        selected = matches if selected is None else selected & matches
+    return selected or set()
+
+
+class Escaper:
+    """Escape strings and streams with an EscapeTable."""
+
+    def __init__(self, mode: str = "html", codepoints: Iterable[int] = None):
+        """initialize Escaper, see EscapeTable."""
+        self.table = EscapeTable(mode, codepoints)
+        """translate table."""
+        self.errors = None if self.table.selective else CODEC_ERRORS.get(mode)
+        """ascii codec error handler used instead of the table, if any."""
+
+    def escape(self, text: str) -> str:
+        """Escaped text."""
+        if self.errors:
+            return text.encode("ascii", self.errors).decode("ascii")
+        return text.translate(self.table)
+
+    def escape_stream(self, src: IO, dst: IO, chunk_size: int = CHUNK_SIZE) -> int:
+        """Escape text file src to dst, returns the number of characters read."""
+        escape = self.escape
+        total = 0
+        with TRACER.span("escape.stream"):
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                total += len(chunk)
+                dst.write(escape(chunk))
+        TRACER.count("escape.chars", total)
+        return total
+
+    def escape_files(self, paths: Iterable[str], dst: IO = None) -> int:
+        """Escape files ("-" is stdin) to dst (stdout), returns the characters read."""
+        dst = dst or sys.stdout
+        total = 0
+        for path in paths:
+            if path == "-":
+                total += self.escape_stream(sys.stdin, dst)
+                continue
+            with open(path, encoding="utf-8", newline="") as fobj:
+                total += self.escape_stream(fobj, dst)
+        return total
+
+
+class UnescapeError(ValueError):
+    """Invalid escape in strict mode."""
+
+
+class Unescaper:
+    """Unescape strings and streams in a single regex pass."""
+
+    CACHE_SIZE = 1 << 16
+    """maximum number of cached escape -> text entries."""
+
+    def __init__(self, errors: str = "keep", validate: bool = True):
+        """initialize Unescaper.
+
+        errors (see ERRORS) handles invalid escapes: unknown entities, code
+        points out of range, lone surrogates and, with validate, code
+        points without an index record (unassigned, private use ...).
+        validate builds the index.
+        """
+        if errors not in ERRORS:
+            raise ValueError(f"Unknown errors value: {errors}")
+        self.errors = errors
+        """invalid escape handling."""
+        self.validate = validate
+        """check decoded code points against the index."""
+        self.cache = {}  # type: Dict[str, str]
+        """escape -> unescaped text of valid escapes."""
+        self.invalid = {}  # type: Dict[str, int]
+        """invalid escape -> number of occurrences."""
+        if validate:
+            Groups().make_records()
+
+    def _decode(self, match: Any) -> Any:
+        """Text of an escape match, None if it's invalid."""
+        group = match.lastindex
+        val = match.group(group)
+        if group == 7:
+            return html5.get(val)
+        if group == 2:
+            high = int(match.group(1), 16)
+            cp = 0x10000 + ((high - 0xD800) << 10) + int(val, 16) - 0xDC00
+        else:
+            cp = int(val, 10 if group == 5 else 16)
+        if cp > 0x10FFFF or 0xD800 <= cp <= 0xDFFF:
+            return None
+        if self.validate and cp not in Groups.CACHED:
+            return None
+        return chr(cp)
+
+    def _replace(self, match: Any) -> str:
+        """re.sub replacement of an escape match."""
+        text = match.group()
+        try:
+            return self.cache[text]
+        except KeyError:
+            pass
+        val = self._decode(match)
+        if val is None:
+            self.invalid[text] = self.invalid.get(text, 0) + 1
+            if self.errors == "strict":
+                raise UnescapeError(f"Invalid escape: {text}")
+            return "\ufffd" if self.errors == "replace" else text
+        if len(self.cache) >= self.CACHE_SIZE:
+            self.cache.clear()
+        self.cache[text] = val
+        return val
+
+    def unescape(self, text: str) -> str:
+        """Unescaped text."""
+        return UNESCAPE_RE.sub(self._replace, text)
+
+    @staticmethod
+    def _holdback(text: str) -> int:
+        """Position of a possibly incomplete escape at the end of text."""
+        start = max(len(text) - MAX_ESCAPE, 0)
+        found = [i for i in (text.find("\\", start), text.find("&", start)) if i >= 0]
+        if not found:
+            return len(text)
+        cut = min(found)
+        # don't split surrogate pairs
+        if HIGH_SURROGATE_RE.search(text, max(cut - 6, 0), cut):
+            cut -= 6
+        return cut
+
+    def unescape_stream(self, src: IO, dst: IO, chunk_size: int = CHUNK_SIZE) -> int:
+        """Unescape text file src to dst, returns the number of characters read.
+
+        The end of every chunk that may hold an incomplete escape is carried
+        over to the next one.
+        """
+        unescape = self.unescape
+        carry = ""
+        total = 0
+        with TRACER.span("unescape.stream"):
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                total += len(chunk)
+                text = carry + chunk
+                cut = self._holdback(text)
+                carry = text[cut:]
+                dst.write(unescape(text[:cut]))
+            dst.write(unescape(carry))
+        TRACER.count("unescape.chars", total)
+        return total
+
+    def unescape_files(self, paths: Iterable[str], dst: IO = None) -> int:
+        """Unescape files ("-" is stdin) to dst (stdout), returns the characters read."""
+        dst = dst or sys.stdout
+        total = 0
+        for path in paths:
+            if path == "-":
+                total += self.unescape_stream(sys.stdin, dst)
+                continue
+            with open(path, encoding="utf-8", newline="") as fobj:
+                total += self.unescape_stream(fobj, dst)
+        return total
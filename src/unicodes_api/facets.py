@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Character property facets of the index records.
+
+For every record the general category, bidi class, east asian width,
+canonical combining class, decomposition type, block and script are
+stored as a small integer code (one ``array("H")`` per facet). Every
+facet value has a posting list of record ids (``array("I")``, ascending),
+so a query like "currency symbols in the Arabic block" is answered by
+scanning the shorter posting list and checking the other facet's codes.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Set, Tuple
+from array import array
+import bisect
+import heapq
+import itertools
+import re
+import unicodedata
+from unicodes_api.intervals import IntervalIndex, block_index, script_index
+from unicodes_api.trace import TRACER
+
+# pylint: disable=invalid-name
+
+NAMES = (
+    "category",
+    "bidirectional",
+    "east_asian_width",
+    "combining",
+    "decomposition",
+    "block",
+    "script",
+)
+"""facet names, in property tuple order."""
+
+
+def loose(value: str) -> str:
+    """Loose property value matching (case, whitespace, - and _ are ignored)."""
+    return re.sub(r"[\s_-]", "", value).lower()
+
+
+def decomposition_type(decomposition: str) -> str:
+    """Decomposition type of a unicodedata.decomposition value."""
+    if not decomposition:
+        return "none"
+    if decomposition.startswith("<"):
+        return decomposition[1 : decomposition.index(">")]
+    return "canonical"
+
+
+def property_func(ucd: Any = None) -> Callable[[int], Tuple[str, ...]]:
+    """Function returning the facet values (NAMES order) of a code point.
+
+    Uses ucd (unicodes_api.ucd.UCD) where it has the data, otherwise
+    unicodedata and the static block / script tables.
+    """
+    blocks = block_index(ucd)
+    scripts = script_index(ucd)
+    widths = IntervalIndex(ucd.widths, "N") if ucd and ucd.widths else None
+
+    def _props(cp: int) -> Tuple[str, ...]:
+        char = chr(cp)
+        if ucd:
+            category, combining, bidi, decomposition = ucd.properties(cp)
+        else:
+            category = unicodedata.category(char)
+            combining = str(unicodedata.combining(char))
+            bidi = unicodedata.bidirectional(char)
+            decomposition = unicodedata.decomposition(char)
+        if widths:
+            width = widths.lookup(cp)
+        else:
+            width = unicodedata.east_asian_width(char)
+        return (
+            category,
+            bidi,
+            width,
+            combining,
+            decomposition_type(decomposition),
+            blocks.lookup(cp),
+            scripts.lookup(cp),
+        )
+
+    return _props
+
+
+class Facets:
+    """Per record facet codes with per value posting lists."""
+
+    def __init__(self, codepoints: Sequence[int], ucd: Any = None):
+        """initialize Facets, codepoints are the record code points by record id."""
+        self.values = {name: [] for name in NAMES}  # type: Dict[str, List[str]]
+        """facet -> code -> value."""
+        self.codes = {name: array("H") for name in NAMES}  # type: Dict[str, array]
+        """facet -> record id -> code."""
+        self.postings = {name: [] for name in NAMES}  # type: Dict[str, List[array]]
+        """facet -> code -> ascending record ids."""
+        with TRACER.span("facets.build"):
+            self._build(codepoints, property_func(ucd))
+        TRACER.count("facets.values", sum(len(i) for i in self.values.values()))
+
+    def _build(self, codepoints: Sequence[int], props: Callable):
+        """Compute the facets of every record."""
+        lookups = [{} for _ in NAMES]  # type: List[Dict[str, int]]
+        columns = [
+            (lookup, self.values[name], self.codes[name], self.postings[name])
+            for name, lookup in zip(NAMES, lookups)
+        ]
+        for rid, cp in enumerate(codepoints):
+            for val, (lookup, values, codes, postings) in zip(props(cp), columns):
+                code = lookup.get(val)
+                if code is None:
+                    code = lookup[val] = len(values)
+                    values.append(val)
+                    postings.append(array("I"))
+                codes.append(code)
+                postings[code].append(rid)
+
+    def value(self, facet: str, rid: int) -> str:
+        """Facet value of a record."""
+        return self.values[facet][self.codes[facet][rid]]
+
+    def counts(self, facet: str) -> Iterator[Tuple[str, int]]:
+        """(value, number of records) of a facet, most common first."""
+        vals = zip(self.values[facet], (len(i) for i in self.postings[facet]))
+        yield from sorted(vals, key=lambda x: (-x[1], x[0]))
+
+    def resolve(self, facet: str, queries: Sequence[str]) -> Set[int]:
+        """Codes matching any of the queries (loose matching).
+
+        A single letter category matches the whole major class (L -> Lu, Ll ...).
+        Raises KeyError for unknown facets or values.
+        """
+        values = self.values[facet]
+        codes = set()  # type: Set[int]
+        for query in queries:
+            want = loose(query)
+            found = [
+                code
+                for code, val in enumerate(values)
+                if loose(val) == want
+                or (facet == "category" and len(want) == 1 and val.lower()[0] == want)
+            ]
+            if not found:
+                raise KeyError(f"Unknown {facet}: {query}")
+            codes.update(found)
+        return codes
+
+    def resolve_all(self, facets: Dict[str, Sequence[str]]) -> Dict[str, Set[int]]:
+        """resolve every facet of a {facet: [values]} query, empty facets are skipped."""
+        return {k: self.resolve(k, v) for k, v in facets.items() if v}
+
+    def matches(self, rid: int, allowed: Dict[str, Set[int]]) -> bool:
+        """True if the record has an allowed code for every facet."""
+        codes = self.codes
+        return all(codes[k][rid] in v for k, v in allowed.items())
+
+    def record_ids(self, allowed: Dict[str, Set[int]], start: int = 0) -> Iterator[int]:
+        """Ascending ids (from start) of the records matching every facet."""
+        if not allowed:
+            return
+        # scan the facet with the fewest records, check the others' codes
+        sizes = {
+            k: sum(len(self.postings[k][i]) for i in v) for k, v in allowed.items()
+        }
+        scan = min(sizes, key=sizes.__getitem__)
+        rest = {k: v for k, v in allowed.items() if k != scan}
+        postings = [
+            itertools.islice(i, bisect.bisect_left(i, start), None)
+            for i in (self.postings[scan][j] for j in allowed[scan])
+        ]
+        rids = postings[0] if len(postings) == 1 else heapq.merge(*postings)
+        for rid in rids:
+            if self.matches(rid, rest):
+                yield rid
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Run the curses uis against an in-memory terminal.
+
+A fake curses backend feeds a script of keypresses to a
+BidirectionalIterator and records, for every keystroke, the latency
+until the ui waits for input again, the number of curses calls it made
+and a snapshot of the screen::
+
+    from unicodes_api.cli import SUBCOMMANDS
+    from unicodes_api.headless import Burst, Harness, Resize
+
+    steps = Harness(SUBCOMMANDS["explore"]).run("nnd", Burst("n" * 20), Resize(30, 90))
+    print(steps[-1].frame)
+    print(Harness.summary(steps))
+
+Script items are strings (one keystroke per character), int key codes,
+Burst (keys arriving all at once, i.e. a held down key), Mouse clicks and
+terminal Resizes. The script ending quits the ui.
+"""
+from typing import Any, Dict, List, Sequence, Tuple
+import argparse
+import curses
+import os
+import signal
+import time
+from unicodes_api.screen import cell_width
+
+# pylint: disable=invalid-name
+# pylint: disable=protected-access
+
+KEY_NAMES = {
+    val: name
+    for name, val in sorted(vars(curses).items(), reverse=True)
+    if name.startswith("KEY_") and isinstance(val, int)
+}
+"""key code -> curses key name."""
+
+
+class Burst:
+    """Keys that are all pending at once (a held down key)."""
+
+    def __init__(self, keys: Sequence[Any]):
+        """initialize Burst."""
+        self.keys = [ord(i) if isinstance(i, str) else i for i in keys]
+        """key codes."""
+
+
+class Mouse:
+    """Mouse click at screen column x, line y."""
+
+    def __init__(self, x: int, y: int, bstate: int = curses.BUTTON1_CLICKED):
+        """initialize Mouse."""
+        self.event = (0, x, y, 0, bstate)
+        """getmouse() value."""
+
+
+class Resize:
+    """Terminal resize, KEY_RESIZE or, with sigwinch set, a SIGWINCH signal."""
+
+    def __init__(self, height: int, width: int, sigwinch: bool = False):
+        """initialize Resize."""
+        self.size = (height, width)
+        """new terminal (lines, columns)."""
+        self.sigwinch = sigwinch
+        """deliver SIGWINCH (getch is interrupted) instead of KEY_RESIZE."""
+
+
+class Step:
+    """Result of a single script item."""
+
+    def __init__(self, item: Any, calls: int):
+        """initialize Step."""
+        self.item = item
+        """script item, None for the first frame."""
+        self.start = time.perf_counter()
+        """time the input was delivered."""
+        self.latency = 0.0
+        """seconds until the ui waited for input again."""
+        self.calls = calls
+        """curses calls made (counter value at start until finished)."""
+        self.frame = ""
+        """screen text once the ui is idle."""
+        self.done = False
+        """the ui is idle again."""
+
+    def finish(self, calls: int, frame: str):
+        """The ui is idle again."""
+        self.latency = time.perf_counter() - self.start
+        self.calls = calls - self.calls
+        self.frame = frame
+        self.done = True
+
+
+class FakeWindow:
+    """In-memory curses window / pad."""
+
+    def __init__(self, backend: Any, height: int, width: int):
+        """initialize FakeWindow."""
+        self.backend = backend  # type: FakeCurses
+        """owning backend."""
+        self.height = height
+        """number of lines."""
+        self.width = width
+        """number of columns."""
+        self.cells = []  # type: List[List[str]]
+        """drawn text, a wide character's second cell is empty."""
+        self.y = 0
+        """cursor line."""
+        self.x = 0
+        """cursor column."""
+        self.nodelay_mode = False
+        """getch doesn't block."""
+        self.delay = -1
+        """getch timeout in milliseconds, -1 blocks."""
+        self.erase()
+
+    def _call(self):
+        """Count a curses call."""
+        self.backend.calls += 1
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        """Window size."""
+        return self.height, self.width
+
+    def keypad(self, _):
+        """no-op."""
+
+    def scrollok(self, _):
+        """no-op."""
+
+    def nodelay(self, val: bool):
+        """Non blocking getch."""
+        self.nodelay_mode = val
+
+    def timeout(self, delay: int):
+        """getch timeout."""
+        self.delay = delay
+
+    def refresh(self, *_):
+        """Refresh."""
+        self._call()
+
+    def erase(self):
+        """Clear the window."""
+        self._call()
+        self.cells = [[" "] * self.width for _ in range(self.height)]
+
+    def resize(self, height: int, width: int):
+        """Resize, keeping the content that fits."""
+        self._call()
+        self.height, self.width = height, width
+        self.cells = [
+            (row + [" "] * width)[:width]
+            for row in (self.cells + [[]] * height)[:height]
+        ]
+
+    def move(self, y: int, x: int):
+        """Move the cursor."""
+        self._call()
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise curses.error("move() returned ERR")
+        self.y, self.x = y, x
+
+    def clrtoeol(self):
+        """Clear to the end of the line."""
+        self._call()
+        self.cells[self.y][self.x :] = [" "] * (self.width - self.x)
+
+    def addstr(self, *args):
+        """addstr([y, x,] text[, attr]), attributes are ignored."""
+        self._call()
+        if len(args) > 2:
+            self.y, self.x = args[0], args[1]
+            args = args[2:]
+        for ch in args[0]:
+            size = cell_width(ch)
+            if not size:
+                if self.x:
+                    self.cells[self.y][self.x - 1] += ch
+                continue
+            if self.x + size > self.width:
+                self.y, self.x = self.y + 1, 0
+            if self.y >= self.height:
+                raise curses.error("addstr() returned ERR")
+            self.cells[self.y][self.x] = ch
+            if size == 2:
+                self.cells[self.y][self.x + 1] = ""
+            self.x += size
+
+    def getch(self) -> int:
+        """Next key from the script."""
+        return self.backend.getch(self)
+
+    def dump(self) -> str:
+        """Window text."""
+        return "\n".join("".join(row).rstrip() for row in self.cells)
+
+
+class FakeCurses:
+    """Stand in for the curses module functions BidirectionalIterator uses."""
+
+    def __init__(self, height: int, width: int, script: Sequence[Any], ui: Any):
+        """initialize FakeCurses."""
+        self.ui = ui
+        """ui being driven."""
+        self.calls = 0
+        """curses call counter."""
+        self.stdscr = FakeWindow(self, height, width)
+        """main window."""
+        self.pad = None  # type: Any | FakeWindow
+        """pad the ui draws into."""
+        self.script = list(script)
+        """remaining script items."""
+        self.pending = []  # type: List[int]
+        """keys delivered but not read yet."""
+        self.mouse = []  # type: List[Tuple[int, int, int, int, int]]
+        """pending getmouse() values."""
+        self.steps = []  # type: List[Step]
+        """finished and current step."""
+        self.start = time.perf_counter()
+        """time the run started."""
+
+    def newpad(self, height: int, width: int) -> FakeWindow:
+        """New pad."""
+        self.calls += 1
+        self.pad = FakeWindow(self, height, width)
+        return self.pad
+
+    @staticmethod
+    def keyname(key: int) -> bytes:
+        """Key name like curses.keyname."""
+        if key in KEY_NAMES:
+            return KEY_NAMES[key].encode()
+        if 0 <= key < 32:
+            return f"^{chr(key + 64)}".encode()
+        if key == 127:
+            return b"^?"
+        return chr(key).encode()
+
+    def getmouse(self) -> Tuple[int, int, int, int, int]:
+        """Pending mouse event."""
+        if not self.mouse:
+            raise curses.error("getmouse() returned ERR")
+        return self.mouse.pop(0)
+
+    def mousemask(self, _) -> Tuple[int, int]:
+        """no-op."""
+        return 0, 0
+
+    def resizeterm(self, height: int, width: int):
+        """Resize the terminal."""
+        self.stdscr.resize(height, width)
+
+    def screen(self) -> str:
+        """Screen text."""
+        return self.pad.dump() if self.pad else self.stdscr.dump()
+
+    def _deliver(self, item: Any) -> int:
+        """Start a step for the script item, returns the key getch returns."""
+        self.steps.append(Step(item, self.calls))
+        if isinstance(item, Mouse):
+            self.mouse.append(item.event)
+            return curses.KEY_MOUSE
+        if isinstance(item, Resize):
+            self.stdscr.resize(*item.size)
+            if item.sigwinch:
+                os.kill(os.getpid(), signal.SIGWINCH)
+                return -1
+            return curses.KEY_RESIZE
+        keys = item.keys if isinstance(item, Burst) else [item]
+        self.pending.extend(keys)
+        return self.pending.pop(0)
+
+    def getch(self, win: FakeWindow) -> int:
+        """Scripted input, the ui blocking for input ends the current step."""
+        if self.pending:
+            return self.pending.pop(0)
+        if win.nodelay_mode or win.delay >= 0:
+            loader = self.ui._loader
+            if not self.ui.loaded and loader and win.delay > 0:
+                # no key can arrive, only wait as long as loading takes
+                loader.join(win.delay / 1000)
+            return -1
+        if self.steps and not self.steps[-1].done:
+            self.steps[-1].finish(self.calls, self.screen())
+        elif not self.steps:
+            # first frame, latency is the startup time
+            self.steps.append(Step(None, 0))
+            self.steps[-1].start = self.start
+            self.steps[-1].finish(self.calls, self.screen())
+        while self.script:
+            item = self.script.pop(0)
+            if isinstance(item, str) and len(item) != 1:
+                self.script[:0] = list(item)
+                continue
+            return self._deliver(ord(item) if isinstance(item, str) else item)
+        raise KeyboardInterrupt
+
+
+class Harness:
+    """Drive a BidirectionalIterator with a script of keypresses."""
+
+    def __init__(
+        self,
+        ui: Any,
+        args: Sequence[str] = (),
+        height: int = 40,
+        width: int = 120,
+        fps: float = 0,
+    ):
+        """initialize Harness."""
+        self.ui = ui
+        """ui instance (i.e. SUBCOMMANDS["explore"])."""
+        self.args = list(args)
+        """ui setup arguments."""
+        self.height = height
+        """terminal lines."""
+        self.width = width
+        """terminal columns."""
+        self.fps = fps
+        """--fps value, 0 draws every frame."""
+        self.backend = None  # type: Any | FakeCurses
+        """backend of the last run."""
+
+    def run(self, *script: Any) -> List[Step]:
+        """Run the ui through script, returns a step per script item.
+
+        The first step is the initial frame (item None).
+        """
+        ui = self.ui
+        self.backend = FakeCurses(self.height, self.width, script, ui)
+        ui.backend = self.backend
+        ui.set_args(argparse.Namespace(fps=self.fps))
+        ui.setup(*self.args)
+        ui.loaded = False
+        ui._loader = None
+        try:
+            ui._run(self.backend.stdscr)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            ui.backend = curses
+        return self.backend.steps
+
+    @staticmethod
+    def summary(steps: List[Step]) -> Dict[str, Any]:
+        """Latency / curses call summary of the keystroke steps."""
+        keys = [i for i in steps if i.item is not None]
+        lat = sorted(i.latency for i in keys) or [0.0]
+        return {
+            "startup": steps[0].latency if steps else 0.0,
+            "keys": len(keys),
+            "latency_p50": lat[len(lat) // 2],
+            "latency_p95": lat[min(len(lat) - 1, int(len(lat) * 0.95))],
+            "latency_max": lat[-1],
+            "calls": sum(i.calls for i in keys),
+        }
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Code point -> block / script in O(log n).
+
+Range starts and ends are stored in ``array("I")`` and searched with
+bisect. The batch lookups remember the last range found, so runs of
+characters from the same block or script (the common case for text) skip
+the search entirely::
+
+    from unicodes_api.intervals import block_index, script_index
+
+    block_index().lookup(0x2571)             # 'Box Drawing'
+    script_index().lookup_many("abc αβγ")    # ['Latin', ..., 'Greek', ...]
+    script_index().lookup_codes(memoryview(array("I", [0x41, 0x3B1])))
+"""
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from array import array
+import bisect
+from unicodes_api.ranges import BLOCKS, SCRIPTS
+
+# pylint: disable=invalid-name
+
+NO_BLOCK = "No_Block"
+"""block of code points outside every block."""
+UNKNOWN_SCRIPT = "Unknown"
+"""script of code points outside every script range."""
+
+
+class IntervalIndex:
+    """Sorted, non overlapping (first, last, value) ranges."""
+
+    def __init__(self, ranges: Sequence[Tuple[int, int, str]], default: str = ""):
+        """initialize IntervalIndex."""
+        self.starts = array("I")
+        """first code point of every range, ascending."""
+        self.ends = array("I")
+        """last code point of every range."""
+        self.codes = array("H")
+        """value code of every range."""
+        self.values = []  # type: List[str]
+        """code -> value, the last one is the default."""
+        lookup = {}  # type: Dict[str, int]
+        for first, last, value in sorted(ranges):
+            if value not in lookup:
+                lookup[value] = len(self.values)
+                self.values.append(value)
+            self.starts.append(first)
+            self.ends.append(last)
+            self.codes.append(lookup[value])
+        self.default_code = len(self.values)
+        """code of code points outside every range."""
+        self.values.append(default)
+
+    def __len__(self):
+        """Number of intervals."""
+        return len(self.starts)
+
+    def code(self, cp: int) -> int:
+        """Value code of a code point."""
+        idx = bisect.bisect_right(self.starts, cp) - 1
+        if idx >= 0 and cp <= self.ends[idx]:
+            return self.codes[idx]
+        return self.default_code
+
+    def lookup(self, cp: int) -> str:
+        """Value of a code point."""
+        return self.values[self.code(cp)]
+
+    def lookup_codes(self, data: Any) -> array:
+        """Value codes (array("H")) of a str or iterable / memoryview of code points."""
+        if isinstance(data, str):
+            data = map(ord, data)
+        starts, ends, codes = self.starts, self.ends, self.codes
+        bisect_right = bisect.bisect_right
+        last = len(starts) - 1
+        out = array("H")
+        append = out.append
+        # range (or gap between ranges) of the previous code point
+        lo, hi, code = 1, 0, self.default_code
+        for cp in data:
+            if not lo <= cp <= hi:
+                idx = bisect_right(starts, cp) - 1
+                if idx >= 0 and cp <= ends[idx]:
+                    lo, hi, code = starts[idx], ends[idx], codes[idx]
+                else:
+                    lo = ends[idx] + 1 if idx >= 0 else 0
+                    hi = starts[idx + 1] - 1 if idx < last else 0x10FFFF
+                    code = self.default_code
+            append(code)
+        return out
+
+    def lookup_many(self, data: Any) -> List[str]:
+        """Values of a str or iterable / memoryview of code points."""
+        values = self.values
+        return [values[i] for i in self.lookup_codes(data)]
+
+
+INDEXES = {}  # type: Dict[Any, Tuple[IntervalIndex, IntervalIndex]]
+"""ucd (None: static tables) -> (block index, script index)."""
+
+
+def _indexes(ucd: Any = None) -> Tuple[IntervalIndex, IntervalIndex]:
+    """Block and script index of a database."""
+    key = ucd.version if ucd else None
+    if key not in INDEXES:
+        blocks = ucd.blocks if ucd and ucd.blocks else BLOCKS
+        scripts = ucd.scripts if ucd and ucd.scripts else SCRIPTS
+        INDEXES[key] = (
+            IntervalIndex(blocks, NO_BLOCK),
+            IntervalIndex(scripts, UNKNOWN_SCRIPT),
+        )
+    return INDEXES[key]
+
+
+def block_index(ucd: Any = None) -> IntervalIndex:
+    """Code point -> block index of ucd (unicodes_api.ucd.UCD), static tables by default."""
+    return _indexes(ucd)[0]
+
+
+def script_index(ucd: Any = None) -> IntervalIndex:
+    """Code point -> script index of ucd (unicodes_api.ucd.UCD), static tables by default."""
+    return _indexes(ucd)[1]
+
+
+COLUMNS = {
+    "block": block_index,
+    "script": script_index,
+}
+"""Optional record column -> index function."""
+
+
+def columns(cp: int, names: Iterable[str], ucd: Any = None) -> Dict[str, str]:
+    """Optional column values (see COLUMNS) of a code point."""
+    return {name: COLUMNS[name](ucd).lookup(cp) for name in names}
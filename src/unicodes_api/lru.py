@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Bounded least recently used cache."""
+from typing import Any, Callable, Hashable
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 64):
+        """initialize LRUCache."""
+        self.maxsize = maxsize
+        """maximum number of entries."""
+        self.data = OrderedDict()  # type: OrderedDict
+        """cached values, most recently used last."""
+        self.hits = 0
+        """cache hit count."""
+        self.misses = 0
+        """cache miss count."""
+
+    def __contains__(self, key: Hashable):
+        """True if key is cached, without updating its recency."""
+        return key in self.data
+
+    def __len__(self):
+        """Number of cached entries."""
+        return len(self.data)
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return cached value for key, creating it with factory on a miss."""
+        try:
+            val = self.data[key]
+        except KeyError:
+            self.misses += 1
+            val = self.data[key] = factory()
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+            return val
+        self.hits += 1
+        self.data.move_to_end(key)
+        return val
+
+    def clear(self):
+        """Drop all entries."""
+        self.data.clear()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Deep memory accounting for the in-memory index structures.
+
+Objects shared between structures (i.e. a record referenced from
+``Groups.CACHED`` and ``Pairs.vals``) are only counted once, against the
+first structure that reaches them.
+"""
+from typing import Any, Dict, Iterable, List, Set
+import sys
+
+# pylint: disable=invalid-name
+
+
+class MemWalker:
+    """Walk known structures and attribute deep sizes to categories."""
+
+    def __init__(self):
+        """initialize MemWalker."""
+        self.seen = set()  # type: Set[int]
+        """ids of objects already counted."""
+        self.categories = {}  # type: Dict[str, Dict[str, int]]
+        """category -> {"count": n, "bytes": n}."""
+        self.structures = {}  # type: Dict[str, int]
+        """structure name -> deep bytes."""
+        self._current = ""
+        """structure currently being walked."""
+
+    def add(self, obj: Any, category: str) -> int:
+        """Count obj (shallow) against category, returns bytes added."""
+        oid = id(obj)
+        if oid in self.seen:
+            return 0
+        self.seen.add(oid)
+        size = sys.getsizeof(obj)
+        cat = self.categories.setdefault(category, {"count": 0, "bytes": 0})
+        cat["count"] += 1
+        cat["bytes"] += size
+        self.structures[self._current] = self.structures.get(self._current, 0) + size
+        return size
+
+    def deep(self, obj: Any, category: str) -> int:
+        """Count obj and everything it contains against category."""
+        size = self.add(obj, category)
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                size += self.deep(k, category)
+                size += self.deep(v, category)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            for v in obj:
+                size += self.deep(v, category)
+        return size
+
+    def record(self, dval: Dict) -> int:
+        """Count a single iter_unicodes record."""
+        size = self.add(dval, "record dicts")
+        # stored values only, derived Record keys aren't held in memory
+        for k, v in dict.items(dval):
+            size += self.add(k, "record keys")
+            if k == "tokens":
+                size += self.token_list(v)
+            elif isinstance(v, str):
+                size += self.add(v, "record strings")
+            else:
+                size += self.deep(v, "record values")
+        return size
+
+    def token_list(self, tokens: Iterable[str]) -> int:
+        """Count a token list / tuple."""
+        cat = "token tuples" if isinstance(tokens, tuple) else "token lists"
+        size = self.add(tokens, cat)
+        for token in tokens:
+            size += self.add(token, "token strings")
+        return size
+
+    def structure(self, name: str):
+        """Set the structure subsequent objects are attributed to."""
+        self._current = name
+        self.structures.setdefault(name, 0)
+        return self
+
+    def walk_cached(self, cached: Dict):
+        """Groups.CACHED: code point -> record."""
+        self.structure("Groups.CACHED")
+        self.add(cached, "index dicts")
+        for key, dval in cached.items():
+            self.add(key, "code points")
+            self.record(dval)
+
+    def walk_tokens(self, tokens: Any):
+        """Groups.TOKENS: token id arrays and their vocabulary."""
+        self.structure("Groups.TOKENS")
+        self.add(tokens.ids, "token id arrays")
+        self.add(tokens.offsets, "token id arrays")
+        self.structure("VOCAB")
+        vocab = tokens.vocab
+        self.add(vocab.tokens, "vocabulary")
+        self.add(vocab.ids, "vocabulary")
+        for token, tid in vocab.ids.items():
+            self.add(token, "token strings")
+            self.add(tid, "token ids")
+
+    def walk_tokenized(self, tokenized: Dict):
+        """Groups.TOKENIZED: token -> set of CACHED keys."""
+        self.structure("Groups.TOKENIZED")
+        self.add(tokenized, "index dicts")
+        for token, keys in tokenized.items():
+            self.add(token, "token strings")
+            self.add(keys, "posting sets")
+            for key in keys:
+                self.add(key, "code points")
+
+    def walk_mixer(self, mixer: Any):
+        """LetterMixer alphabet / object dicts."""
+        self.structure("LetterMixer.alphabet_dict")
+        self.deep(mixer.alphabet_dict, "mixer containers")
+        self.structure("LetterMixer.object_dict")
+        self.add(mixer.object_dict, "mixer containers")
+        for letter, dvals in mixer.object_dict.items():
+            self.add(letter, "mixer containers")
+            self.add(dvals, "mixer containers")
+            for dval in dvals:
+                self.record(dval)
+
+    def walk_pairs(self, name: str, pairs: Any):
+        """Pairs.vals: name -> record."""
+        self.structure(f"Pairs.vals[{name}]")
+        self.add(pairs.vals, "pairs dicts")
+        for key, dval in pairs.vals.items():
+            self.add(key, "pairs keys")
+            self.record(dval)
+
+
+def top_postings(tokenized: Dict, top: int) -> List[Dict]:
+    """Largest token postings."""
+    largest = sorted(tokenized.items(), key=lambda x: len(x[1]), reverse=True)
+    return [
+        {"token": token, "count": len(keys), "bytes": sys.getsizeof(keys)}
+        for token, keys in largest[:top]
+    ]
+
+
+def memory_report(
+    cached: Dict,
+    tokenized: Dict,
+    tokens: Any = None,
+    mixer: Any = None,
+    pairs: Dict = None,
+    top: int = 10,
+) -> Dict:
+    """Build the memory report for the given structures."""
+    walker = MemWalker()
+    walker.walk_cached(cached)
+    if tokens is not None:
+        walker.walk_tokens(tokens)
+    walker.walk_tokenized(tokenized)
+    if mixer:
+        walker.walk_mixer(mixer)
+    for name, obj in (pairs or {}).items():
+        walker.walk_pairs(name, obj)
+
+    categories = {
+        k: dict(v, avg=v["bytes"] / v["count"] if v["count"] else 0)
+        for k, v in sorted(
+            walker.categories.items(), key=lambda x: x[1]["bytes"], reverse=True
+        )
+    }
+    return {
+        "total": sum(walker.structures.values()),
+        "counts": {
+            "records": len(cached),
+            "vocabulary": len(tokens.vocab) if tokens is not None else 0,
+            "tokens": len(tokenized),
+            "postings": sum(len(i) for i in tokenized.values()),
+        },
+        "structures": walker.structures,
+        "categories": categories,
+        "top_postings": top_postings(tokenized, top),
+    }
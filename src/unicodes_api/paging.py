@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Code point ordered pages with opaque cursors.
+
+A cursor encodes the last code point of a page (and the Unicode version of
+the index it came from), the next page continues right after it, so earlier
+pages are never recomputed and only one page is held in memory::
+
+    from unicodes_api import Groups
+
+    page = Groups().page(["arrow"], limit=20)
+    while page.cursor:
+        page = Groups().page(["arrow"], limit=20, after=page.cursor)
+"""
+from typing import Any, Dict, Iterator, List
+import base64
+import itertools
+import json
+
+# pylint: disable=invalid-name,too-few-public-methods
+
+PAGE_SIZE = 100
+"""default number of records per page."""
+
+
+def encode_cursor(cp: int, version: str) -> str:
+    """Opaque cursor continuing after code point cp."""
+    raw = json.dumps({"v": version, "after": cp}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, version: str) -> int:
+    """Code point a cursor continues after, raises ValueError for invalid cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        val = json.loads(raw.decode())
+        cp = val["after"]
+        cversion = val["v"]
+    except (ValueError, TypeError, KeyError) as err:
+        raise ValueError(f"Invalid cursor: {cursor}") from err
+    if not isinstance(cp, int) or cp < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if cversion != version:
+        raise ValueError(f"Cursor is for Unicode {cversion}, not {version}")
+    return cp
+
+
+class Page:
+    """One page of code point ordered records."""
+
+    def __init__(self, records: List[Dict], cursor: Any = None):
+        """initialize Page."""
+        self.records = records
+        """records of the page, ascending code points."""
+        self.cursor = cursor
+        """cursor of the next page, None on the last page."""
+
+    def __len__(self):
+        """Number of records on the page."""
+        return len(self.records)
+
+    def __iter__(self):
+        """Iterate the page records."""
+        return iter(self.records)
+
+
+def paginate(records: Iterator[Dict], limit: int, version: str) -> Page:
+    """First limit records of a code point ordered iterator as a Page."""
+    if limit < 1:
+        raise ValueError(f"Page size must be positive: {limit}")
+    vals = list(itertools.islice(records, limit + 1))
+    if len(vals) <= limit:
+        return Page(vals)
+    return Page(vals[:limit], encode_cursor(vals[limit - 1]["int"], version))
@@ -6,6 +6,12 @@ from abc import ABC, abstractmethod
 import json
 import inspect
 import argparse
+import sys
+from unicodes_api import Groups, Record, as_dict
+from unicodes_api.paging import PAGE_SIZE
+from unicodes_api.intervals import COLUMNS
+from unicodes_api.profiling import DEFAULT_PATH as DEFAULT_PROFILE
+from unicodes_api.ucd import ENV_DIR as UCD_ENV_DIR
 
 # pylint: disable=protected-access,invalid-name
 
@@ -16,6 +22,17 @@ SEP = "   "
 """Default separater when indenting."""
 
 
+def column_list(value: str) -> List[str]:
+    """--columns value, comma separated COLUMNS names."""
+    cols = [i.strip() for i in value.split(",") if i.strip()]
+    for col in cols:
+        if col not in COLUMNS:
+            raise argparse.ArgumentTypeError(
+                f"invalid column: {col} (choose from {', '.join(COLUMNS)})"
+            )
+    return cols
+
+
 class ParserOpts:
     """Parser options."""
 
@@ -26,12 +43,46 @@ class ParserOpts:
     SUBCMDS = []  # type: List[ParserOpts]
     """Collection of this instances of this class."""
 
+    OPTIONAL_VALUES = {
+        "--trace": "stderr",
+        "--profile": DEFAULT_PROFILE,
+    }
+    """Global flags whose value is optional (``--flag[=value]``) -> default value."""
+
     def __init__(self, name: str, pcls: type):
         """initialize ParserOpts."""
         if not self.MAIN:
             ParserOpts.MAIN = argparse.ArgumentParser(
                 formatter_class=argparse.RawTextHelpFormatter,
             )
+            ParserOpts.MAIN.add_argument(
+                "--trace",
+                default=None,
+                metavar="PATH",
+                help="--trace[=PATH] report timing spans / counters to stderr\n"
+                "or a json file",
+            )
+            ParserOpts.MAIN.add_argument(
+                "--profile",
+                default=None,
+                metavar="PATH",
+                help="--profile[=PATH] profile the subcommand, writes pstats to PATH\n"
+                f"(default: {DEFAULT_PROFILE}) and collapsed stacks next to it",
+            )
+            ParserOpts.MAIN.add_argument(
+                "--ucd-version",
+                default=None,
+                metavar="VERSION",
+                help="Unicode version (i.e. 13.0.0) to use instead of the\n"
+                "interpreter's unicodedata, read from --ucd-dir",
+            )
+            ParserOpts.MAIN.add_argument(
+                "--ucd-dir",
+                default=None,
+                metavar="PATH",
+                help="directory with UnicodeData.txt, NameAliases.txt and Blocks.txt\n"
+                f"(or <version>/ucd subdirectories), default: ${UCD_ENV_DIR}",
+            )
             ParserOpts.SUBPARSERS = self.MAIN.add_subparsers(
                 title="subcommands",
             )
@@ -49,6 +100,22 @@ class ParserOpts:
         self.parser.set_defaults(func=name)
         self.args_setup()
 
+    @staticmethod
+    def parse_args(argv: List[str] = None) -> argparse.Namespace:
+        """Parse arguments, expanding bare optional value flags to their default.
+
+        Only global flags before the subcommand are expanded, arguments of
+        the subcommand are passed as is.
+        """
+        argv = list(sys.argv[1:] if argv is None else argv)
+        subcmds = {i.name for i in ParserOpts.SUBCMDS}
+        for idx, val in enumerate(argv):
+            if val in subcmds or val == "--":
+                break
+            if val in ParserOpts.OPTIONAL_VALUES:
+                argv[idx] = f"{val}={ParserOpts.OPTIONAL_VALUES[val]}"
+        return ParserOpts.MAIN.parse_args(argv)
+
     def args_setup(self):
         """Setup args."""
         fsig = inspect.signature(self.pcls.setup)
@@ -85,6 +152,58 @@ class ParserOpts:
             nargs="*",
         )
 
+    def add_facets(self):
+        """Add character property filter arguments."""
+        for flag, hlp in [
+            ("--category", "general category, i.e. Sc or L for all letters"),
+            ("--block", "block name, i.e. 'box drawing'"),
+            ("--script", "script name, i.e. arabic"),
+        ]:
+            self.parser.add_argument(
+                flag,
+                help=f"{hlp} (repeatable, any of the values matches)",
+                action="extend",
+                default=[],
+                nargs="*",
+            )
+
+    def add_range(self):
+        """Add code point range argument."""
+        self.parser.add_argument(
+            "--range",
+            "-r",
+            help="code point range START-END, i.e. U+2500-U+257F or 2500..257f",
+            default=None,
+        )
+
+    def add_paging(self):
+        """Add pagination arguments."""
+        self.parser.add_argument(
+            "--limit",
+            help=f"page size, the cursor of the next page is printed to stderr "
+            f"(default with --after: {PAGE_SIZE})",
+            type=int,
+            default=None,
+        )
+        self.parser.add_argument(
+            "--after",
+            help="cursor of the previous page",
+            default=None,
+        )
+
+    def add_columns(self):
+        """Add optional output columns argument."""
+        self.parser.add_argument(
+            "--columns",
+            "-c",
+            help="extra columns to output, comma separated or repeated\n"
+            f"({', '.join(COLUMNS)})",
+            action="extend",
+            default=[],
+            metavar="COLUMN[,COLUMN]",
+            type=column_list,
+        )
+
     def add_details(self):
         """Add detail argument."""
         self.parser.add_argument(
@@ -95,6 +214,15 @@ class ParserOpts:
             default=False,
         )
 
+    def add_fps(self, default: float):
+        """Add frame rate argument."""
+        self.parser.add_argument(
+            "--fps",
+            help="maximum redraws per second while keys are held down (0: no limit)",
+            type=float,
+            default=default,
+        )
+
     def add_json(self):
         """Add json argument."""
         self.parser.add_argument(
@@ -157,6 +285,13 @@ class Formatter(ABC):
     def run(self):
         """Run program."""
 
+    def name_filter(self, dval: Dict) -> bool:
+        """True if the record passes the --filter / --exclude name filters."""
+        inc = getattr(self.args, "filter", [])
+        excl = getattr(self.args, "exclude", [])
+        name = dval["name"]
+        return all(i in name for i in inc) and not any(i in name for i in excl)
+
     def iterator(self) -> Iterator[Dict]:
         """Iterator."""
         try:
@@ -168,19 +303,24 @@ class Formatter(ABC):
         except AttributeError:
             excl = []
 
+        try:
+            cols = [(k, COLUMNS[k](Groups.UCD)) for k in self.args.columns]
+        except AttributeError:
+            cols = []
+
         for dval in self._iterator:
-            name = dval["name"]
-            if not any([inc, excl]):
+            if cols:
+                # records may be shared (Groups.CACHED), don't modify them
+                dval = as_dict(dval)
+                for key, index in cols:
+                    dval[key] = index.lookup(dval["int"])
+            if not any([inc, excl]) or self.name_filter(dval):
                 yield dval
-            else:
-                pval = all(
-                    [
-                        all(i in name for i in inc),
-                        not any(i in name for i in excl),
-                    ]
-                )
-                if pval:
-                    yield dval
+
+    def facet_filters(self) -> Dict[str, List[str]]:
+        """Selected --category/--block/--script values by facet name."""
+        vals = {k: getattr(self.args, k, None) for k in ("category", "block", "script")}
+        return {k: v for k, v in vals.items() if v}
 
     @staticmethod
     def fmt_single_normal(dval):
@@ -247,5 +387,5 @@ class Formatter(ABC):
         """Format as parsable json."""
         retdict = []
         for i in self.iterator():
-            retdict.append(i)
+            retdict.append(as_dict(i) if isinstance(i, Record) else i)
         yield json.dumps(retdict)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""cProfile wrapper used by the global ``--profile[=path]`` option.
+
+Writes two files:
+
+    - ``path``: pstats data, i.e. ``python -m pstats unicodes.prof``
+    - ``path`` with a ``.collapsed`` suffix: collapsed stacks for flamegraph
+      tools, i.e. ``flamegraph.pl unicodes.collapsed > unicodes.svg``
+
+cProfile only profiles the thread that enabled it, thread targets wrapped
+with :meth:`Profiler.thread_target` get their own profile which is merged
+into the output on exit.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from pathlib import Path
+import cProfile
+import pstats
+import sys
+
+# pylint: disable=invalid-name
+
+DEFAULT_PATH = "unicodes.prof"
+"""Default pstats output path."""
+MAX_DEPTH = 64
+"""Stop walking the call graph below this depth."""
+MIN_USEC = 1
+"""Ignore stacks smaller than this (microseconds)."""
+
+
+def _frame_name(func: Tuple[str, int, str]) -> str:
+    """Flamegraph frame name for a pstats function key."""
+    filename, lineno, name = func
+    if filename == "~":
+        return name.replace(";", ":")
+    return f"{name} ({Path(filename).name}:{lineno})".replace(";", ":")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Iterator[Tuple[str, int]]:
+    """Yield (stack, microseconds) tuples rebuilt from the pstats call graph.
+
+    cProfile only records caller -> callee edges, so time of a function
+    called from several places is split proportionally to the cumulative
+    time of each edge.
+    """
+    raw = stats.stats  # type: Dict[Any, Any] # pylint: disable=no-member
+    callees = {}  # type: Dict[Any, Dict[Any, float]]
+    roots = []
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    def _walk(func, stack, scale):
+        _, _, tottime, cumtime, _ = raw[func]
+        stack = stack + [_frame_name(func)]
+        own = int(tottime * scale * 1e6)
+        if own >= MIN_USEC:
+            yield ";".join(stack), own
+        if len(stack) >= MAX_DEPTH:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_cum = raw[callee][3]
+            if callee_cum <= 0 or _frame_name(callee) in stack:
+                continue
+            sub_scale = scale * min(edge_time, cumtime) / callee_cum
+            if callee_cum * sub_scale * 1e6 < MIN_USEC:
+                continue
+            yield from _walk(callee, stack, sub_scale)
+
+    for root in roots:
+        yield from _walk(root, [], 1.0)
+
+
+class Profiler:
+    """Context manager profiling the enclosed block and dumping it on exit."""
+
+    CURRENT = None  # type: Any | Profiler
+    """Profiler of the enclosed block, None outside of it."""
+
+    def __init__(self, path: str = None):
+        """initialize Profiler, profiling is a no-op when path is empty."""
+        self.path = Path(path) if path else None  # type: Any | Path
+        """pstats output path."""
+        self.profile = cProfile.Profile() if path else None  # type: Any
+        """cProfile instance."""
+        self.threads = []  # type: List[cProfile.Profile]
+        """profiles of finished thread targets."""
+
+    @property
+    def collapsed_path(self) -> Path:
+        """Collapsed stack output path."""
+        return self.path.with_suffix(".collapsed")
+
+    @classmethod
+    def thread_target(cls, target: Callable) -> Callable:
+        """Thread target profiled into the current Profiler, target without one.
+
+        Profiles of threads still running on exit are not included.
+        """
+        current = cls.CURRENT
+        if not (current and current.profile):
+            return target
+
+        def _run(*args, **kwargs):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # python >= 3.12, the active profiler already sees every thread
+                return target(*args, **kwargs)
+            try:
+                return target(*args, **kwargs)
+            finally:
+                profile.disable()
+                current.threads.append(profile)
+
+        return _run
+
+    def __enter__(self):
+        """Start profiling."""
+        if self.profile:
+            Profiler.CURRENT = self
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *_):
+        """Stop profiling and write the output files."""
+        if self.profile:
+            self.profile.disable()
+            Profiler.CURRENT = None
+            self.dump()
+        return False
+
+    def dump(self):
+        """Write pstats and collapsed stack files."""
+        stats = pstats.Stats(self.profile)
+        for profile in list(self.threads):
+            stats.add(profile)
+        stats.dump_stats(str(self.path))
+        totals = {}  # type: Dict[str, int]
+        for stack, usec in collapsed_stacks(stats):
+            totals[stack] = totals.get(stack, 0) + usec
+        with self.collapsed_path.open("w") as fileh:
+            for stack, usec in sorted(totals.items()):
+                fileh.write(f"{stack} {usec}\n")
+        sys.stderr.write(f"Profile written to: {self.path} {self.collapsed_path}\n")
@@ -0,0 +1,1279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""STATIC block and script ranges, unicodedata does not provide these.
+
+Generated by scripts/genranges.py from the Unicode 14.0.0 UCD, do not edit.
+"""
+
+UNICODE_VERSION = "14.0.0"
+"""Unicode version of the tables."""
+
+BLOCKS = [
+    (0x0000, 0x007F, "Basic Latin"),
+    (0x0080, 0x00FF, "Latin-1 Supplement"),
+    (0x0100, 0x017F, "Latin Extended-A"),
+    (0x0180, 0x024F, "Latin Extended-B"),
+    (0x0250, 0x02AF, "IPA Extensions"),
+    (0x02B0, 0x02FF, "Spacing Modifier Letters"),
+    (0x0300, 0x036F, "Combining Diacritical Marks"),
+    (0x0370, 0x03FF, "Greek and Coptic"),
+    (0x0400, 0x04FF, "Cyrillic"),
+    (0x0500, 0x052F, "Cyrillic Supplement"),
+    (0x0530, 0x058F, "Armenian"),
+    (0x0590, 0x05FF, "Hebrew"),
+    (0x0600, 0x06FF, "Arabic"),
+    (0x0700, 0x074F, "Syriac"),
+    (0x0750, 0x077F, "Arabic Supplement"),
+    (0x0780, 0x07BF, "Thaana"),
+    (0x07C0, 0x07FF, "NKo"),
+    (0x0800, 0x083F, "Samaritan"),
+    (0x0840, 0x085F, "Mandaic"),
+    (0x0860, 0x086F, "Syriac Supplement"),
+    (0x0870, 0x089F, "Arabic Extended-B"),
+    (0x08A0, 0x08FF, "Arabic Extended-A"),
+    (0x0900, 0x097F, "Devanagari"),
+    (0x0980, 0x09FF, "Bengali"),
+    (0x0A00, 0x0A7F, "Gurmukhi"),
+    (0x0A80, 0x0AFF, "Gujarati"),
+    (0x0B00, 0x0B7F, "Oriya"),
+    (0x0B80, 0x0BFF, "Tamil"),
+    (0x0C00, 0x0C7F, "Telugu"),
+    (0x0C80, 0x0CFF, "Kannada"),
+    (0x0D00, 0x0D7F, "Malayalam"),
+    (0x0D80, 0x0DFF, "Sinhala"),
+    (0x0E00, 0x0E7F, "Thai"),
+    (0x0E80, 0x0EFF, "Lao"),
+    (0x0F00, 0x0FFF, "Tibetan"),
+    (0x1000, 0x109F, "Myanmar"),
+    (0x10A0, 0x10FF, "Georgian"),
+    (0x1100, 0x11FF, "Hangul Jamo"),
+    (0x1200, 0x137F, "Ethiopic"),
+    (0x1380, 0x139F, "Ethiopic Supplement"),
+    (0x13A0, 0x13FF, "Cherokee"),
+    (0x1400, 0x167F, "Unified Canadian Aboriginal Syllabics"),
+    (0x1680, 0x169F, "Ogham"),
+    (0x16A0, 0x16FF, "Runic"),
+    (0x1700, 0x171F, "Tagalog"),
+    (0x1720, 0x173F, "Hanunoo"),
+    (0x1740, 0x175F, "Buhid"),
+    (0x1760, 0x177F, "Tagbanwa"),
+    (0x1780, 0x17FF, "Khmer"),
+    (0x1800, 0x18AF, "Mongolian"),
+    (0x18B0, 0x18FF, "Unified Canadian Aboriginal Syllabics Extended"),
+    (0x1900, 0x194F, "Limbu"),
+    (0x1950, 0x197F, "Tai Le"),
+    (0x1980, 0x19DF, "New Tai Lue"),
+    (0x19E0, 0x19FF, "Khmer Symbols"),
+    (0x1A00, 0x1A1F, "Buginese"),
+    (0x1A20, 0x1AAF, "Tai Tham"),
+    (0x1AB0, 0x1AFF, "Combining Diacritical Marks Extended"),
+    (0x1B00, 0x1B7F, "Balinese"),
+    (0x1B80, 0x1BBF, "Sundanese"),
+    (0x1BC0, 0x1BFF, "Batak"),
+    (0x1C00, 0x1C4F, "Lepcha"),
+    (0x1C50, 0x1C7F, "Ol Chiki"),
+    (0x1C80, 0x1C8F, "Cyrillic Extended-C"),
+    (0x1C90, 0x1CBF, "Georgian Extended"),
+    (0x1CC0, 0x1CCF, "Sundanese Supplement"),
+    (0x1CD0, 0x1CFF, "Vedic Extensions"),
+    (0x1D00, 0x1D7F, "Phonetic Extensions"),
+    (0x1D80, 0x1DBF, "Phonetic Extensions Supplement"),
+    (0x1DC0, 0x1DFF, "Combining Diacritical Marks Supplement"),
+    (0x1E00, 0x1EFF, "Latin Extended Additional"),
+    (0x1F00, 0x1FFF, "Greek Extended"),
+    (0x2000, 0x206F, "General Punctuation"),
+    (0x2070, 0x209F, "Superscripts and Subscripts"),
+    (0x20A0, 0x20CF, "Currency Symbols"),
+    (0x20D0, 0x20FF, "Combining Diacritical Marks for Symbols"),
+    (0x2100, 0x214F, "Letterlike Symbols"),
+    (0x2150, 0x218F, "Number Forms"),
+    (0x2190, 0x21FF, "Arrows"),
+    (0x2200, 0x22FF, "Mathematical Operators"),
+    (0x2300, 0x23FF, "Miscellaneous Technical"),
+    (0x2400, 0x243F, "Control Pictures"),
+    (0x2440, 0x245F, "Optical Character Recognition"),
+    (0x2460, 0x24FF, "Enclosed Alphanumerics"),
+    (0x2500, 0x257F, "Box Drawing"),
+    (0x2580, 0x259F, "Block Elements"),
+    (0x25A0, 0x25FF, "Geometric Shapes"),
+    (0x2600, 0x26FF, "Miscellaneous Symbols"),
+    (0x2700, 0x27BF, "Dingbats"),
+    (0x27C0, 0x27EF, "Miscellaneous Mathematical Symbols-A"),
+    (0x27F0, 0x27FF, "Supplemental Arrows-A"),
+    (0x2800, 0x28FF, "Braille Patterns"),
+    (0x2900, 0x297F, "Supplemental Arrows-B"),
+    (0x2980, 0x29FF, "Miscellaneous Mathematical Symbols-B"),
+    (0x2A00, 0x2AFF, "Supplemental Mathematical Operators"),
+    (0x2B00, 0x2BFF, "Miscellaneous Symbols and Arrows"),
+    (0x2C00, 0x2C5F, "Glagolitic"),
+    (0x2C60, 0x2C7F, "Latin Extended-C"),
+    (0x2C80, 0x2CFF, "Coptic"),
+    (0x2D00, 0x2D2F, "Georgian Supplement"),
+    (0x2D30, 0x2D7F, "Tifinagh"),
+    (0x2D80, 0x2DDF, "Ethiopic Extended"),
+    (0x2DE0, 0x2DFF, "Cyrillic Extended-A"),
+    (0x2E00, 0x2E7F, "Supplemental Punctuation"),
+    (0x2E80, 0x2EFF, "CJK Radicals Supplement"),
+    (0x2F00, 0x2FDF, "Kangxi Radicals"),
+    (0x2FF0, 0x2FFF, "Ideographic Description Characters"),
+    (0x3000, 0x303F, "CJK Symbols and Punctuation"),
+    (0x3040, 0x309F, "Hiragana"),
+    (0x30A0, 0x30FF, "Katakana"),
+    (0x3100, 0x312F, "Bopomofo"),
+    (0x3130, 0x318F, "Hangul Compatibility Jamo"),
+    (0x3190, 0x319F, "Kanbun"),
+    (0x31A0, 0x31BF, "Bopomofo Extended"),
+    (0x31C0, 0x31EF, "CJK Strokes"),
+    (0x31F0, 0x31FF, "Katakana Phonetic Extensions"),
+    (0x3200, 0x32FF, "Enclosed CJK Letters and Months"),
+    (0x3300, 0x33FF, "CJK Compatibility"),
+    (0x3400, 0x4DBF, "CJK Unified Ideographs Extension A"),
+    (0x4DC0, 0x4DFF, "Yijing Hexagram Symbols"),
+    (0x4E00, 0x9FFF, "CJK Unified Ideographs"),
+    (0xA000, 0xA48F, "Yi Syllables"),
+    (0xA490, 0xA4CF, "Yi Radicals"),
+    (0xA4D0, 0xA4FF, "Lisu"),
+    (0xA500, 0xA63F, "Vai"),
+    (0xA640, 0xA69F, "Cyrillic Extended-B"),
+    (0xA6A0, 0xA6FF, "Bamum"),
+    (0xA700, 0xA71F, "Modifier Tone Letters"),
+    (0xA720, 0xA7FF, "Latin Extended-D"),
+    (0xA800, 0xA82F, "Syloti Nagri"),
+    (0xA830, 0xA83F, "Common Indic Number Forms"),
+    (0xA840, 0xA87F, "Phags-pa"),
+    (0xA880, 0xA8DF, "Saurashtra"),
+    (0xA8E0, 0xA8FF, "Devanagari Extended"),
+    (0xA900, 0xA92F, "Kayah Li"),
+    (0xA930, 0xA95F, "Rejang"),
+    (0xA960, 0xA97F, "Hangul Jamo Extended-A"),
+    (0xA980, 0xA9DF, "Javanese"),
+    (0xA9E0, 0xA9FF, "Myanmar Extended-B"),
+    (0xAA00, 0xAA5F, "Cham"),
+    (0xAA60, 0xAA7F, "Myanmar Extended-A"),
+    (0xAA80, 0xAADF, "Tai Viet"),
+    (0xAAE0, 0xAAFF, "Meetei Mayek Extensions"),
+    (0xAB00, 0xAB2F, "Ethiopic Extended-A"),
+    (0xAB30, 0xAB6F, "Latin Extended-E"),
+    (0xAB70, 0xABBF, "Cherokee Supplement"),
+    (0xABC0, 0xABFF, "Meetei Mayek"),
+    (0xAC00, 0xD7AF, "Hangul Syllables"),
+    (0xD7B0, 0xD7FF, "Hangul Jamo Extended-B"),
+    (0xD800, 0xDB7F, "High Surrogates"),
+    (0xDB80, 0xDBFF, "High Private Use Surrogates"),
+    (0xDC00, 0xDFFF, "Low Surrogates"),
+    (0xE000, 0xF8FF, "Private Use Area"),
+    (0xF900, 0xFAFF, "CJK Compatibility Ideographs"),
+    (0xFB00, 0xFB4F, "Alphabetic Presentation Forms"),
+    (0xFB50, 0xFDFF, "Arabic Presentation Forms-A"),
+    (0xFE00, 0xFE0F, "Variation Selectors"),
+    (0xFE10, 0xFE1F, "Vertical Forms"),
+    (0xFE20, 0xFE2F, "Combining Half Marks"),
+    (0xFE30, 0xFE4F, "CJK Compatibility Forms"),
+    (0xFE50, 0xFE6F, "Small Form Variants"),
+    (0xFE70, 0xFEFF, "Arabic Presentation Forms-B"),
+    (0xFF00, 0xFFEF, "Halfwidth and Fullwidth Forms"),
+    (0xFFF0, 0xFFFF, "Specials"),
+    (0x10000, 0x1007F, "Linear B Syllabary"),
+    (0x10080, 0x100FF, "Linear B Ideograms"),
+    (0x10100, 0x1013F, "Aegean Numbers"),
+    (0x10140, 0x1018F, "Ancient Greek Numbers"),
+    (0x10190, 0x101CF, "Ancient Symbols"),
+    (0x101D0, 0x101FF, "Phaistos Disc"),
+    (0x10280, 0x1029F, "Lycian"),
+    (0x102A0, 0x102DF, "Carian"),
+    (0x102E0, 0x102FF, "Coptic Epact Numbers"),
+    (0x10300, 0x1032F, "Old Italic"),
+    (0x10330, 0x1034F, "Gothic"),
+    (0x10350, 0x1037F, "Old Permic"),
+    (0x10380, 0x1039F, "Ugaritic"),
+    (0x103A0, 0x103DF, "Old Persian"),
+    (0x10400, 0x1044F, "Deseret"),
+    (0x10450, 0x1047F, "Shavian"),
+    (0x10480, 0x104AF, "Osmanya"),
+    (0x104B0, 0x104FF, "Osage"),
+    (0x10500, 0x1052F, "Elbasan"),
+    (0x10530, 0x1056F, "Caucasian Albanian"),
+    (0x10570, 0x105BF, "Vithkuqi"),
+    (0x10600, 0x1077F, "Linear A"),
+    (0x10780, 0x107BF, "Latin Extended-F"),
+    (0x10800, 0x1083F, "Cypriot Syllabary"),
+    (0x10840, 0x1085F, "Imperial Aramaic"),
+    (0x10860, 0x1087F, "Palmyrene"),
+    (0x10880, 0x108AF, "Nabataean"),
+    (0x108E0, 0x108FF, "Hatran"),
+    (0x10900, 0x1091F, "Phoenician"),
+    (0x10920, 0x1093F, "Lydian"),
+    (0x10980, 0x1099F, "Meroitic Hieroglyphs"),
+    (0x109A0, 0x109FF, "Meroitic Cursive"),
+    (0x10A00, 0x10A5F, "Kharoshthi"),
+    (0x10A60, 0x10A7F, "Old South Arabian"),
+    (0x10A80, 0x10A9F, "Old North Arabian"),
+    (0x10AC0, 0x10AFF, "Manichaean"),
+    (0x10B00, 0x10B3F, "Avestan"),
+    (0x10B40, 0x10B5F, "Inscriptional Parthian"),
+    (0x10B60, 0x10B7F, "Inscriptional Pahlavi"),
+    (0x10B80, 0x10BAF, "Psalter Pahlavi"),
+    (0x10C00, 0x10C4F, "Old Turkic"),
+    (0x10C80, 0x10CFF, "Old Hungarian"),
+    (0x10D00, 0x10D3F, "Hanifi Rohingya"),
+    (0x10E60, 0x10E7F, "Rumi Numeral Symbols"),
+    (0x10E80, 0x10EBF, "Yezidi"),
+    (0x10F00, 0x10F2F, "Old Sogdian"),
+    (0x10F30, 0x10F6F, "Sogdian"),
+    (0x10F70, 0x10FAF, "Old Uyghur"),
+    (0x10FB0, 0x10FDF, "Chorasmian"),
+    (0x10FE0, 0x10FFF, "Elymaic"),
+    (0x11000, 0x1107F, "Brahmi"),
+    (0x11080, 0x110CF, "Kaithi"),
+    (0x110D0, 0x110FF, "Sora Sompeng"),
+    (0x11100, 0x1114F, "Chakma"),
+    (0x11150, 0x1117F, "Mahajani"),
+    (0x11180, 0x111DF, "Sharada"),
+    (0x111E0, 0x111FF, "Sinhala Archaic Numbers"),
+    (0x11200, 0x1124F, "Khojki"),
+    (0x11280, 0x112AF, "Multani"),
+    (0x112B0, 0x112FF, "Khudawadi"),
+    (0x11300, 0x1137F, "Grantha"),
+    (0x11400, 0x1147F, "Newa"),
+    (0x11480, 0x114DF, "Tirhuta"),
+    (0x11580, 0x115FF, "Siddham"),
+    (0x11600, 0x1165F, "Modi"),
+    (0x11660, 0x1167F, "Mongolian Supplement"),
+    (0x11680, 0x116CF, "Takri"),
+    (0x11700, 0x1174F, "Ahom"),
+    (0x11800, 0x1184F, "Dogra"),
+    (0x118A0, 0x118FF, "Warang Citi"),
+    (0x11900, 0x1195F, "Dives Akuru"),
+    (0x119A0, 0x119FF, "Nandinagari"),
+    (0x11A00, 0x11A4F, "Zanabazar Square"),
+    (0x11A50, 0x11AAF, "Soyombo"),
+    (0x11AB0, 0x11ABF, "Unified Canadian Aboriginal Syllabics Extended-A"),
+    (0x11AC0, 0x11AFF, "Pau Cin Hau"),
+    (0x11C00, 0x11C6F, "Bhaiksuki"),
+    (0x11C70, 0x11CBF, "Marchen"),
+    (0x11D00, 0x11D5F, "Masaram Gondi"),
+    (0x11D60, 0x11DAF, "Gunjala Gondi"),
+    (0x11EE0, 0x11EFF, "Makasar"),
+    (0x11FB0, 0x11FBF, "Lisu Supplement"),
+    (0x11FC0, 0x11FFF, "Tamil Supplement"),
+    (0x12000, 0x123FF, "Cuneiform"),
+    (0x12400, 0x1247F, "Cuneiform Numbers and Punctuation"),
+    (0x12480, 0x1254F, "Early Dynastic Cuneiform"),
+    (0x12F90, 0x12FFF, "Cypro-Minoan"),
+    (0x13000, 0x1342F, "Egyptian Hieroglyphs"),
+    (0x13430, 0x1343F, "Egyptian Hieroglyph Format Controls"),
+    (0x14400, 0x1467F, "Anatolian Hieroglyphs"),
+    (0x16800, 0x16A3F, "Bamum Supplement"),
+    (0x16A40, 0x16A6F, "Mro"),
+    (0x16A70, 0x16ACF, "Tangsa"),
+    (0x16AD0, 0x16AFF, "Bassa Vah"),
+    (0x16B00, 0x16B8F, "Pahawh Hmong"),
+    (0x16E40, 0x16E9F, "Medefaidrin"),
+    (0x16F00, 0x16F9F, "Miao"),
+    (0x16FE0, 0x16FFF, "Ideographic Symbols and Punctuation"),
+    (0x17000, 0x187FF, "Tangut"),
+    (0x18800, 0x18AFF, "Tangut Components"),
+    (0x18B00, 0x18CFF, "Khitan Small Script"),
+    (0x18D00, 0x18D7F, "Tangut Supplement"),
+    (0x1AFF0, 0x1AFFF, "Kana Extended-B"),
+    (0x1B000, 0x1B0FF, "Kana Supplement"),
+    (0x1B100, 0x1B12F, "Kana Extended-A"),
+    (0x1B130, 0x1B16F, "Small Kana Extension"),
+    (0x1B170, 0x1B2FF, "Nushu"),
+    (0x1BC00, 0x1BC9F, "Duployan"),
+    (0x1BCA0, 0x1BCAF, "Shorthand Format Controls"),
+    (0x1CF00, 0x1CFCF, "Znamenny Musical Notation"),
+    (0x1D000, 0x1D0FF, "Byzantine Musical Symbols"),
+    (0x1D100, 0x1D1FF, "Musical Symbols"),
+    (0x1D200, 0x1D24F, "Ancient Greek Musical Notation"),
+    (0x1D2E0, 0x1D2FF, "Mayan Numerals"),
+    (0x1D300, 0x1D35F, "Tai Xuan Jing Symbols"),
+    (0x1D360, 0x1D37F, "Counting Rod Numerals"),
+    (0x1D400, 0x1D7FF, "Mathematical Alphanumeric Symbols"),
+    (0x1D800, 0x1DAAF, "Sutton SignWriting"),
+    (0x1DF00, 0x1DFFF, "Latin Extended-G"),
+    (0x1E000, 0x1E02F, "Glagolitic Supplement"),
+    (0x1E100, 0x1E14F, "Nyiakeng Puachue Hmong"),
+    (0x1E290, 0x1E2BF, "Toto"),
+    (0x1E2C0, 0x1E2FF, "Wancho"),
+    (0x1E7E0, 0x1E7FF, "Ethiopic Extended-B"),
+    (0x1E800, 0x1E8DF, "Mende Kikakui"),
+    (0x1E900, 0x1E95F, "Adlam"),
+    (0x1EC70, 0x1ECBF, "Indic Siyaq Numbers"),
+    (0x1ED00, 0x1ED4F, "Ottoman Siyaq Numbers"),
+    (0x1EE00, 0x1EEFF, "Arabic Mathematical Alphabetic Symbols"),
+    (0x1F000, 0x1F02F, "Mahjong Tiles"),
+    (0x1F030, 0x1F09F, "Domino Tiles"),
+    (0x1F0A0, 0x1F0FF, "Playing Cards"),
+    (0x1F100, 0x1F1FF, "Enclosed Alphanumeric Supplement"),
+    (0x1F200, 0x1F2FF, "Enclosed Ideographic Supplement"),
+    (0x1F300, 0x1F5FF, "Miscellaneous Symbols and Pictographs"),
+    (0x1F600, 0x1F64F, "Emoticons"),
+    (0x1F650, 0x1F67F, "Ornamental Dingbats"),
+    (0x1F680, 0x1F6FF, "Transport and Map Symbols"),
+    (0x1F700, 0x1F77F, "Alchemical Symbols"),
+    (0x1F780, 0x1F7FF, "Geometric Shapes Extended"),
+    (0x1F800, 0x1F8FF, "Supplemental Arrows-C"),
+    (0x1F900, 0x1F9FF, "Supplemental Symbols and Pictographs"),
+    (0x1FA00, 0x1FA6F, "Chess Symbols"),
+    (0x1FA70, 0x1FAFF, "Symbols and Pictographs Extended-A"),
+    (0x1FB00, 0x1FBFF, "Symbols for Legacy Computing"),
+    (0x20000, 0x2A6DF, "CJK Unified Ideographs Extension B"),
+    (0x2A700, 0x2B73F, "CJK Unified Ideographs Extension C"),
+    (0x2B740, 0x2B81F, "CJK Unified Ideographs Extension D"),
+    (0x2B820, 0x2CEAF, "CJK Unified Ideographs Extension E"),
+    (0x2CEB0, 0x2EBEF, "CJK Unified Ideographs Extension F"),
+    (0x2F800, 0x2FA1F, "CJK Compatibility Ideographs Supplement"),
+    (0x30000, 0x3134F, "CJK Unified Ideographs Extension G"),
+    (0xE0000, 0xE007F, "Tags"),
+    (0xE0100, 0xE01EF, "Variation Selectors Supplement"),
+    (0xF0000, 0xFFFFF, "Supplementary Private Use Area-A"),
+    (0x100000, 0x10FFFF, "Supplementary Private Use Area-B"),
+]
+"""(first, last, block name) in code point order."""
+
+SCRIPTS = [
+    (0x0000, 0x0040, "Common"),
+    (0x0041, 0x005A, "Latin"),
+    (0x005B, 0x0060, "Common"),
+    (0x0061, 0x007A, "Latin"),
+    (0x007B, 0x00A9, "Common"),
+    (0x00AA, 0x00AA, "Latin"),
+    (0x00AB, 0x00B9, "Common"),
+    (0x00BA, 0x00BA, "Latin"),
+    (0x00BB, 0x00BF, "Common"),
+    (0x00C0, 0x00D6, "Latin"),
+    (0x00D7, 0x00D7, "Common"),
+    (0x00D8, 0x00F6, "Latin"),
+    (0x00F7, 0x00F7, "Common"),
+    (0x00F8, 0x02B8, "Latin"),
+    (0x02B9, 0x02DF, "Common"),
+    (0x02E0, 0x02E4, "Latin"),
+    (0x02E5, 0x02E9, "Common"),
+    (0x02EA, 0x02EB, "Bopomofo"),
+    (0x02EC, 0x02FF, "Common"),
+    (0x0300, 0x036F, "Inherited"),
+    (0x0370, 0x0373, "Greek"),
+    (0x0374, 0x0374, "Common"),
+    (0x0375, 0x0377, "Greek"),
+    (0x037A, 0x037D, "Greek"),
+    (0x037E, 0x037E, "Common"),
+    (0x037F, 0x037F, "Greek"),
+    (0x0384, 0x0384, "Greek"),
+    (0x0385, 0x0385, "Common"),
+    (0x0386, 0x0386, "Greek"),
+    (0x0387, 0x0387, "Common"),
+    (0x0388, 0x038A, "Greek"),
+    (0x038C, 0x038C, "Greek"),
+    (0x038E, 0x03A1, "Greek"),
+    (0x03A3, 0x03E1, "Greek"),
+    (0x03E2, 0x03EF, "Coptic"),
+    (0x03F0, 0x03FF, "Greek"),
+    (0x0400, 0x0484, "Cyrillic"),
+    (0x0485, 0x0486, "Inherited"),
+    (0x0487, 0x052F, "Cyrillic"),
+    (0x0531, 0x0556, "Armenian"),
+    (0x0559, 0x058A, "Armenian"),
+    (0x058D, 0x058F, "Armenian"),
+    (0x0591, 0x05C7, "Hebrew"),
+    (0x05D0, 0x05EA, "Hebrew"),
+    (0x05EF, 0x05F4, "Hebrew"),
+    (0x0600, 0x0604, "Arabic"),
+    (0x0605, 0x0605, "Common"),
+    (0x0606, 0x060B, "Arabic"),
+    (0x060C, 0x060C, "Common"),
+    (0x060D, 0x061A, "Arabic"),
+    (0x061B, 0x061B, "Common"),
+    (0x061C, 0x061E, "Arabic"),
+    (0x061F, 0x061F, "Common"),
+    (0x0620, 0x063F, "Arabic"),
+    (0x0640, 0x0640, "Common"),
+    (0x0641, 0x064A, "Arabic"),
+    (0x064B, 0x0655, "Inherited"),
+    (0x0656, 0x066F, "Arabic"),
+    (0x0670, 0x0670, "Inherited"),
+    (0x0671, 0x06DC, "Arabic"),
+    (0x06DD, 0x06DD, "Common"),
+    (0x06DE, 0x06FF, "Arabic"),
+    (0x0700, 0x070D, "Syriac"),
+    (0x070F, 0x074A, "Syriac"),
+    (0x074D, 0x074F, "Syriac"),
+    (0x0750, 0x077F, "Arabic"),
+    (0x0780, 0x07B1, "Thaana"),
+    (0x07C0, 0x07FA, "Nko"),
+    (0x07FD, 0x07FF, "Nko"),
+    (0x0800, 0x082D, "Samaritan"),
+    (0x0830, 0x083E, "Samaritan"),
+    (0x0840, 0x085B, "Mandaic"),
+    (0x085E, 0x085E, "Mandaic"),
+    (0x0860, 0x086A, "Syriac"),
+    (0x0870, 0x088E, "Arabic"),
+    (0x0890, 0x0891, "Arabic"),
+    (0x0898, 0x08E1, "Arabic"),
+    (0x08E2, 0x08E2, "Common"),
+    (0x08E3, 0x08FF, "Arabic"),
+    (0x0900, 0x0950, "Devanagari"),
+    (0x0951, 0x0954, "Inherited"),
+    (0x0955, 0x0963, "Devanagari"),
+    (0x0964, 0x0965, "Common"),
+    (0x0966, 0x097F, "Devanagari"),
+    (0x0980, 0x0983, "Bengali"),
+    (0x0985, 0x098C, "Bengali"),
+    (0x098F, 0x0990, "Bengali"),
+    (0x0993, 0x09A8, "Bengali"),
+    (0x09AA, 0x09B0, "Bengali"),
+    (0x09B2, 0x09B2, "Bengali"),
+    (0x09B6, 0x09B9, "Bengali"),
+    (0x09BC, 0x09C4, "Bengali"),
+    (0x09C7, 0x09C8, "Bengali"),
+    (0x09CB, 0x09CE, "Bengali"),
+    (0x09D7, 0x09D7, "Bengali"),
+    (0x09DC, 0x09DD, "Bengali"),
+    (0x09DF, 0x09E3, "Bengali"),
+    (0x09E6, 0x09FE, "Bengali"),
+    (0x0A01, 0x0A03, "Gurmukhi"),
+    (0x0A05, 0x0A0A, "Gurmukhi"),
+    (0x0A0F, 0x0A10, "Gurmukhi"),
+    (0x0A13, 0x0A28, "Gurmukhi"),
+    (0x0A2A, 0x0A30, "Gurmukhi"),
+    (0x0A32, 0x0A33, "Gurmukhi"),
+    (0x0A35, 0x0A36, "Gurmukhi"),
+    (0x0A38, 0x0A39, "Gurmukhi"),
+    (0x0A3C, 0x0A3C, "Gurmukhi"),
+    (0x0A3E, 0x0A42, "Gurmukhi"),
+    (0x0A47, 0x0A48, "Gurmukhi"),
+    (0x0A4B, 0x0A4D, "Gurmukhi"),
+    (0x0A51, 0x0A51, "Gurmukhi"),
+    (0x0A59, 0x0A5C, "Gurmukhi"),
+    (0x0A5E, 0x0A5E, "Gurmukhi"),
+    (0x0A66, 0x0A76, "Gurmukhi"),
+    (0x0A81, 0x0A83, "Gujarati"),
+    (0x0A85, 0x0A8D, "Gujarati"),
+    (0x0A8F, 0x0A91, "Gujarati"),
+    (0x0A93, 0x0AA8, "Gujarati"),
+    (0x0AAA, 0x0AB0, "Gujarati"),
+    (0x0AB2, 0x0AB3, "Gujarati"),
+    (0x0AB5, 0x0AB9, "Gujarati"),
+    (0x0ABC, 0x0AC5, "Gujarati"),
+    (0x0AC7, 0x0AC9, "Gujarati"),
+    (0x0ACB, 0x0ACD, "Gujarati"),
+    (0x0AD0, 0x0AD0, "Gujarati"),
+    (0x0AE0, 0x0AE3, "Gujarati"),
+    (0x0AE6, 0x0AF1, "Gujarati"),
+    (0x0AF9, 0x0AFF, "Gujarati"),
+    (0x0B01, 0x0B03, "Oriya"),
+    (0x0B05, 0x0B0C, "Oriya"),
+    (0x0B0F, 0x0B10, "Oriya"),
+    (0x0B13, 0x0B28, "Oriya"),
+    (0x0B2A, 0x0B30, "Oriya"),
+    (0x0B32, 0x0B33, "Oriya"),
+    (0x0B35, 0x0B39, "Oriya"),
+    (0x0B3C, 0x0B44, "Oriya"),
+    (0x0B47, 0x0B48, "Oriya"),
+    (0x0B4B, 0x0B4D, "Oriya"),
+    (0x0B55, 0x0B57, "Oriya"),
+    (0x0B5C, 0x0B5D, "Oriya"),
+    (0x0B5F, 0x0B63, "Oriya"),
+    (0x0B66, 0x0B77, "Oriya"),
+    (0x0B82, 0x0B83, "Tamil"),
+    (0x0B85, 0x0B8A, "Tamil"),
+    (0x0B8E, 0x0B90, "Tamil"),
+    (0x0B92, 0x0B95, "Tamil"),
+    (0x0B99, 0x0B9A, "Tamil"),
+    (0x0B9C, 0x0B9C, "Tamil"),
+    (0x0B9E, 0x0B9F, "Tamil"),
+    (0x0BA3, 0x0BA4, "Tamil"),
+    (0x0BA8, 0x0BAA, "Tamil"),
+    (0x0BAE, 0x0BB9, "Tamil"),
+    (0x0BBE, 0x0BC2, "Tamil"),
+    (0x0BC6, 0x0BC8, "Tamil"),
+    (0x0BCA, 0x0BCD, "Tamil"),
+    (0x0BD0, 0x0BD0, "Tamil"),
+    (0x0BD7, 0x0BD7, "Tamil"),
+    (0x0BE6, 0x0BFA, "Tamil"),
+    (0x0C00, 0x0C0C, "Telugu"),
+    (0x0C0E, 0x0C10, "Telugu"),
+    (0x0C12, 0x0C28, "Telugu"),
+    (0x0C2A, 0x0C39, "Telugu"),
+    (0x0C3C, 0x0C44, "Telugu"),
+    (0x0C46, 0x0C48, "Telugu"),
+    (0x0C4A, 0x0C4D, "Telugu"),
+    (0x0C55, 0x0C56, "Telugu"),
+    (0x0C58, 0x0C5A, "Telugu"),
+    (0x0C5D, 0x0C5D, "Telugu"),
+    (0x0C60, 0x0C63, "Telugu"),
+    (0x0C66, 0x0C6F, "Telugu"),
+    (0x0C77, 0x0C7F, "Telugu"),
+    (0x0C80, 0x0C8C, "Kannada"),
+    (0x0C8E, 0x0C90, "Kannada"),
+    (0x0C92, 0x0CA8, "Kannada"),
+    (0x0CAA, 0x0CB3, "Kannada"),
+    (0x0CB5, 0x0CB9, "Kannada"),
+    (0x0CBC, 0x0CC4, "Kannada"),
+    (0x0CC6, 0x0CC8, "Kannada"),
+    (0x0CCA, 0x0CCD, "Kannada"),
+    (0x0CD5, 0x0CD6, "Kannada"),
+    (0x0CDD, 0x0CDE, "Kannada"),
+    (0x0CE0, 0x0CE3, "Kannada"),
+    (0x0CE6, 0x0CEF, "Kannada"),
+    (0x0CF1, 0x0CF2, "Kannada"),
+    (0x0D00, 0x0D0C, "Malayalam"),
+    (0x0D0E, 0x0D10, "Malayalam"),
+    (0x0D12, 0x0D44, "Malayalam"),
+    (0x0D46, 0x0D48, "Malayalam"),
+    (0x0D4A, 0x0D4F, "Malayalam"),
+    (0x0D54, 0x0D63, "Malayalam"),
+    (0x0D66, 0x0D7F, "Malayalam"),
+    (0x0D81, 0x0D83, "Sinhala"),
+    (0x0D85, 0x0D96, "Sinhala"),
+    (0x0D9A, 0x0DB1, "Sinhala"),
+    (0x0DB3, 0x0DBB, "Sinhala"),
+    (0x0DBD, 0x0DBD, "Sinhala"),
+    (0x0DC0, 0x0DC6, "Sinhala"),
+    (0x0DCA, 0x0DCA, "Sinhala"),
+    (0x0DCF, 0x0DD4, "Sinhala"),
+    (0x0DD6, 0x0DD6, "Sinhala"),
+    (0x0DD8, 0x0DDF, "Sinhala"),
+    (0x0DE6, 0x0DEF, "Sinhala"),
+    (0x0DF2, 0x0DF4, "Sinhala"),
+    (0x0E01, 0x0E3A, "Thai"),
+    (0x0E3F, 0x0E3F, "Common"),
+    (0x0E40, 0x0E5B, "Thai"),
+    (0x0E81, 0x0E82, "Lao"),
+    (0x0E84, 0x0E84, "Lao"),
+    (0x0E86, 0x0E8A, "Lao"),
+    (0x0E8C, 0x0EA3, "Lao"),
+    (0x0EA5, 0x0EA5, "Lao"),
+    (0x0EA7, 0x0EBD, "Lao"),
+    (0x0EC0, 0x0EC4, "Lao"),
+    (0x0EC6, 0x0EC6, "Lao"),
+    (0x0EC8, 0x0ECD, "Lao"),
+    (0x0ED0, 0x0ED9, "Lao"),
+    (0x0EDC, 0x0EDF, "Lao"),
+    (0x0F00, 0x0F47, "Tibetan"),
+    (0x0F49, 0x0F6C, "Tibetan"),
+    (0x0F71, 0x0F97, "Tibetan"),
+    (0x0F99, 0x0FBC, "Tibetan"),
+    (0x0FBE, 0x0FCC, "Tibetan"),
+    (0x0FCE, 0x0FD4, "Tibetan"),
+    (0x0FD5, 0x0FD8, "Common"),
+    (0x0FD9, 0x0FDA, "Tibetan"),
+    (0x1000, 0x109F, "Myanmar"),
+    (0x10A0, 0x10C5, "Georgian"),
+    (0x10C7, 0x10C7, "Georgian"),
+    (0x10CD, 0x10CD, "Georgian"),
+    (0x10D0, 0x10FA, "Georgian"),
+    (0x10FB, 0x10FB, "Common"),
+    (0x10FC, 0x10FF, "Georgian"),
+    (0x1100, 0x11FF, "Hangul"),
+    (0x1200, 0x1248, "Ethiopic"),
+    (0x124A, 0x124D, "Ethiopic"),
+    (0x1250, 0x1256, "Ethiopic"),
+    (0x1258, 0x1258, "Ethiopic"),
+    (0x125A, 0x125D, "Ethiopic"),
+    (0x1260, 0x1288, "Ethiopic"),
+    (0x128A, 0x128D, "Ethiopic"),
+    (0x1290, 0x12B0, "Ethiopic"),
+    (0x12B2, 0x12B5, "Ethiopic"),
+    (0x12B8, 0x12BE, "Ethiopic"),
+    (0x12C0, 0x12C0, "Ethiopic"),
+    (0x12C2, 0x12C5, "Ethiopic"),
+    (0x12C8, 0x12D6, "Ethiopic"),
+    (0x12D8, 0x1310, "Ethiopic"),
+    (0x1312, 0x1315, "Ethiopic"),
+    (0x1318, 0x135A, "Ethiopic"),
+    (0x135D, 0x137C, "Ethiopic"),
+    (0x1380, 0x1399, "Ethiopic"),
+    (0x13A0, 0x13F5, "Cherokee"),
+    (0x13F8, 0x13FD, "Cherokee"),
+    (0x1400, 0x167F, "Canadian_Aboriginal"),
+    (0x1680, 0x169C, "Ogham"),
+    (0x16A0, 0x16EA, "Runic"),
+    (0x16EB, 0x16ED, "Common"),
+    (0x16EE, 0x16F8, "Runic"),
+    (0x1700, 0x1715, "Tagalog"),
+    (0x171F, 0x171F, "Tagalog"),
+    (0x1720, 0x1734, "Hanunoo"),
+    (0x1735, 0x1736, "Common"),
+    (0x1740, 0x1753, "Buhid"),
+    (0x1760, 0x176C, "Tagbanwa"),
+    (0x176E, 0x1770, "Tagbanwa"),
+    (0x1772, 0x1773, "Tagbanwa"),
+    (0x1780, 0x17DD, "Khmer"),
+    (0x17E0, 0x17E9, "Khmer"),
+    (0x17F0, 0x17F9, "Khmer"),
+    (0x1800, 0x1801, "Mongolian"),
+    (0x1802, 0x1803, "Common"),
+    (0x1804, 0x1804, "Mongolian"),
+    (0x1805, 0x1805, "Common"),
+    (0x1806, 0x1819, "Mongolian"),
+    (0x1820, 0x1878, "Mongolian"),
+    (0x1880, 0x18AA, "Mongolian"),
+    (0x18B0, 0x18F5, "Canadian_Aboriginal"),
+    (0x1900, 0x191E, "Limbu"),
+    (0x1920, 0x192B, "Limbu"),
+    (0x1930, 0x193B, "Limbu"),
+    (0x1940, 0x1940, "Limbu"),
+    (0x1944, 0x194F, "Limbu"),
+    (0x1950, 0x196D, "Tai_Le"),
+    (0x1970, 0x1974, "Tai_Le"),
+    (0x1980, 0x19AB, "New_Tai_Lue"),
+    (0x19B0, 0x19C9, "New_Tai_Lue"),
+    (0x19D0, 0x19DA, "New_Tai_Lue"),
+    (0x19DE, 0x19DF, "New_Tai_Lue"),
+    (0x19E0, 0x19FF, "Khmer"),
+    (0x1A00, 0x1A1B, "Buginese"),
+    (0x1A1E, 0x1A1F, "Buginese"),
+    (0x1A20, 0x1A5E, "Tai_Tham"),
+    (0x1A60, 0x1A7C, "Tai_Tham"),
+    (0x1A7F, 0x1A89, "Tai_Tham"),
+    (0x1A90, 0x1A99, "Tai_Tham"),
+    (0x1AA0, 0x1AAD, "Tai_Tham"),
+    (0x1AB0, 0x1ACE, "Inherited"),
+    (0x1B00, 0x1B4C, "Balinese"),
+    (0x1B50, 0x1B7E, "Balinese"),
+    (0x1B80, 0x1BBF, "Sundanese"),
+    (0x1BC0, 0x1BF3, "Batak"),
+    (0x1BFC, 0x1BFF, "Batak"),
+    (0x1C00, 0x1C37, "Lepcha"),
+    (0x1C3B, 0x1C49, "Lepcha"),
+    (0x1C4D, 0x1C4F, "Lepcha"),
+    (0x1C50, 0x1C7F, "Ol_Chiki"),
+    (0x1C80, 0x1C88, "Cyrillic"),
+    (0x1C90, 0x1CBA, "Georgian"),
+    (0x1CBD, 0x1CBF, "Georgian"),
+    (0x1CC0, 0x1CC7, "Sundanese"),
+    (0x1CD0, 0x1CD2, "Inherited"),
+    (0x1CD3, 0x1CD3, "Common"),
+    (0x1CD4, 0x1CE0, "Inherited"),
+    (0x1CE1, 0x1CE1, "Common"),
+    (0x1CE2, 0x1CE8, "Inherited"),
+    (0x1CE9, 0x1CEC, "Common"),
+    (0x1CED, 0x1CED, "Inherited"),
+    (0x1CEE, 0x1CF3, "Common"),
+    (0x1CF4, 0x1CF4, "Inherited"),
+    (0x1CF5, 0x1CF7, "Common"),
+    (0x1CF8, 0x1CF9, "Inherited"),
+    (0x1CFA, 0x1CFA, "Common"),
+    (0x1D00, 0x1D25, "Latin"),
+    (0x1D26, 0x1D2A, "Greek"),
+    (0x1D2B, 0x1D2B, "Cyrillic"),
+    (0x1D2C, 0x1D5C, "Latin"),
+    (0x1D5D, 0x1D61, "Greek"),
+    (0x1D62, 0x1D65, "Latin"),
+    (0x1D66, 0x1D6A, "Greek"),
+    (0x1D6B, 0x1D77, "Latin"),
+    (0x1D78, 0x1D78, "Cyrillic"),
+    (0x1D79, 0x1DBE, "Latin"),
+    (0x1DBF, 0x1DBF, "Greek"),
+    (0x1DC0, 0x1DFF, "Inherited"),
+    (0x1E00, 0x1EFF, "Latin"),
+    (0x1F00, 0x1F15, "Greek"),
+    (0x1F18, 0x1F1D, "Greek"),
+    (0x1F20, 0x1F45, "Greek"),
+    (0x1F48, 0x1F4D, "Greek"),
+    (0x1F50, 0x1F57, "Greek"),
+    (0x1F59, 0x1F59, "Greek"),
+    (0x1F5B, 0x1F5B, "Greek"),
+    (0x1F5D, 0x1F5D, "Greek"),
+    (0x1F5F, 0x1F7D, "Greek"),
+    (0x1F80, 0x1FB4, "Greek"),
+    (0x1FB6, 0x1FC4, "Greek"),
+    (0x1FC6, 0x1FD3, "Greek"),
+    (0x1FD6, 0x1FDB, "Greek"),
+    (0x1FDD, 0x1FEF, "Greek"),
+    (0x1FF2, 0x1FF4, "Greek"),
+    (0x1FF6, 0x1FFE, "Greek"),
+    (0x2000, 0x200B, "Common"),
+    (0x200C, 0x200D, "Inherited"),
+    (0x200E, 0x2064, "Common"),
+    (0x2066, 0x2070, "Common"),
+    (0x2071, 0x2071, "Latin"),
+    (0x2074, 0x207E, "Common"),
+    (0x207F, 0x207F, "Latin"),
+    (0x2080, 0x208E, "Common"),
+    (0x2090, 0x209C, "Latin"),
+    (0x20A0, 0x20C0, "Common"),
+    (0x20D0, 0x20F0, "Inherited"),
+    (0x2100, 0x2125, "Common"),
+    (0x2126, 0x2126, "Greek"),
+    (0x2127, 0x2129, "Common"),
+    (0x212A, 0x212B, "Latin"),
+    (0x212C, 0x2131, "Common"),
+    (0x2132, 0x2132, "Latin"),
+    (0x2133, 0x214D, "Common"),
+    (0x214E, 0x214E, "Latin"),
+    (0x214F, 0x215F, "Common"),
+    (0x2160, 0x2188, "Latin"),
+    (0x2189, 0x218B, "Common"),
+    (0x2190, 0x2426, "Common"),
+    (0x2440, 0x244A, "Common"),
+    (0x2460, 0x27FF, "Common"),
+    (0x2800, 0x28FF, "Braille"),
+    (0x2900, 0x2B73, "Common"),
+    (0x2B76, 0x2B95, "Common"),
+    (0x2B97, 0x2BFF, "Common"),
+    (0x2C00, 0x2C5F, "Glagolitic"),
+    (0x2C60, 0x2C7F, "Latin"),
+    (0x2C80, 0x2CF3, "Coptic"),
+    (0x2CF9, 0x2CFF, "Coptic"),
+    (0x2D00, 0x2D25, "Georgian"),
+    (0x2D27, 0x2D27, "Georgian"),
+    (0x2D2D, 0x2D2D, "Georgian"),
+    (0x2D30, 0x2D67, "Tifinagh"),
+    (0x2D6F, 0x2D70, "Tifinagh"),
+    (0x2D7F, 0x2D7F, "Tifinagh"),
+    (0x2D80, 0x2D96, "Ethiopic"),
+    (0x2DA0, 0x2DA6, "Ethiopic"),
+    (0x2DA8, 0x2DAE, "Ethiopic"),
+    (0x2DB0, 0x2DB6, "Ethiopic"),
+    (0x2DB8, 0x2DBE, "Ethiopic"),
+    (0x2DC0, 0x2DC6, "Ethiopic"),
+    (0x2DC8, 0x2DCE, "Ethiopic"),
+    (0x2DD0, 0x2DD6, "Ethiopic"),
+    (0x2DD8, 0x2DDE, "Ethiopic"),
+    (0x2DE0, 0x2DFF, "Cyrillic"),
+    (0x2E00, 0x2E5D, "Common"),
+    (0x2E80, 0x2E99, "Han"),
+    (0x2E9B, 0x2EF3, "Han"),
+    (0x2F00, 0x2FD5, "Han"),
+    (0x2FF0, 0x2FFB, "Common"),
+    (0x3000, 0x3004, "Common"),
+    (0x3005, 0x3005, "Han"),
+    (0x3006, 0x3006, "Common"),
+    (0x3007, 0x3007, "Han"),
+    (0x3008, 0x3020, "Common"),
+    (0x3021, 0x3029, "Han"),
+    (0x302A, 0x302D, "Inherited"),
+    (0x302E, 0x302F, "Hangul"),
+    (0x3030, 0x3037, "Common"),
+    (0x3038, 0x303B, "Han"),
+    (0x303C, 0x303F, "Common"),
+    (0x3041, 0x3096, "Hiragana"),
+    (0x3099, 0x309A, "Inherited"),
+    (0x309B, 0x309C, "Common"),
+    (0x309D, 0x309F, "Hiragana"),
+    (0x30A0, 0x30A0, "Common"),
+    (0x30A1, 0x30FA, "Katakana"),
+    (0x30FB, 0x30FC, "Common"),
+    (0x30FD, 0x30FF, "Katakana"),
+    (0x3105, 0x312F, "Bopomofo"),
+    (0x3131, 0x318E, "Hangul"),
+    (0x3190, 0x319F, "Common"),
+    (0x31A0, 0x31BF, "Bopomofo"),
+    (0x31C0, 0x31E3, "Common"),
+    (0x31F0, 0x31FF, "Katakana"),
+    (0x3200, 0x321E, "Hangul"),
+    (0x3220, 0x325F, "Common"),
+    (0x3260, 0x327E, "Hangul"),
+    (0x327F, 0x32CF, "Common"),
+    (0x32D0, 0x32FE, "Katakana"),
+    (0x32FF, 0x32FF, "Common"),
+    (0x3300, 0x3357, "Katakana"),
+    (0x3358, 0x33FF, "Common"),
+    (0x3400, 0x4DBF, "Han"),
+    (0x4DC0, 0x4DFF, "Common"),
+    (0x4E00, 0x9FFF, "Han"),
+    (0xA000, 0xA48C, "Yi"),
+    (0xA490, 0xA4C6, "Yi"),
+    (0xA4D0, 0xA4FF, "Lisu"),
+    (0xA500, 0xA62B, "Vai"),
+    (0xA640, 0xA69F, "Cyrillic"),
+    (0xA6A0, 0xA6F7, "Bamum"),
+    (0xA700, 0xA721, "Common"),
+    (0xA722, 0xA787, "Latin"),
+    (0xA788, 0xA78A, "Common"),
+    (0xA78B, 0xA7CA, "Latin"),
+    (0xA7D0, 0xA7D1, "Latin"),
+    (0xA7D3, 0xA7D3, "Latin"),
+    (0xA7D5, 0xA7D9, "Latin"),
+    (0xA7F2, 0xA7FF, "Latin"),
+    (0xA800, 0xA82C, "Syloti_Nagri"),
+    (0xA830, 0xA839, "Common"),
+    (0xA840, 0xA877, "Phags_Pa"),
+    (0xA880, 0xA8C5, "Saurashtra"),
+    (0xA8CE, 0xA8D9, "Saurashtra"),
+    (0xA8E0, 0xA8FF, "Devanagari"),
+    (0xA900, 0xA92D, "Kayah_Li"),
+    (0xA92E, 0xA92E, "Common"),
+    (0xA92F, 0xA92F, "Kayah_Li"),
+    (0xA930, 0xA953, "Rejang"),
+    (0xA95F, 0xA95F, "Rejang"),
+    (0xA960, 0xA97C, "Hangul"),
+    (0xA980, 0xA9CD, "Javanese"),
+    (0xA9CF, 0xA9CF, "Common"),
+    (0xA9D0, 0xA9D9, "Javanese"),
+    (0xA9DE, 0xA9DF, "Javanese"),
+    (0xA9E0, 0xA9FE, "Myanmar"),
+    (0xAA00, 0xAA36, "Cham"),
+    (0xAA40, 0xAA4D, "Cham"),
+    (0xAA50, 0xAA59, "Cham"),
+    (0xAA5C, 0xAA5F, "Cham"),
+    (0xAA60, 0xAA7F, "Myanmar"),
+    (0xAA80, 0xAAC2, "Tai_Viet"),
+    (0xAADB, 0xAADF, "Tai_Viet"),
+    (0xAAE0, 0xAAF6, "Meetei_Mayek"),
+    (0xAB01, 0xAB06, "Ethiopic"),
+    (0xAB09, 0xAB0E, "Ethiopic"),
+    (0xAB11, 0xAB16, "Ethiopic"),
+    (0xAB20, 0xAB26, "Ethiopic"),
+    (0xAB28, 0xAB2E, "Ethiopic"),
+    (0xAB30, 0xAB5A, "Latin"),
+    (0xAB5B, 0xAB5B, "Common"),
+    (0xAB5C, 0xAB64, "Latin"),
+    (0xAB65, 0xAB65, "Greek"),
+    (0xAB66, 0xAB69, "Latin"),
+    (0xAB6A, 0xAB6B, "Common"),
+    (0xAB70, 0xABBF, "Cherokee"),
+    (0xABC0, 0xABED, "Meetei_Mayek"),
+    (0xABF0, 0xABF9, "Meetei_Mayek"),
+    (0xAC00, 0xD7A3, "Hangul"),
+    (0xD7B0, 0xD7C6, "Hangul"),
+    (0xD7CB, 0xD7FB, "Hangul"),
+    (0xF900, 0xFA6D, "Han"),
+    (0xFA70, 0xFAD9, "Han"),
+    (0xFB00, 0xFB06, "Latin"),
+    (0xFB13, 0xFB17, "Armenian"),
+    (0xFB1D, 0xFB36, "Hebrew"),
+    (0xFB38, 0xFB3C, "Hebrew"),
+    (0xFB3E, 0xFB3E, "Hebrew"),
+    (0xFB40, 0xFB41, "Hebrew"),
+    (0xFB43, 0xFB44, "Hebrew"),
+    (0xFB46, 0xFB4F, "Hebrew"),
+    (0xFB50, 0xFBC2, "Arabic"),
+    (0xFBD3, 0xFD3D, "Arabic"),
+    (0xFD3E, 0xFD3F, "Common"),
+    (0xFD40, 0xFD8F, "Arabic"),
+    (0xFD92, 0xFDC7, "Arabic"),
+    (0xFDCF, 0xFDCF, "Arabic"),
+    (0xFDF0, 0xFDFF, "Arabic"),
+    (0xFE00, 0xFE0F, "Inherited"),
+    (0xFE10, 0xFE19, "Common"),
+    (0xFE20, 0xFE2D, "Inherited"),
+    (0xFE2E, 0xFE2F, "Cyrillic"),
+    (0xFE30, 0xFE52, "Common"),
+    (0xFE54, 0xFE66, "Common"),
+    (0xFE68, 0xFE6B, "Common"),
+    (0xFE70, 0xFE74, "Arabic"),
+    (0xFE76, 0xFEFC, "Arabic"),
+    (0xFEFF, 0xFEFF, "Common"),
+    (0xFF01, 0xFF20, "Common"),
+    (0xFF21, 0xFF3A, "Latin"),
+    (0xFF3B, 0xFF40, "Common"),
+    (0xFF41, 0xFF5A, "Latin"),
+    (0xFF5B, 0xFF65, "Common"),
+    (0xFF66, 0xFF6F, "Katakana"),
+    (0xFF70, 0xFF70, "Common"),
+    (0xFF71, 0xFF9D, "Katakana"),
+    (0xFF9E, 0xFF9F, "Common"),
+    (0xFFA0, 0xFFBE, "Hangul"),
+    (0xFFC2, 0xFFC7, "Hangul"),
+    (0xFFCA, 0xFFCF, "Hangul"),
+    (0xFFD2, 0xFFD7, "Hangul"),
+    (0xFFDA, 0xFFDC, "Hangul"),
+    (0xFFE0, 0xFFE6, "Common"),
+    (0xFFE8, 0xFFEE, "Common"),
+    (0xFFF9, 0xFFFD, "Common"),
+    (0x10000, 0x1000B, "Linear_B"),
+    (0x1000D, 0x10026, "Linear_B"),
+    (0x10028, 0x1003A, "Linear_B"),
+    (0x1003C, 0x1003D, "Linear_B"),
+    (0x1003F, 0x1004D, "Linear_B"),
+    (0x10050, 0x1005D, "Linear_B"),
+    (0x10080, 0x100FA, "Linear_B"),
+    (0x10100, 0x10102, "Common"),
+    (0x10107, 0x10133, "Common"),
+    (0x10137, 0x1013F, "Common"),
+    (0x10140, 0x1018E, "Greek"),
+    (0x10190, 0x1019C, "Common"),
+    (0x101A0, 0x101A0, "Greek"),
+    (0x101D0, 0x101FC, "Common"),
+    (0x101FD, 0x101FD, "Inherited"),
+    (0x10280, 0x1029C, "Lycian"),
+    (0x102A0, 0x102D0, "Carian"),
+    (0x102E0, 0x102E0, "Inherited"),
+    (0x102E1, 0x102FB, "Common"),
+    (0x10300, 0x10323, "Old_Italic"),
+    (0x1032D, 0x1032F, "Old_Italic"),
+    (0x10330, 0x1034A, "Gothic"),
+    (0x10350, 0x1037A, "Old_Permic"),
+    (0x10380, 0x1039D, "Ugaritic"),
+    (0x1039F, 0x1039F, "Ugaritic"),
+    (0x103A0, 0x103C3, "Old_Persian"),
+    (0x103C8, 0x103D5, "Old_Persian"),
+    (0x10400, 0x1044F, "Deseret"),
+    (0x10450, 0x1047F, "Shavian"),
+    (0x10480, 0x1049D, "Osmanya"),
+    (0x104A0, 0x104A9, "Osmanya"),
+    (0x104B0, 0x104D3, "Osage"),
+    (0x104D8, 0x104FB, "Osage"),
+    (0x10500, 0x10527, "Elbasan"),
+    (0x10530, 0x10563, "Caucasian_Albanian"),
+    (0x1056F, 0x1056F, "Caucasian_Albanian"),
+    (0x10570, 0x1057A, "Vithkuqi"),
+    (0x1057C, 0x1058A, "Vithkuqi"),
+    (0x1058C, 0x10592, "Vithkuqi"),
+    (0x10594, 0x10595, "Vithkuqi"),
+    (0x10597, 0x105A1, "Vithkuqi"),
+    (0x105A3, 0x105B1, "Vithkuqi"),
+    (0x105B3, 0x105B9, "Vithkuqi"),
+    (0x105BB, 0x105BC, "Vithkuqi"),
+    (0x10600, 0x10736, "Linear_A"),
+    (0x10740, 0x10755, "Linear_A"),
+    (0x10760, 0x10767, "Linear_A"),
+    (0x10780, 0x10785, "Latin"),
+    (0x10787, 0x107B0, "Latin"),
+    (0x107B2, 0x107BA, "Latin"),
+    (0x10800, 0x10805, "Cypriot"),
+    (0x10808, 0x10808, "Cypriot"),
+    (0x1080A, 0x10835, "Cypriot"),
+    (0x10837, 0x10838, "Cypriot"),
+    (0x1083C, 0x1083C, "Cypriot"),
+    (0x1083F, 0x1083F, "Cypriot"),
+    (0x10840, 0x10855, "Imperial_Aramaic"),
+    (0x10857, 0x1085F, "Imperial_Aramaic"),
+    (0x10860, 0x1087F, "Palmyrene"),
+    (0x10880, 0x1089E, "Nabataean"),
+    (0x108A7, 0x108AF, "Nabataean"),
+    (0x108E0, 0x108F2, "Hatran"),
+    (0x108F4, 0x108F5, "Hatran"),
+    (0x108FB, 0x108FF, "Hatran"),
+    (0x10900, 0x1091B, "Phoenician"),
+    (0x1091F, 0x1091F, "Phoenician"),
+    (0x10920, 0x10939, "Lydian"),
+    (0x1093F, 0x1093F, "Lydian"),
+    (0x10980, 0x1099F, "Meroitic_Hieroglyphs"),
+    (0x109A0, 0x109B7, "Meroitic_Cursive"),
+    (0x109BC, 0x109CF, "Meroitic_Cursive"),
+    (0x109D2, 0x109FF, "Meroitic_Cursive"),
+    (0x10A00, 0x10A03, "Kharoshthi"),
+    (0x10A05, 0x10A06, "Kharoshthi"),
+    (0x10A0C, 0x10A13, "Kharoshthi"),
+    (0x10A15, 0x10A17, "Kharoshthi"),
+    (0x10A19, 0x10A35, "Kharoshthi"),
+    (0x10A38, 0x10A3A, "Kharoshthi"),
+    (0x10A3F, 0x10A48, "Kharoshthi"),
+    (0x10A50, 0x10A58, "Kharoshthi"),
+    (0x10A60, 0x10A7F, "Old_South_Arabian"),
+    (0x10A80, 0x10A9F, "Old_North_Arabian"),
+    (0x10AC0, 0x10AE6, "Manichaean"),
+    (0x10AEB, 0x10AF6, "Manichaean"),
+    (0x10B00, 0x10B35, "Avestan"),
+    (0x10B39, 0x10B3F, "Avestan"),
+    (0x10B40, 0x10B55, "Inscriptional_Parthian"),
+    (0x10B58, 0x10B5F, "Inscriptional_Parthian"),
+    (0x10B60, 0x10B72, "Inscriptional_Pahlavi"),
+    (0x10B78, 0x10B7F, "Inscriptional_Pahlavi"),
+    (0x10B80, 0x10B91, "Psalter_Pahlavi"),
+    (0x10B99, 0x10B9C, "Psalter_Pahlavi"),
+    (0x10BA9, 0x10BAF, "Psalter_Pahlavi"),
+    (0x10C00, 0x10C48, "Old_Turkic"),
+    (0x10C80, 0x10CB2, "Old_Hungarian"),
+    (0x10CC0, 0x10CF2, "Old_Hungarian"),
+    (0x10CFA, 0x10CFF, "Old_Hungarian"),
+    (0x10D00, 0x10D27, "Hanifi_Rohingya"),
+    (0x10D30, 0x10D39, "Hanifi_Rohingya"),
+    (0x10E60, 0x10E7E, "Arabic"),
+    (0x10E80, 0x10EA9, "Yezidi"),
+    (0x10EAB, 0x10EAD, "Yezidi"),
+    (0x10EB0, 0x10EB1, "Yezidi"),
+    (0x10F00, 0x10F27, "Old_Sogdian"),
+    (0x10F30, 0x10F59, "Sogdian"),
+    (0x10F70, 0x10F89, "Old_Uyghur"),
+    (0x10FB0, 0x10FCB, "Chorasmian"),
+    (0x10FE0, 0x10FF6, "Elymaic"),
+    (0x11000, 0x1104D, "Brahmi"),
+    (0x11052, 0x11075, "Brahmi"),
+    (0x1107F, 0x1107F, "Brahmi"),
+    (0x11080, 0x110C2, "Kaithi"),
+    (0x110CD, 0x110CD, "Kaithi"),
+    (0x110D0, 0x110E8, "Sora_Sompeng"),
+    (0x110F0, 0x110F9, "Sora_Sompeng"),
+    (0x11100, 0x11134, "Chakma"),
+    (0x11136, 0x11147, "Chakma"),
+    (0x11150, 0x11176, "Mahajani"),
+    (0x11180, 0x111DF, "Sharada"),
+    (0x111E1, 0x111F4, "Sinhala"),
+    (0x11200, 0x11211, "Khojki"),
+    (0x11213, 0x1123E, "Khojki"),
+    (0x11280, 0x11286, "Multani"),
+    (0x11288, 0x11288, "Multani"),
+    (0x1128A, 0x1128D, "Multani"),
+    (0x1128F, 0x1129D, "Multani"),
+    (0x1129F, 0x112A9, "Multani"),
+    (0x112B0, 0x112EA, "Khudawadi"),
+    (0x112F0, 0x112F9, "Khudawadi"),
+    (0x11300, 0x11303, "Grantha"),
+    (0x11305, 0x1130C, "Grantha"),
+    (0x1130F, 0x11310, "Grantha"),
+    (0x11313, 0x11328, "Grantha"),
+    (0x1132A, 0x11330, "Grantha"),
+    (0x11332, 0x11333, "Grantha"),
+    (0x11335, 0x11339, "Grantha"),
+    (0x1133B, 0x1133B, "Inherited"),
+    (0x1133C, 0x11344, "Grantha"),
+    (0x11347, 0x11348, "Grantha"),
+    (0x1134B, 0x1134D, "Grantha"),
+    (0x11350, 0x11350, "Grantha"),
+    (0x11357, 0x11357, "Grantha"),
+    (0x1135D, 0x11363, "Grantha"),
+    (0x11366, 0x1136C, "Grantha"),
+    (0x11370, 0x11374, "Grantha"),
+    (0x11400, 0x1145B, "Newa"),
+    (0x1145D, 0x11461, "Newa"),
+    (0x11480, 0x114C7, "Tirhuta"),
+    (0x114D0, 0x114D9, "Tirhuta"),
+    (0x11580, 0x115B5, "Siddham"),
+    (0x115B8, 0x115DD, "Siddham"),
+    (0x11600, 0x11644, "Modi"),
+    (0x11650, 0x11659, "Modi"),
+    (0x11660, 0x1166C, "Mongolian"),
+    (0x11680, 0x116B9, "Takri"),
+    (0x116C0, 0x116C9, "Takri"),
+    (0x11700, 0x1171A, "Ahom"),
+    (0x1171D, 0x1172B, "Ahom"),
+    (0x11730, 0x11746, "Ahom"),
+    (0x11800, 0x1183B, "Dogra"),
+    (0x118A0, 0x118F2, "Warang_Citi"),
+    (0x118FF, 0x118FF, "Warang_Citi"),
+    (0x11900, 0x11906, "Dives_Akuru"),
+    (0x11909, 0x11909, "Dives_Akuru"),
+    (0x1190C, 0x11913, "Dives_Akuru"),
+    (0x11915, 0x11916, "Dives_Akuru"),
+    (0x11918, 0x11935, "Dives_Akuru"),
+    (0x11937, 0x11938, "Dives_Akuru"),
+    (0x1193B, 0x11946, "Dives_Akuru"),
+    (0x11950, 0x11959, "Dives_Akuru"),
+    (0x119A0, 0x119A7, "Nandinagari"),
+    (0x119AA, 0x119D7, "Nandinagari"),
+    (0x119DA, 0x119E4, "Nandinagari"),
+    (0x11A00, 0x11A47, "Zanabazar_Square"),
+    (0x11A50, 0x11AA2, "Soyombo"),
+    (0x11AB0, 0x11ABF, "Canadian_Aboriginal"),
+    (0x11AC0, 0x11AF8, "Pau_Cin_Hau"),
+    (0x11C00, 0x11C08, "Bhaiksuki"),
+    (0x11C0A, 0x11C36, "Bhaiksuki"),
+    (0x11C38, 0x11C45, "Bhaiksuki"),
+    (0x11C50, 0x11C6C, "Bhaiksuki"),
+    (0x11C70, 0x11C8F, "Marchen"),
+    (0x11C92, 0x11CA7, "Marchen"),
+    (0x11CA9, 0x11CB6, "Marchen"),
+    (0x11D00, 0x11D06, "Masaram_Gondi"),
+    (0x11D08, 0x11D09, "Masaram_Gondi"),
+    (0x11D0B, 0x11D36, "Masaram_Gondi"),
+    (0x11D3A, 0x11D3A, "Masaram_Gondi"),
+    (0x11D3C, 0x11D3D, "Masaram_Gondi"),
+    (0x11D3F, 0x11D47, "Masaram_Gondi"),
+    (0x11D50, 0x11D59, "Masaram_Gondi"),
+    (0x11D60, 0x11D65, "Gunjala_Gondi"),
+    (0x11D67, 0x11D68, "Gunjala_Gondi"),
+    (0x11D6A, 0x11D8E, "Gunjala_Gondi"),
+    (0x11D90, 0x11D91, "Gunjala_Gondi"),
+    (0x11D93, 0x11D98, "Gunjala_Gondi"),
+    (0x11DA0, 0x11DA9, "Gunjala_Gondi"),
+    (0x11EE0, 0x11EF8, "Makasar"),
+    (0x11FB0, 0x11FB0, "Lisu"),
+    (0x11FC0, 0x11FF1, "Tamil"),
+    (0x11FFF, 0x11FFF, "Tamil"),
+    (0x12000, 0x12399, "Cuneiform"),
+    (0x12400, 0x1246E, "Cuneiform"),
+    (0x12470, 0x12474, "Cuneiform"),
+    (0x12480, 0x12543, "Cuneiform"),
+    (0x12F90, 0x12FF2, "Cypro_Minoan"),
+    (0x13000, 0x1342E, "Egyptian_Hieroglyphs"),
+    (0x13430, 0x13438, "Egyptian_Hieroglyphs"),
+    (0x14400, 0x14646, "Anatolian_Hieroglyphs"),
+    (0x16800, 0x16A38, "Bamum"),
+    (0x16A40, 0x16A5E, "Mro"),
+    (0x16A60, 0x16A69, "Mro"),
+    (0x16A6E, 0x16A6F, "Mro"),
+    (0x16A70, 0x16ABE, "Tangsa"),
+    (0x16AC0, 0x16AC9, "Tangsa"),
+    (0x16AD0, 0x16AED, "Bassa_Vah"),
+    (0x16AF0, 0x16AF5, "Bassa_Vah"),
+    (0x16B00, 0x16B45, "Pahawh_Hmong"),
+    (0x16B50, 0x16B59, "Pahawh_Hmong"),
+    (0x16B5B, 0x16B61, "Pahawh_Hmong"),
+    (0x16B63, 0x16B77, "Pahawh_Hmong"),
+    (0x16B7D, 0x16B8F, "Pahawh_Hmong"),
+    (0x16E40, 0x16E9A, "Medefaidrin"),
+    (0x16F00, 0x16F4A, "Miao"),
+    (0x16F4F, 0x16F87, "Miao"),
+    (0x16F8F, 0x16F9F, "Miao"),
+    (0x16FE0, 0x16FE0, "Tangut"),
+    (0x16FE1, 0x16FE1, "Nushu"),
+    (0x16FE2, 0x16FE3, "Han"),
+    (0x16FE4, 0x16FE4, "Khitan_Small_Script"),
+    (0x16FF0, 0x16FF1, "Han"),
+    (0x17000, 0x187F7, "Tangut"),
+    (0x18800, 0x18AFF, "Tangut"),
+    (0x18B00, 0x18CD5, "Khitan_Small_Script"),
+    (0x18D00, 0x18D08, "Tangut"),
+    (0x1AFF0, 0x1AFF3, "Katakana"),
+    (0x1AFF5, 0x1AFFB, "Katakana"),
+    (0x1AFFD, 0x1AFFE, "Katakana"),
+    (0x1B000, 0x1B000, "Katakana"),
+    (0x1B001, 0x1B11F, "Hiragana"),
+    (0x1B120, 0x1B122, "Katakana"),
+    (0x1B150, 0x1B152, "Hiragana"),
+    (0x1B164, 0x1B167, "Katakana"),
+    (0x1B170, 0x1B2FB, "Nushu"),
+    (0x1BC00, 0x1BC6A, "Duployan"),
+    (0x1BC70, 0x1BC7C, "Duployan"),
+    (0x1BC80, 0x1BC88, "Duployan"),
+    (0x1BC90, 0x1BC99, "Duployan"),
+    (0x1BC9C, 0x1BC9F, "Duployan"),
+    (0x1BCA0, 0x1BCA3, "Common"),
+    (0x1CF00, 0x1CF2D, "Inherited"),
+    (0x1CF30, 0x1CF46, "Inherited"),
+    (0x1CF50, 0x1CFC3, "Common"),
+    (0x1D000, 0x1D0F5, "Common"),
+    (0x1D100, 0x1D126, "Common"),
+    (0x1D129, 0x1D166, "Common"),
+    (0x1D167, 0x1D169, "Inherited"),
+    (0x1D16A, 0x1D17A, "Common"),
+    (0x1D17B, 0x1D182, "Inherited"),
+    (0x1D183, 0x1D184, "Common"),
+    (0x1D185, 0x1D18B, "Inherited"),
+    (0x1D18C, 0x1D1A9, "Common"),
+    (0x1D1AA, 0x1D1AD, "Inherited"),
+    (0x1D1AE, 0x1D1EA, "Common"),
+    (0x1D200, 0x1D245, "Greek"),
+    (0x1D2E0, 0x1D2F3, "Common"),
+    (0x1D300, 0x1D356, "Common"),
+    (0x1D360, 0x1D378, "Common"),
+    (0x1D400, 0x1D454, "Common"),
+    (0x1D456, 0x1D49C, "Common"),
+    (0x1D49E, 0x1D49F, "Common"),
+    (0x1D4A2, 0x1D4A2, "Common"),
+    (0x1D4A5, 0x1D4A6, "Common"),
+    (0x1D4A9, 0x1D4AC, "Common"),
+    (0x1D4AE, 0x1D4B9, "Common"),
+    (0x1D4BB, 0x1D4BB, "Common"),
+    (0x1D4BD, 0x1D4C3, "Common"),
+    (0x1D4C5, 0x1D505, "Common"),
+    (0x1D507, 0x1D50A, "Common"),
+    (0x1D50D, 0x1D514, "Common"),
+    (0x1D516, 0x1D51C, "Common"),
+    (0x1D51E, 0x1D539, "Common"),
+    (0x1D53B, 0x1D53E, "Common"),
+    (0x1D540, 0x1D544, "Common"),
+    (0x1D546, 0x1D546, "Common"),
+    (0x1D54A, 0x1D550, "Common"),
+    (0x1D552, 0x1D6A5, "Common"),
+    (0x1D6A8, 0x1D7CB, "Common"),
+    (0x1D7CE, 0x1D7FF, "Common"),
+    (0x1D800, 0x1DA8B, "SignWriting"),
+    (0x1DA9B, 0x1DA9F, "SignWriting"),
+    (0x1DAA1, 0x1DAAF, "SignWriting"),
+    (0x1DF00, 0x1DF1E, "Latin"),
+    (0x1E000, 0x1E006, "Glagolitic"),
+    (0x1E008, 0x1E018, "Glagolitic"),
+    (0x1E01B, 0x1E021, "Glagolitic"),
+    (0x1E023, 0x1E024, "Glagolitic"),
+    (0x1E026, 0x1E02A, "Glagolitic"),
+    (0x1E100, 0x1E12C, "Nyiakeng_Puachue_Hmong"),
+    (0x1E130, 0x1E13D, "Nyiakeng_Puachue_Hmong"),
+    (0x1E140, 0x1E149, "Nyiakeng_Puachue_Hmong"),
+    (0x1E14E, 0x1E14F, "Nyiakeng_Puachue_Hmong"),
+    (0x1E290, 0x1E2AE, "Toto"),
+    (0x1E2C0, 0x1E2F9, "Wancho"),
+    (0x1E2FF, 0x1E2FF, "Wancho"),
+    (0x1E7E0, 0x1E7E6, "Ethiopic"),
+    (0x1E7E8, 0x1E7EB, "Ethiopic"),
+    (0x1E7ED, 0x1E7EE, "Ethiopic"),
+    (0x1E7F0, 0x1E7FE, "Ethiopic"),
+    (0x1E800, 0x1E8C4, "Mende_Kikakui"),
+    (0x1E8C7, 0x1E8D6, "Mende_Kikakui"),
+    (0x1E900, 0x1E94B, "Adlam"),
+    (0x1E950, 0x1E959, "Adlam"),
+    (0x1E95E, 0x1E95F, "Adlam"),
+    (0x1EC71, 0x1ECB4, "Common"),
+    (0x1ED01, 0x1ED3D, "Common"),
+    (0x1EE00, 0x1EE03, "Arabic"),
+    (0x1EE05, 0x1EE1F, "Arabic"),
+    (0x1EE21, 0x1EE22, "Arabic"),
+    (0x1EE24, 0x1EE24, "Arabic"),
+    (0x1EE27, 0x1EE27, "Arabic"),
+    (0x1EE29, 0x1EE32, "Arabic"),
+    (0x1EE34, 0x1EE37, "Arabic"),
+    (0x1EE39, 0x1EE39, "Arabic"),
+    (0x1EE3B, 0x1EE3B, "Arabic"),
+    (0x1EE42, 0x1EE42, "Arabic"),
+    (0x1EE47, 0x1EE47, "Arabic"),
+    (0x1EE49, 0x1EE49, "Arabic"),
+    (0x1EE4B, 0x1EE4B, "Arabic"),
+    (0x1EE4D, 0x1EE4F, "Arabic"),
+    (0x1EE51, 0x1EE52, "Arabic"),
+    (0x1EE54, 0x1EE54, "Arabic"),
+    (0x1EE57, 0x1EE57, "Arabic"),
+    (0x1EE59, 0x1EE59, "Arabic"),
+    (0x1EE5B, 0x1EE5B, "Arabic"),
+    (0x1EE5D, 0x1EE5D, "Arabic"),
+    (0x1EE5F, 0x1EE5F, "Arabic"),
+    (0x1EE61, 0x1EE62, "Arabic"),
+    (0x1EE64, 0x1EE64, "Arabic"),
+    (0x1EE67, 0x1EE6A, "Arabic"),
+    (0x1EE6C, 0x1EE72, "Arabic"),
+    (0x1EE74, 0x1EE77, "Arabic"),
+    (0x1EE79, 0x1EE7C, "Arabic"),
+    (0x1EE7E, 0x1EE7E, "Arabic"),
+    (0x1EE80, 0x1EE89, "Arabic"),
+    (0x1EE8B, 0x1EE9B, "Arabic"),
+    (0x1EEA1, 0x1EEA3, "Arabic"),
+    (0x1EEA5, 0x1EEA9, "Arabic"),
+    (0x1EEAB, 0x1EEBB, "Arabic"),
+    (0x1EEF0, 0x1EEF1, "Arabic"),
+    (0x1F000, 0x1F02B, "Common"),
+    (0x1F030, 0x1F093, "Common"),
+    (0x1F0A0, 0x1F0AE, "Common"),
+    (0x1F0B1, 0x1F0BF, "Common"),
+    (0x1F0C1, 0x1F0CF, "Common"),
+    (0x1F0D1, 0x1F0F5, "Common"),
+    (0x1F100, 0x1F1AD, "Common"),
+    (0x1F1E6, 0x1F1FF, "Common"),
+    (0x1F200, 0x1F200, "Hiragana"),
+    (0x1F201, 0x1F202, "Common"),
+    (0x1F210, 0x1F23B, "Common"),
+    (0x1F240, 0x1F248, "Common"),
+    (0x1F250, 0x1F251, "Common"),
+    (0x1F260, 0x1F265, "Common"),
+    (0x1F300, 0x1F6D7, "Common"),
+    (0x1F6DD, 0x1F6EC, "Common"),
+    (0x1F6F0, 0x1F6FC, "Common"),
+    (0x1F700, 0x1F773, "Common"),
+    (0x1F780, 0x1F7D8, "Common"),
+    (0x1F7E0, 0x1F7EB, "Common"),
+    (0x1F7F0, 0x1F7F0, "Common"),
+    (0x1F800, 0x1F80B, "Common"),
+    (0x1F810, 0x1F847, "Common"),
+    (0x1F850, 0x1F859, "Common"),
+    (0x1F860, 0x1F887, "Common"),
+    (0x1F890, 0x1F8AD, "Common"),
+    (0x1F8B0, 0x1F8B1, "Common"),
+    (0x1F900, 0x1FA53, "Common"),
+    (0x1FA60, 0x1FA6D, "Common"),
+    (0x1FA70, 0x1FA74, "Common"),
+    (0x1FA78, 0x1FA7C, "Common"),
+    (0x1FA80, 0x1FA86, "Common"),
+    (0x1FA90, 0x1FAAC, "Common"),
+    (0x1FAB0, 0x1FABA, "Common"),
+    (0x1FAC0, 0x1FAC5, "Common"),
+    (0x1FAD0, 0x1FAD9, "Common"),
+    (0x1FAE0, 0x1FAE7, "Common"),
+    (0x1FAF0, 0x1FAF6, "Common"),
+    (0x1FB00, 0x1FB92, "Common"),
+    (0x1FB94, 0x1FBCA, "Common"),
+    (0x1FBF0, 0x1FBF9, "Common"),
+    (0x20000, 0x2A6DF, "Han"),
+    (0x2A700, 0x2B738, "Han"),
+    (0x2B740, 0x2B81D, "Han"),
+    (0x2B820, 0x2CEA1, "Han"),
+    (0x2CEB0, 0x2EBE0, "Han"),
+    (0x2F800, 0x2FA1D, "Han"),
+    (0x30000, 0x3134A, "Han"),
+    (0xE0001, 0xE0001, "Common"),
+    (0xE0020, 0xE007F, "Common"),
+    (0xE0100, 0xE01EF, "Inherited"),
+]
+"""(first, last, script name) in code point order."""
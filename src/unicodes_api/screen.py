@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """test."""
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+import os
 import sys
+import time
+import signal
+import itertools
+import threading
+import functools
+import unicodedata
+from array import array
 import argparse
 import curses
 from curses.textpad import Textbox
 from abc import abstractmethod, ABC
 from unicodes_api.parser import ParserOpts
-from unicodes_api.parser import Formatter
+from unicodes_api.profiling import Profiler
+from unicodes_api.trace import TRACER
 
 # pylint: disable=pointless-string-statement
 # pylint: disable=invalid-name
@@ -19,6 +28,247 @@ from unicodes_api.parser import Formatter
 SEP = "    "
 """Default separator."""
 
+Row = Tuple[Tuple[str, int], ...]
+"""Screen row, runs of (text, curses attribute)."""
+CTRL_MAP = {i: f"^{chr(i + 64)}" for i in range(32)}
+CTRL_MAP[127] = "^?"
+"""Show control characters like curses does, so they can't move the cursor."""
+RowHits = Tuple[str, array]
+"""Row text and, for every screen cell, the offset of the character drawn in it."""
+
+
+@functools.lru_cache(maxsize=4096)
+def cell_width(ch: str) -> int:
+    """Number of terminal cells a character occupies (wcwidth)."""
+    cat = unicodedata.category(ch)
+    if cat in ("Mn", "Me") or (cat == "Cf" and ch != "\xad"):
+        return 0
+    if 0x1160 <= ord(ch) <= 0x11FF:
+        # hangul medial vowels / final consonants join the previous syllable
+        return 0
+    if unicodedata.east_asian_width(ch) in ("W", "F"):
+        return 2
+    return 1
+
+
+def text_width(text: str) -> int:
+    """Number of terminal cells text occupies."""
+    return sum(map(cell_width, text))
+
+
+class FrameRenderer:
+    """Render frames into a curses pad, only rewriting the rows that changed."""
+
+    def __init__(self, pad: Any):
+        """initialize FrameRenderer."""
+        self.pad = pad
+        """curses pad rendered into."""
+        self.previous = []  # type: List[Row]
+        """rows of the previous frame."""
+        self.hits = []  # type: List[RowHits]
+        """hit map, per screen row the text and cell -> character offsets."""
+
+    @staticmethod
+    def build_row(line: str, highlight_vals: Sequence[str]) -> Row:
+        """Split a line into runs of text sharing the same attribute."""
+        runs = []  # type: List[List[Any]]
+
+        def _add(text, attr):
+            if runs and runs[-1][1] == attr:
+                runs[-1][0] += text
+            else:
+                runs.append([text, attr])
+
+        highlight = {
+            val.translate(CTRL_MAP): "".join(
+                f" {ch.translate(CTRL_MAP)} " for ch in val
+            )
+            for val in highlight_vals
+        }
+        for word in line.translate(CTRL_MAP).split(" "):
+            if word and word in highlight:
+                _add(highlight[word], curses.A_STANDOUT)
+            else:
+                _add(word, curses.A_NORMAL)
+            _add(" ", curses.A_NORMAL)
+        return tuple((text, attr) for text, attr in runs)
+
+    @staticmethod
+    def wrap_row(row: Row, width: int) -> List[Row]:
+        """Wrap a row to the pad width the same way curses would.
+
+        Widths are in terminal cells, a wide character that doesn't fit in
+        the last column moves to the next row.
+        """
+        if width <= 0 or sum(text_width(text) for text, _ in row) <= width:
+            return [row]
+        rows = []
+        cur = []  # type: List[Tuple[str, int]]
+        used = 0
+        for text, attr in row:
+            chunk = []  # type: List[str]
+            for ch in text:
+                size = cell_width(ch)
+                if used + size > width:
+                    if chunk:
+                        cur.append(("".join(chunk), attr))
+                        chunk = []
+                    rows.append(tuple(cur))
+                    cur, used = [], 0
+                chunk.append(ch)
+                used += size
+            if chunk:
+                cur.append(("".join(chunk), attr))
+        if cur:
+            rows.append(tuple(cur))
+        return rows
+
+    @staticmethod
+    def row_hits(row: Row) -> RowHits:
+        """Map the cells of a row to character offsets.
+
+        Wide characters take two cells, combining marks none (they are drawn
+        in the cell of the character before them). An array of offsets
+        instead of per cell objects keeps rendering allocation free, which
+        matters with the big index alive (garbage collector passes).
+        """
+        text = "".join(chunk for chunk, _ in row)
+        cells = array("I")
+        for idx, ch in enumerate(text):
+            size = cell_width(ch)
+            if size:
+                cells.append(idx)
+            if size == 2:
+                cells.append(idx)
+        return text, cells
+
+    def hit(self, y: int, x: int) -> Dict[str, str]:
+        """Character / word / line drawn at screen position (y, x)."""
+        if not (0 <= y < len(self.hits) and 0 <= x < len(self.hits[y][1])):
+            return {"chr": "", "word": "", "line": ""}
+        text, cells = self.hits[y]
+        start = cells[x]
+        end = start + 1
+        while end < len(text) and not cell_width(text[end]):
+            end += 1
+        char = text[start:end]
+        if text[start].isspace():
+            # a lone combining mark is drawn on the space before it
+            word = char.strip()
+        else:
+            while start > 0 and not text[start - 1].isspace():
+                start -= 1
+            while end < len(text) and not text[end].isspace():
+                end += 1
+            word = text[start:end]
+        return {
+            "chr": char,
+            "word": word,
+            "line": text,
+        }
+
+    def _write_row(self, y: int, row: Row) -> int:
+        """Replace screen row y, returns number of curses write calls."""
+        calls = 2
+        try:
+            self.pad.move(y, 0)
+            self.pad.clrtoeol()
+        except curses.error:
+            return calls
+        for text, attr in row:
+            calls += 1
+            try:
+                self.pad.addstr(text, attr)
+            except curses.error:
+                # writing the last cell of the pad moves the cursor out of it
+                break
+        return calls
+
+    def reset(self):
+        """Forget the previous frame (i.e. after a resize), the next render redraws all."""
+        self.pad.erase()
+        self.previous = []
+        self.hits = []
+
+    def render(self, rows: List[Row]) -> int:
+        """Draw rows, touching only the changed ones, returns curses call count."""
+        calls = 0
+        prev = self.previous
+        del self.hits[len(rows) :]
+        for y, row in enumerate(rows):
+            if y < len(prev) and prev[y] == row:
+                continue
+            calls += self._write_row(y, row)
+            if y < len(self.hits):
+                self.hits[y] = self.row_hits(row)
+            else:
+                self.hits.append(self.row_hits(row))
+        for y in range(len(rows), len(prev)):
+            calls += self._write_row(y, ())
+        self.previous = rows
+        return calls
+
+
+class Viewport:
+    """Lazily produced screen rows, lines are only formatted up to the visible window."""
+
+    def __init__(self, lines: Iterable[str], highlight_vals: Sequence[str], width: int):
+        """initialize Viewport."""
+        self._lines = iter(lines)
+        """remaining (not yet formatted) text lines."""
+        self.highlight_vals = highlight_vals
+        """values to highlight."""
+        self.width = width
+        """wrap width."""
+        self.rows = []  # type: List[Row]
+        """rows formatted so far."""
+        self.exhausted = False
+        """all lines have been formatted."""
+        self._built = []  # type: List[Row]
+        """formatted but unwrapped lines, kept to relayout on resize."""
+        self._wrapped = 0
+        """number of _built lines wrapped into rows."""
+
+    def ensure(self, count: int):
+        """Format lines until there are at least count rows (or none are left)."""
+        while len(self.rows) < count:
+            if self._wrapped == len(self._built):
+                if self.exhausted:
+                    break
+                try:
+                    line = next(self._lines)
+                except StopIteration:
+                    self.exhausted = True
+                    break
+                self._built.append(FrameRenderer.build_row(line, self.highlight_vals))
+            self.rows.extend(
+                FrameRenderer.wrap_row(self._built[self._wrapped], self.width)
+            )
+            self._wrapped += 1
+        return self
+
+    def relayout(self, width: int):
+        """Rewrap to a new width, lines already formatted are not formatted again."""
+        self.width = width
+        self.rows = []
+        self._wrapped = 0
+        return self
+
+    def total(self) -> int:
+        """Total number of rows, formats everything that is left."""
+        return len(self.ensure(sys.maxsize).rows)
+
+    def clamp(self, pos: int, height: int) -> int:
+        """Clamp a scroll offset so the window stays inside the content."""
+        pos = max(pos, 0)
+        if pos > len(self.ensure(pos + height).rows) - height:
+            pos = max(len(self.rows) - height, 0)
+        return pos
+
+    def window(self, pos: int, height: int) -> List[Row]:
+        """Rows visible at scroll offset pos."""
+        return self.ensure(pos + height).rows[pos : pos + height]
+
 
 class NavItem:
     """Navigation item class."""
@@ -41,11 +291,12 @@ class NavItem:
         """int key code aliases."""
         self.hidden = False
         """set if menu is hidden."""
-
-    @property
-    def key_name(self):
-        """Key name."""
-        return curses.keyname(self.key).decode()
+        self.motion = None  # type: Any | Callable[[int], Any]
+        """motion function, a run of the same motion is merged into one call."""
+        self.step = 0  # type: Any
+        """movement per keypress, an int or a callable returning one."""
+        self.rebuild = True
+        """output has to be rebuilt after running, False if only the view moves."""
 
     def set_hidden(self):
         """Set menu item to hidden."""
@@ -62,6 +313,21 @@ class NavItem:
         self.callbacks.append(func)
         return self
 
+    def set_motion(self, func: Callable[[int], Any], step: Any):
+        """Make item a motion, repeated keypresses call func(sum of steps) once."""
+        self.motion = func
+        self.step = step
+        return self
+
+    def set_view_only(self):
+        """Item only moves the view, the output is redrawn but not rebuilt."""
+        self.rebuild = False
+        return self
+
+    def get_step(self) -> int:
+        """Movement of a single keypress."""
+        return self.step() if callable(self.step) else self.step
+
     def add_alias(self, alias: int):
         """Add key alias."""
         self.aliases.append(alias)
@@ -85,7 +351,7 @@ class NavGroup:
         """calling controller."""
         self.scroll_values = {
             curses.KEY_MOUSE: self.controller.mouseclick,
-            curses.KEY_RESIZE: lambda: self.controller.scroll(0),
+            curses.KEY_RESIZE: self.controller.request_resize,
             curses.KEY_HOME: lambda: self.controller.scroll(0),
             curses.KEY_END: lambda: self.controller.scroll(sys.maxsize),
             curses.KEY_PPAGE: lambda: self.controller.scroll(
@@ -98,11 +364,21 @@ class NavGroup:
             curses.KEY_DOWN: lambda: self.controller.scroll(1),
         }
         """scrolling / mouse related commands."""
+        self.scroll_steps = {
+            curses.KEY_PPAGE: lambda: -1 * self.controller.height,
+            curses.KEY_NPAGE: lambda: 1 * self.controller.height,
+            curses.KEY_UP: -1,
+            curses.KEY_DOWN: 1,
+        }
+        """scroll commands merged when repeated -> rows per keypress."""
         self.add_item(NavItem("q", "Quit").set_func(self.quit))
         for k, func in self.scroll_values.items():
-            self.add_item(
-                NavItem(k, f"hidden code {k}").set_hidden().set_func(func),
-            )
+            item = NavItem(k, f"hidden code {k}").set_hidden().set_func(func)
+            if k != curses.KEY_MOUSE:
+                item.set_view_only()
+            if k in self.scroll_steps:
+                item.set_motion(self.controller.scroll, self.scroll_steps[k])
+            self.add_item(item)
 
     @staticmethod
     def quit():
@@ -118,7 +394,7 @@ class NavGroup:
         """Get menu text."""
         val = f"\n{SEP}".join(
             [
-                f"({item.key_name})/{item.description}"
+                f"({self.controller.keyname(item.key)})/{item.description}"
                 for _, item in self.values.items()
                 if not item.hidden
             ]
@@ -141,14 +417,17 @@ class BidirectionalIterator(ABC):
 
     NAME = ""
     """subcommand name."""
-    PAD_MAX_HEIGHT = 30000
-    """initial setting of curses window size."""
+    LOADING_REFRESH_MS = 100
+    """getch timeout (progress redraw interval) while data is loading."""
+    FPS = 30.0
+    """default maximum redraws per second, see --fps."""
 
     def __init__(self):
         """Init class."""
         self.popts = ParserOpts(self.NAME, self.__class__)
         """Parser options."""
         self.setup_popts()
+        self.popts.add_fps(self.FPS)
         self.is_mouse = True
         """initial setting for enabling/disabling mouse interaction."""
         self.args = None  # type: Any | argparse.Namespace
@@ -161,8 +440,20 @@ class BidirectionalIterator(ABC):
         """terminal max width."""
         self.nav = NavGroup(self)
         """Navigation group."""
-        self.items = []
-        """output lines."""
+        self.viewport = Viewport([], [], 0)
+        """lazily formatted output rows."""
+        self.loaded = False
+        """load() finished, navigation is enabled."""
+        self._loader = None  # type: Any | threading.Thread
+        """background thread running load()."""
+        self._load_error = None  # type: Any | BaseException
+        """exception raised by load()."""
+        self._next_frame = 0.0
+        """earliest time (perf_counter) the next frame may be drawn."""
+        self._resize_pending = False
+        """terminal size changed, resize before the next frame."""
+        self.backend = curses  # type: Any
+        """curses module (newpad, keyname, getmouse, mousemask, resizeterm), see headless."""
 
     @abstractmethod
     def mouse_callback(self, value):
@@ -182,7 +473,7 @@ class BidirectionalIterator(ABC):
             self.is_mouse = False
         else:
             self.is_mouse = True
-        curses.mousemask(self.is_mouse)
+        self.backend.mousemask(self.is_mouse)
         self._dowrite()
 
     def setup(self):
@@ -195,13 +486,130 @@ class BidirectionalIterator(ABC):
         """supplemental messages."""
         self.kp = "\0"
         """initial key press value."""
-        self.nav.add_item(NavItem("n", "Next").set_func(self.next))
-        self.nav.add_item(NavItem("p", "Previous").set_func(self.prev))
+        self.nav.add_item(
+            NavItem("n", "Next").set_func(self.next).set_motion(self.move, 1)
+        )
+        self.nav.add_item(
+            NavItem("p", "Previous").set_func(self.prev).set_motion(self.move, -1)
+        )
 
     def getch(self):
         """Get next keypress."""
         return self.pad.getch()
 
+    def _drain(self) -> List[int]:
+        """Keypresses that are already pending, without blocking."""
+        keys = []
+        self.pad.nodelay(True)
+        try:
+            kp = self.getch()
+            while kp != -1:
+                keys.append(kp)
+                kp = self.getch()
+        finally:
+            self.pad.nodelay(False)
+        return keys
+
+    def _run_keys(self, keys: List[int]) -> bool:
+        """Run the nav items for keys, True if the output has to be rebuilt.
+
+        Consecutive keys bound to the same motion are merged into one net
+        movement, i.e. 37 queued n's become a single move(37).
+        """
+        rebuild = False
+        batch = []  # type: List[NavItem]
+
+        def _flush():
+            if not batch:
+                return
+            callbacks = []  # type: List[Callable]
+            for item in batch:
+                callbacks.extend(i for i in item.callbacks if i not in callbacks)
+            for cb in callbacks:
+                cb()
+            batch[0].motion(sum(item.get_step() for item in batch))
+            TRACER.count("screen.merged_keys", len(batch) - 1)
+            del batch[:]
+
+        for kp in keys:
+            if kp == -1:
+                # getch interrupted by a signal (SIGWINCH)
+                continue
+            item = self.nav.get_nav_item(kp)
+            if item and item.motion and batch and item.motion == batch[0].motion:
+                batch.append(item)
+                continue
+            _flush()
+            if not item:
+                self.txt.append(f"Invalid key / {self.keyname(kp)}")
+                rebuild = True
+                continue
+            rebuild = rebuild or item.rebuild
+            if item.motion:
+                batch.append(item)
+            else:
+                item.run()
+        _flush()
+        return rebuild
+
+    def keyname(self, key: int) -> str:
+        """Key name."""
+        return self.backend.keyname(key).decode()
+
+    def frame_interval(self) -> float:
+        """Minimum seconds between two frames."""
+        fps = getattr(self.args, "fps", self.FPS)
+        return 1.0 / fps if fps and fps > 0 else 0.0
+
+    def load(self):
+        """Build the data needed for navigation, runs in a background thread."""
+
+    def ready(self):
+        """Called from the ui loop once load() has finished."""
+
+    def idle(self):
+        """Called from the ui loop when no keypress is pending, keep it short."""
+
+    def progress_text(self) -> str:
+        """Progress message shown while loading."""
+        return "Loading..."
+
+    def _load(self):
+        """Thread target, keep the error for the ui loop."""
+        try:
+            self.load()
+        except Exception as _e:  # pylint: disable=broad-except
+            self._load_error = _e
+
+    def _start_loading(self):
+        """Start load() in a background thread, profiled with --profile."""
+        if self.loaded or self._loader:
+            return
+        self._loader = threading.Thread(
+            target=Profiler.thread_target(self._load), daemon=True
+        )
+        self._loader.start()
+
+    def _check_loaded(self) -> bool:
+        """Enable navigation once load() finished, True if it just did."""
+        if self.loaded or self._loader.is_alive():
+            return False
+        self._loader.join()
+        if self._load_error:
+            raise self._load_error
+        self.loaded = True
+        self.ready()
+        return True
+
+    def _iter_loading(self) -> Iterable[str]:
+        """Output lines while loading."""
+        return [
+            self.progress_text(),
+            "",
+            "Make Selection:",
+            f"{SEP}(q)/Quit",
+        ]
+
     @abstractmethod
     def next(self):
         """menu item next."""
@@ -210,6 +618,12 @@ class BidirectionalIterator(ABC):
     def prev(self):
         """menu item previous."""
 
+    def move(self, delta: int):
+        """Move delta entries, negative is backwards."""
+        func = self.next if delta > 0 else self.prev
+        for _ in range(abs(delta)):
+            func()
+
     @property
     def current_value(self):
         """return current value."""
@@ -229,6 +643,10 @@ class BidirectionalIterator(ABC):
         self.txt = []
         return lout
 
+    def _iter_menu(self) -> Iterable[str]:
+        """Output lines, override to produce long output lazily."""
+        return self._print_menu().split("\n")
+
     @staticmethod
     def get_input(prompt):
         """Get user input through the user interface and return it."""
@@ -245,101 +663,76 @@ class BidirectionalIterator(ABC):
             arr.pop()
         return " ".join(arr)
 
-    def _trywrite(self, *args):
-        """Attempt to write, and pass if failure occurs."""
-        try:
-            self.pad.addstr(*args)
-            return True
-        except curses.error:
-            return False
-
     def _dowrite(self):
         """perform a bunch of operations to ensure the curses screen renders properly."""
-        self.pad.clear()
-        txt = self._print_menu()
-        txt = Formatter.tab_shift(txt, 1)
-        self.items = txt.split("\n")
-        # insert a new line at top
-        self.items.insert(0, "")
-        arg_set = []
-        pad = " "
-        for _, line in enumerate(self.items):
-            spl = line.split(" ")
-            for v in spl:
-                if v in self.highlight_vals:
-                    for ch in v:
-                        arg_set.append([f"{pad}{ch}{pad}", curses.A_STANDOUT])
-                else:
-                    for ch in v:
-                        arg_set.append([ch])
-                arg_set.append([" "])
-            arg_set.append(["\n"])
-        for arg in arg_set:
-            self._trywrite(*arg)
+        with TRACER.span("screen.render"):
+            lines = self._iter_menu() if self.loaded else self._iter_loading()
+            # insert a new line at top, shift everything over by one
+            lines = itertools.chain([""], (f" {line}" for line in lines))
+            self.viewport = Viewport(lines, self.highlight_vals, self.width)
+            self._draw()
+
+    def _draw(self):
+        """Write the visible window of the viewport into the pad."""
+        self.pad_pos = self.viewport.clamp(self.pad_pos, self.height)
+        rows = self.viewport.window(self.pad_pos, self.height)
+        TRACER.count("screen.curses_calls", self.renderer.render(rows))
         self.pad_refresh()
 
     def pad_refresh(self):
         """Refresh screen."""
-        height, width = self.win.getmaxyx()
-        if (height, width) != (self.height, self.width):
-            self._run(self.win)
+        if self.win.getmaxyx() != (self.height, self.width):
+            self._resize_pending = True
         self.win.refresh()
-        self.pad.refresh(self.pad_pos, 0, 0, 0, self.height - 1, self.width)
-
-    @staticmethod
-    def _get_mouse_breakout(line: bytes, y):
-        """Get character / word / line from where the mouse is clicked."""
-        line = line.decode()
+        self.pad.refresh(0, 0, 0, 0, self.height - 1, self.width - 1)
+
+    def request_resize(self, *_):
+        """KEY_RESIZE / SIGWINCH, only flag it, the ui loop resizes once."""
+        self._resize_pending = True
+
+    def terminal_size(self) -> Tuple[int, int]:
+        """Current terminal (lines, columns)."""
+        size = self.win.getmaxyx()
+        if size != (self.height, self.width):
+            # curses already resized (KEY_RESIZE)
+            return size
         try:
-            char = line[y]
-        except IndexError:
-            return {
-                "chr": "",
-                "word": "",
-                "line": "",
-            }
-        words = {}
-        word = []
-        for idx, _ch in enumerate(line):
-            words[idx] = word
-            if not _ch.strip():
-                word = []
-            else:
-                word.append(_ch)
-        words = {
-            idx: "".join(i for i in arr if i.strip()) for idx, arr in words.items()
-        }
-        word = words[y].strip()
-        return {
-            "chr": char,
-            "word": word,
-            "line": line,
-        }
+            size = os.get_terminal_size(sys.__stdout__.fileno())
+        except (AttributeError, OSError, ValueError):
+            return self.win.getmaxyx()
+        return size.lines, size.columns
+
+    def resize(self):
+        """Resize the pad in place and relayout the cached output for the new size."""
+        self._resize_pending = False
+        height, width = self.terminal_size()
+        if self.win.getmaxyx() != (height, width):
+            self.backend.resizeterm(height, width)
+        if (height, width) == (self.height, self.width):
+            return
+        TRACER.count("screen.resizes")
+        self.height, self.width = height, width
+        self.pad.resize(height, width)
+        self.renderer.reset()
+        self.viewport.relayout(width)
 
     def mouseclick(self):
         """Scrolling the window when pressing up/down arrow keys"""
         if not self.is_mouse:
             return
         try:
-            _, y, x, _, _ = curses.getmouse()
+            _, x, y, _, _ = self.backend.getmouse()
         except curses.error:
             return
-
-        line = self.pad.instr(x, 0, self.width)
-        self.mouse_callback(self._get_mouse_breakout(line, y))
+        # the pad is drawn at the top left corner, screen and pad cells match
+        self.mouse_callback(self.renderer.hit(y, x))
         self.pad_refresh()
 
     def scroll(self, direction):
         """Scrolling the window when pressing up/down arrow keys"""
-        maxnum = len(self.items)
-        num = int(self.pad_pos)
-        num += direction
-        if num < 0:
-            num = 0
-        elif num > maxnum - self.height:
-            num = maxnum - self.height
-        self.pad_pos = num
-        self.pad_refresh()
+        if direction == sys.maxsize:
+            direction = self.viewport.total()
+        self.pad_pos = int(self.pad_pos) + direction
 
     def _run(self, win):
         """run program (for reals)."""
@@ -349,11 +742,13 @@ class BidirectionalIterator(ABC):
         self.win.scrollok(True)
         self.height, self.width = self.win.getmaxyx()
 
-        self.pad = curses.newpad(self.PAD_MAX_HEIGHT, self.width)
-        """pad value."""
+        self.pad = self.backend.newpad(self.height, self.width)
+        """pad value, only holds the visible window."""
 
         self.pad.keypad(True)
-        self.pad.scrollok(True)
+        self.pad.scrollok(False)
+        self.renderer = FrameRenderer(self.pad)
+        """diff based pad renderer."""
 
         #  border = ["║", "║", "═", "═", "╔", "╗", "╚", "╝"]
         # border = ["|", "|", "-", "-", "+", "+", "+", "+"]
@@ -365,20 +760,62 @@ class BidirectionalIterator(ABC):
         """initial pad position."""
         self.pad_refresh()
 
+        self._start_loading()
         self._dowrite()
 
+        previous = None
+        if threading.current_thread() is threading.main_thread():
+            previous = signal.signal(signal.SIGWINCH, self.request_resize)
+        try:
+            self._loop()
+        finally:
+            if previous is not None:
+                signal.signal(signal.SIGWINCH, previous)
+
+    def _loop(self):
+        """Ui loop, read keys and draw frames."""
         while True:
-            kp = self.getch()
-            item = self.nav.get_nav_item(kp)
-            if not item:
-                self.txt.append(f"Invalid key / {curses.keyname(kp).decode()}")
+            if not self.loaded:
+                self.pad.timeout(self.LOADING_REFRESH_MS)
+                kp = self.getch()
+                if self._check_loaded():
+                    self.pad.timeout(-1)
+                elif kp == ord("q"):
+                    self.nav.quit()
+                elif kp == curses.KEY_RESIZE:
+                    self.request_resize()
+                if self._resize_pending:
+                    self.resize()
                 self._dowrite()
-            else:
-                item.run()
+                continue
+            keys = self._drain()
+            if not keys:
+                self.idle()
+                keys = [self.getch()] + self._drain()
+            rebuild = self._run_keys(keys)
+            # keep merging input until the next frame is due
+            wait = self._next_frame - time.perf_counter()
+            while wait > 0:
+                self.pad.timeout(max(int(wait * 1000), 1))
+                kp = self.getch()
+                self.pad.timeout(-1)
+                if kp == -1:
+                    break
+                rebuild = self._run_keys([kp] + self._drain()) or rebuild
+                wait = self._next_frame - time.perf_counter()
+            if self._resize_pending:
+                self.resize()
+            if rebuild:
                 self._dowrite()
+            else:
+                self._draw()
+            TRACER.count("screen.frames")
+            self._next_frame = time.perf_counter() + self.frame_interval()
 
     def run(self):
         """Run cli command."""
+        # don't wait a whole second to tell escape apart from escape sequences
+        os.environ.setdefault("ESCDELAY", "25")
         try:
             curses.initscr()
             curses.start_color()
@@ -397,6 +834,11 @@ class BidirectionalNewIterator(BidirectionalIterator):
     def setup(self):
         """Setup class."""
         super().setup()
+        if self.loaded:
+            self.new()
+
+    def ready(self):
+        """Generate the first value once loaded."""
         self.new()
 
     @abstractmethod
@@ -434,6 +876,15 @@ class BidirectionalStaticStopIterator(BidirectionalIterator):
             return
         self.index += 1
 
+    def move(self, delta: int):
+        """Jump delta values, stopping at either end."""
+        target = self.index + delta
+        if target >= len(self.collection):
+            self.txt.append("No next entry")
+        elif target < 0:
+            self.txt.append("No previous entry")
+        self.index = max(min(target, len(self.collection) - 1), 0)
+
     def prev(self):
         """Scroll to previous value."""
         if self.index <= 0:
@@ -458,6 +909,11 @@ class BidirectionalStaticRevolvingIterator(BidirectionalIterator):
         else:
             self.index += 1
 
+    def move(self, delta: int):
+        """Jump delta values, wrapping around at either end."""
+        if self.collection:
+            self.index = (self.index + delta) % len(self.collection)
+
     def prev(self):
         """previous navigation."""
         if self.index == 0:
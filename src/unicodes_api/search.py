@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Incremental search over a sorted token list."""
+from typing import List, Sequence, Tuple
+import bisect
+
+# pylint: disable=invalid-name
+
+
+def is_subsequence(query: str, token: str) -> bool:
+    """True if all characters of query appear in token, in order."""
+    pos = 0
+    for ch in query:
+        pos = token.find(ch, pos) + 1
+        if not pos:
+            return False
+    return True
+
+
+class TokenSearch:
+    """Prefix / substring / fuzzy search that narrows as the query grows.
+
+    Prefix matches are found with bisect over the sorted token list,
+    substring and fuzzy (subsequence) matches by filtering candidates.
+    When the query is extended the candidates are the previous query's
+    matches, since anything matching the longer query matches the shorter.
+    """
+
+    def __init__(self, tokens: Sequence[str]):
+        """initialize TokenSearch, tokens must be sorted."""
+        self.tokens = tokens
+        """sorted tokens."""
+        self._stack = []  # type: List[Tuple[str, List[int]]]
+        """(query, all matching indexes) for each keystroke of the current query."""
+
+    def prefix_range(self, query: str) -> range:
+        """Indexes of tokens starting with query."""
+        lo = bisect.bisect_left(self.tokens, query)
+        hi = bisect.bisect_left(self.tokens, query + chr(0x10FFFF), lo)
+        return range(lo, hi)
+
+    def _candidates(self, query: str) -> Sequence[int]:
+        """Indexes that could still match query."""
+        while self._stack and not query.startswith(self._stack[-1][0]):
+            self._stack.pop()
+        if self._stack:
+            return self._stack[-1][1]
+        return range(len(self.tokens))
+
+    def search(self, query: str) -> List[int]:
+        """Matching token indexes, prefix matches first then substring then fuzzy."""
+        query = query.lower()
+        if not query:
+            self._stack = []
+            return []
+        if self._stack and self._stack[-1][0] == query:
+            matches = self._stack[-1][1]
+        else:
+            tokens = self.tokens
+            matches = [
+                i for i in self._candidates(query) if is_subsequence(query, tokens[i])
+            ]
+            self._stack.append((query, matches))
+        prefix = self.prefix_range(query)
+        substr = [i for i in matches if i not in prefix and query in self.tokens[i]]
+        seen = set(substr)
+        seen.update(prefix)
+        fuzzy = [i for i in matches if i not in seen]
+        return list(prefix) + substr + fuzzy
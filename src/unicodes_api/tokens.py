@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Interned name tokens.
+
+About 550k name tokens of the ~140k records come from a vocabulary of
+~120k distinct words (mostly the hex part of the CJK ideograph names). Every
+distinct token is stored once in :data:`VOCAB` and records refer to it by
+integer id. The ids of all records of an index are concatenated into a
+single ``array("I")`` (:class:`TokenArrays`), token strings are only looked
+up when a caller asks for them::
+
+    from unicodes_api.tokens import TokenArrays
+
+    arr = TokenArrays()
+    rid = arr.append(["latin", "small", "letter", "a"])
+    arr.row(rid)        # memoryview of 4 token ids
+    arr.strings(rid)    # ['latin', 'small', 'letter', 'a']
+"""
+from typing import Dict, Iterable, List
+from array import array
+
+# pylint: disable=invalid-name
+
+
+def tokenize(name: str) -> List[str]:
+    """Lower case tokens of a character name, "-" separates tokens too."""
+    return [i.lower() for i in " ".join(name.split("-")).split()]
+
+
+class Vocabulary:
+    """Token string <-> integer id."""
+
+    def __init__(self):
+        """initialize Vocabulary."""
+        self.tokens = []  # type: List[str]
+        """id -> token."""
+        self.ids = {}  # type: Dict[str, int]
+        """token -> id."""
+
+    def __len__(self):
+        """Number of distinct tokens."""
+        return len(self.tokens)
+
+    def intern(self, token: str) -> int:
+        """Id of a token, added to the vocabulary if it's new."""
+        try:
+            return self.ids[token]
+        except KeyError:
+            tid = self.ids[token] = len(self.tokens)
+            self.tokens.append(token)
+            return tid
+
+    def encode(self, tokens: Iterable[str]) -> array:
+        """Ids (array("I")) of tokens."""
+        return array("I", map(self.intern, tokens))
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """Token strings of ids."""
+        tokens = self.tokens
+        return [tokens[i] for i in ids]
+
+
+VOCAB = Vocabulary()
+"""Process wide vocabulary, shared by the indexes of all Unicode versions."""
+
+
+class TokenArrays:
+    """Token ids of many records, record rid has ids[offsets[rid]:offsets[rid + 1]]."""
+
+    def __init__(self, vocab: Vocabulary = VOCAB):
+        """initialize TokenArrays."""
+        self.vocab = vocab
+        """vocabulary of the ids."""
+        self.ids = array("I")
+        """token ids of all records, concatenated."""
+        self.offsets = array("I", [0])
+        """start of every record in ids, plus the end of the last one."""
+
+    def __len__(self):
+        """Number of records."""
+        return len(self.offsets) - 1
+
+    def append(self, tokens: Iterable[str]) -> int:
+        """Add the tokens of the next record, returns its record id."""
+        self.ids.extend(map(self.vocab.intern, tokens))
+        self.offsets.append(len(self.ids))
+        return len(self.offsets) - 2
+
+    def clear(self):
+        """Drop all records."""
+        del self.ids[:]
+        del self.offsets[1:]
+
+    def row(self, rid: int) -> memoryview:
+        """Token ids of a record, without copying."""
+        return memoryview(self.ids)[self.offsets[rid] : self.offsets[rid + 1]]
+
+    def strings(self, rid: int) -> List[str]:
+        """Token strings of a record."""
+        return self.vocab.decode(self.ids[self.offsets[rid] : self.offsets[rid + 1]])
+
+    def nbytes(self) -> int:
+        """Size of the id and offset arrays."""
+        return (
+            self.ids.buffer_info()[1] * self.ids.itemsize
+            + self.offsets.buffer_info()[1] * self.offsets.itemsize
+        )
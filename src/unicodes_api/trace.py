@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Lightweight instrumentation (spans, counters and histograms).
+
+Disabled by default, in which case every hook is a no-op. Enable it with
+the ``UNICODES_TRACE`` environment variable or the ``--trace`` cli flag::
+
+    UNICODES_TRACE=1 unicodes pairs all               # report to stderr
+    UNICODES_TRACE=/tmp/trace.json unicodes explore   # report to json file
+    unicodes --trace /tmp/trace.json pairs all
+
+Callers can register their own sink, a callable receiving the report dict::
+
+    TRACER.add_sink(lambda report: print(report["spans"]))
+"""
+from typing import Any, Callable, Dict, List
+import atexit
+import json
+import os
+import sys
+import time
+
+# pylint: disable=invalid-name
+
+ENV_VAR = "UNICODES_TRACE"
+"""Environment variable used to enable tracing."""
+DISABLED_VALUES = ("", "0", "false", "no")
+"""ENV_VAR values (case insensitive) leaving tracing disabled."""
+
+
+class _NullSpan:
+    """Span returned when tracing is disabled."""
+
+    def __enter__(self):
+        """No-op span."""
+        return self
+
+    def __exit__(self, *_):
+        """Nothing to record."""
+        return False
+
+
+NULL_SPAN = _NullSpan()
+"""Shared no-op span."""
+
+
+class _Span:
+    """Timed span."""
+
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: Any, name: str):
+        """initialize span."""
+        self.tracer = tracer
+        """owning Tracer."""
+        self.name = name
+        """span name."""
+        self.start = 0.0
+        """start time."""
+
+    def __enter__(self):
+        """Start timing."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        """Record the span duration."""
+        elapsed = time.perf_counter() - self.start
+        self.tracer.spans.setdefault(self.name, []).append(elapsed)
+        return False
+
+
+class Tracer:
+    """Collect spans, counters and histograms and report them to sinks."""
+
+    def __init__(self):
+        """initialize Tracer."""
+        self.enabled = False
+        """when False every hook is a no-op."""
+        self.spans = {}  # type: Dict[str, List[float]]
+        """span name -> durations in seconds."""
+        self.counters = {}  # type: Dict[str, int]
+        """counter name -> value."""
+        self.histograms = {}  # type: Dict[str, List[float]]
+        """histogram name -> observed values."""
+        self.sinks = []  # type: List[Callable[[Dict], Any]]
+        """report callbacks."""
+        self._registered = False
+        """atexit hook registered."""
+        self._dest_sink = None  # type: Any | Callable[[Dict], Any]
+        """sink of the last enable dest, replaced by the next one."""
+
+    def enable(self, dest: str = None):
+        """Enable tracing, dest is "-" / "stderr" / "1" or a json file path.
+
+        A new dest replaces the previous one (i.e. --trace overrides
+        UNICODES_TRACE), sinks added with add_sink are kept.
+        """
+        self.enabled = True
+        if dest:
+            if self._dest_sink in self.sinks:
+                self.sinks.remove(self._dest_sink)
+            if dest in ("1", "-", "stderr", "true"):
+                self._dest_sink = stderr_sink
+            else:
+                self._dest_sink = json_sink(dest)
+            self.add_sink(self._dest_sink)
+        if not self._registered:
+            atexit.register(self.report)
+            self._registered = True
+        return self
+
+    def add_sink(self, func: Callable[[Dict], Any]):
+        """Register a report sink."""
+        self.sinks.append(func)
+        return self
+
+    def span(self, name: str):
+        """Time a block of code as a named span."""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def count(self, name: str, value: int = 1):
+        """Increment a counter."""
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float):
+        """Record a value in a histogram."""
+        if not self.enabled:
+            return
+        self.histograms.setdefault(name, []).append(value)
+
+    @staticmethod
+    def _summary(values: List[float]):
+        """Summarize a list of values."""
+        vals = sorted(values)
+        return {
+            "count": len(vals),
+            "total": sum(vals),
+            "min": vals[0],
+            "p50": vals[len(vals) // 2],
+            "p95": vals[min(len(vals) - 1, int(len(vals) * 0.95))],
+            "max": vals[-1],
+        }
+
+    def get_report(self) -> Dict:
+        """Return the collected data summarized."""
+        return {
+            "spans": {k: self._summary(v) for k, v in sorted(self.spans.items())},
+            "counters": dict(sorted(self.counters.items())),
+            "histograms": {
+                k: self._summary(v) for k, v in sorted(self.histograms.items())
+            },
+        }
+
+    def report(self):
+        """Send the report to all sinks."""
+        if not self.enabled:
+            return
+        report = self.get_report()
+        for sink in self.sinks:
+            sink(report)
+
+    def reset(self):
+        """Drop the collected data."""
+        self.spans.clear()
+        self.counters.clear()
+        self.histograms.clear()
+
+
+def stderr_sink(report: Dict):
+    """Write a human readable report to stderr."""
+    lines = ["trace report:"]
+    for kind in ("spans", "histograms"):
+        for name, summ in report[kind].items():
+            lines.append(
+                f"  {kind[:-1]:9} {name:30} n={summ['count']} "
+                f"total={summ['total']:.6f} p50={summ['p50']:.6f} "
+                f"p95={summ['p95']:.6f} max={summ['max']:.6f}"
+            )
+    for name, val in report["counters"].items():
+        lines.append(f"  {'counter':9} {name:30} {val}")
+    sys.stderr.write("\n".join(lines) + "\n")
+
+
+def json_sink(path: str) -> Callable[[Dict], Any]:
+    """Return a sink that writes the report to a json file."""
+
+    def _write(report: Dict):
+        with open(path, "w") as fileh:
+            json.dump(report, fileh, indent=4)
+
+    return _write
+
+
+TRACER = Tracer()
+"""Process wide tracer."""
+
+if os.environ.get(ENV_VAR, "").strip().lower() not in DISABLED_VALUES:
+    TRACER.enable(os.environ[ENV_VAR])
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unicode Character Database files as an alternative to unicodedata.
+
+``unicodedata`` is tied to the running interpreter, so different Python
+versions see different Unicode versions. A local copy of the UCD
+(``UnicodeData.txt``, ``NameAliases.txt`` and ``Blocks.txt``, optionally
+``Scripts.txt`` and ``EastAsianWidth.txt`` from
+https://www.unicode.org/Public/<version>/ucd/, never downloaded here) makes
+the index independent of the interpreter::
+
+    from unicodes_api import Groups
+    from unicodes_api.ucd import load
+
+    Groups.use_ucd(load("13.0.0", "/srv/ucd"))
+
+or from the cli::
+
+    unicodes --ucd-dir /srv/ucd --ucd-version 13.0.0 all -f box
+
+A UCD directory either holds the files directly or per version
+subdirectories (``<dir>/<version>/ucd/`` as published, or ``<dir>/<version>/``).
+Files are mapped with mmap and parsed in a single pass.
+"""
+from typing import Any, Dict, Iterator, List, Tuple
+from pathlib import Path
+import bisect
+import mmap
+import os
+import re
+import unicodedata
+from unicodes_api.trace import TRACER
+
+# pylint: disable=invalid-name
+
+ENV_DIR = "UNICODES_UCD_DIR"
+"""Environment variable with the default UCD directory."""
+
+UNICODEDATA_RE = re.compile(
+    rb"^([0-9A-Fa-f]{4,6});([^;\r\n]*);([^;\r\n]*);([^;\r\n]*);([^;\r\n]*);([^;\r\n]*);",
+    re.M,
+)
+"""UnicodeData.txt code point, name, category, combining, bidi and decomposition fields."""
+ALIAS_RE = re.compile(rb"^([0-9A-Fa-f]{4,6});([^;\r\n]*);", re.M)
+"""NameAliases.txt code point and alias fields."""
+RANGE_RE = re.compile(
+    rb"^([0-9A-Fa-f]{4,6})(?:\.\.([0-9A-Fa-f]{4,6}))?\s*;\s*([^\r\n#]*?)\s*(?:#|$)",
+    re.M,
+)
+"""Range files (Blocks.txt, Scripts.txt etc.) first, optional last code point and value."""
+VERSION_RE = re.compile(rb"^#\s*\w+-(\d+\.\d+\.\d+)\.txt", re.M)
+"""Version in a UCD file header, i.e. ``# Blocks-14.0.0.txt``."""
+
+RANGE_NAMES = {
+    "CJK Ideograph": "CJK UNIFIED IDEOGRAPH-",
+    "Tangut Ideograph": "TANGUT IDEOGRAPH-",
+    "Khitan Small Script": "KHITAN SMALL SCRIPT CHARACTER-",
+    "Nushu Character": "NUSHU CHARACTER-",
+}
+"""``<label, First>`` range label prefix -> derived name prefix (name + hex code point)."""
+
+JAMO_L = [
+    "G", "GG", "N", "D", "DD", "R", "M", "B", "BB", "S", "SS", "", "J", "JJ", "C",
+    "K", "T", "P", "H",
+]  # fmt: skip
+"""Hangul leading consonant short names."""
+JAMO_V = [
+    "A", "AE", "YA", "YAE", "EO", "E", "YEO", "YE", "O", "WA", "WAE", "OE", "YO",
+    "U", "WEO", "WE", "WI", "YU", "EU", "YI", "I",
+]  # fmt: skip
+"""Hangul vowel short names."""
+JAMO_T = [
+    "", "G", "GG", "GS", "N", "NJ", "NH", "D", "L", "LG", "LM", "LB", "LS", "LT",
+    "LP", "LH", "M", "B", "BS", "S", "SS", "NG", "J", "C", "K", "T", "P", "H",
+]  # fmt: skip
+"""Hangul trailing consonant short names."""
+
+
+def _read(path: Path) -> Any:
+    """Memory map a file, None if it doesn't exist or is empty."""
+    if not path.exists() or not path.stat().st_size:
+        return None
+    with path.open("rb") as fobj:
+        return mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def parse_ranges(data: Any) -> List[Tuple[int, int, str]]:
+    """(first, last, value) of a range file, adjacent ranges with the same value merged."""
+    ranges = []  # type: List[Tuple[int, int, str]]
+    for match in RANGE_RE.finditer(data):
+        first = int(match.group(1), 16)
+        last = int(match.group(2), 16) if match.group(2) else first
+        value = match.group(3).decode("ascii")
+        ranges.append((first, last, value))
+    ranges.sort()
+    merged = ranges[:1]
+    for first, last, value in ranges[1:]:
+        pfirst, plast, pvalue = merged[-1]
+        if value == pvalue and first == plast + 1:
+            merged[-1] = (pfirst, last, value)
+        else:
+            merged.append((first, last, value))
+    return merged
+
+
+def read_ranges(path: Path) -> List[Tuple[int, int, str]]:
+    """parse_ranges of a file, empty if it doesn't exist."""
+    data = _read(path)
+    if data is None:
+        return []
+    with data:
+        return parse_ranges(data)
+
+
+def hangul_name(cp: int) -> str:
+    """Algorithmic Hangul syllable name."""
+    idx = cp - 0xAC00
+    lidx, rest = divmod(idx, 21 * 28)
+    vidx, tidx = divmod(rest, 28)
+    return f"HANGUL SYLLABLE {JAMO_L[lidx]}{JAMO_V[vidx]}{JAMO_T[tidx]}"
+
+
+class UCD:
+    """Character names, properties, aliases and blocks parsed from local UCD files."""
+
+    LOADED = {}  # type: Dict[str, UCD]
+    """Parsed databases by version, see load."""
+
+    def __init__(self, path: Any, version: str = None):
+        """initialize UCD, parses the UCD files in path."""
+        self.path = Path(path)
+        """directory holding the UCD files."""
+        self.names = {}  # type: Dict[int, str]
+        """code point -> name of individually listed code points, "" for <control>."""
+        self.codepoints = []  # type: List[int]
+        """sorted keys of names, bisected by iter_names."""
+        self.fields = {}  # type: Dict[int, Tuple[str, str, str, str]]
+        """code point (or first of a range) -> (category, combining, bidi, decomposition)."""
+        self.ranges = []  # type: List[Tuple[int, int, str]]
+        """(first, last, label) of ``<label, First>`` / ``<label, Last>`` ranges."""
+        self.aliases = {}  # type: Dict[int, List[str]]
+        """code point -> formal name aliases."""
+        self.blocks = []  # type: List[Tuple[int, int, str]]
+        """(first, last, block name) in code point order."""
+        self.scripts = []  # type: List[Tuple[int, int, str]]
+        """(first, last, script name) in code point order, empty without Scripts.txt."""
+        self.widths = []  # type: List[Tuple[int, int, str]]
+        """(first, last, east asian width), empty without EastAsianWidth.txt."""
+        detected = ""
+        with TRACER.span("ucd.parse"):
+            data = _read(self.path.joinpath("UnicodeData.txt"))
+            if data is None:
+                raise FileNotFoundError(f"No UnicodeData.txt in {self.path}")
+            with data:
+                self._parse_unicodedata(data)
+            for fname, parse in [
+                ("NameAliases.txt", self._parse_aliases),
+                ("Blocks.txt", self._parse_blocks),
+                ("Scripts.txt", self._parse_scripts),
+                ("EastAsianWidth.txt", self._parse_widths),
+            ]:
+                data = _read(self.path.joinpath(fname))
+                if data is None:
+                    continue
+                with data:
+                    match = VERSION_RE.search(data, 0, 4096)
+                    if match:
+                        detected = match.group(1).decode()
+                    parse(data)
+        self.version = version or detected or self._dir_version()
+        """Unicode version, i.e. 14.0.0."""
+        if not self.version:
+            raise ValueError(f"Can't determine the Unicode version of {self.path}")
+        TRACER.count("ucd.names", len(self.names))
+
+    def _dir_version(self) -> str:
+        """Version from a <version>/ucd or <version> directory name."""
+        for part in (self.path.name, self.path.parent.name):
+            if re.match(r"^\d+\.\d+\.\d+$", part):
+                return part
+        return ""
+
+    def _parse_unicodedata(self, data: Any):
+        """Names, properties and ranges."""
+        names = self.names
+        fields = self.fields
+        first = 0
+        for match in UNICODEDATA_RE.finditer(data):
+            cp = int(match.group(1), 16)
+            name = match.group(2).decode("ascii")
+            if name.endswith(", Last>"):
+                self.ranges.append((first, cp, name[1:-7]))
+                continue
+            fields[cp] = tuple(i.decode("ascii") for i in match.group(3, 4, 5, 6))
+            if not name.startswith("<"):
+                names[cp] = name
+            elif name.endswith(", First>"):
+                first = cp
+            else:
+                # <control>, unicodedata doesn't name these either
+                names[cp] = ""
+        self.codepoints = sorted(names)
+
+    def _parse_aliases(self, data: Any):
+        """Formal name aliases."""
+        for match in ALIAS_RE.finditer(data):
+            self.aliases.setdefault(int(match.group(1), 16), []).append(
+                match.group(2).decode("ascii")
+            )
+
+    def _parse_blocks(self, data: Any):
+        """Block ranges."""
+        self.blocks = parse_ranges(data)
+
+    def _parse_scripts(self, data: Any):
+        """Script ranges."""
+        self.scripts = parse_ranges(data)
+
+    def _parse_widths(self, data: Any):
+        """East asian width ranges."""
+        self.widths = parse_ranges(data)
+
+    def properties(self, cp: int) -> Tuple[str, str, str, str]:
+        """(category, combining, bidi, decomposition) of a code point, like unicodedata."""
+        try:
+            return self.fields[cp]
+        except KeyError:
+            pass
+        idx = bisect.bisect_right(self.ranges, (cp, 0x110000)) - 1
+        if idx >= 0 and self.ranges[idx][0] <= cp <= self.ranges[idx][1]:
+            return self.fields[self.ranges[idx][0]]
+        return ("Cn", "0", "", "")
+
+    @staticmethod
+    def _range_names(first: int, last: int, label: str) -> Iterator[Tuple[int, str]]:
+        """Derived names of a range, unnamed ranges (private use etc.) yield nothing."""
+        if label.startswith("Hangul Syllable"):
+            for cp in range(first, last + 1):
+                yield cp, hangul_name(cp)
+            return
+        for prefix, name in RANGE_NAMES.items():
+            if label.startswith(prefix):
+                for cp in range(first, last + 1):
+                    yield cp, f"{name}{cp:04X}"
+                return
+
+    def iter_names(
+        self, start: int = 0, end: int = 0x10FFFF
+    ) -> Iterator[Tuple[int, str]]:
+        """yield (code point, name) of start to end in code point order, "" for unnamed controls."""
+        ranges = (
+            (max(first, start), min(last, end), label)
+            for first, last, label in self.ranges
+            if first <= end and last >= start
+        )
+        nxt = next(ranges, None)
+        names = self.names
+        codepoints = self.codepoints
+        for idx in range(bisect.bisect_left(codepoints, start), len(codepoints)):
+            cp = codepoints[idx]
+            if cp > end:
+                break
+            while nxt and nxt[0] < cp:
+                yield from self._range_names(*nxt)
+                nxt = next(ranges, None)
+            yield cp, names[cp]
+        while nxt:
+            yield from self._range_names(*nxt)
+            nxt = next(ranges, None)
+
+
+def load(version: str = None, path: Any = None) -> Any:
+    """UCD for version (parsed once per version), None selects unicodedata.
+
+    path defaults to the UNICODES_UCD_DIR environment variable. Without
+    files, the interpreter's own Unicode version falls back to unicodedata.
+    """
+    if version is None and path is None:
+        return None
+    if version in UCD.LOADED:
+        return UCD.LOADED[version]
+    path = path or os.environ.get(ENV_DIR)
+    candidates = []  # type: List[Path]
+    if path:
+        base = Path(path).expanduser()
+        if version:
+            candidates += [base.joinpath(version, "ucd"), base.joinpath(version)]
+        candidates.append(base)
+    for cand in candidates:
+        if not cand.joinpath("UnicodeData.txt").exists():
+            continue
+        ucd = UCD(cand)
+        if version in (None, ucd.version):
+            UCD.LOADED[ucd.version] = ucd
+            return ucd
+    if version == unicodedata.unidata_version:
+        return None
+    where = path or f"a directory (--ucd-dir or {ENV_DIR})"
+    raise FileNotFoundError(f"No Unicode {version} UCD files found in {where}")